@@ -18,7 +18,9 @@ from .const import (
     DEFAULT_MODEL,
 )
 from .coordinator import SdmCoordinator
-from .models.sdm120 import get_register_specs
+from .models import get_model_table
+from .startup import StartupOrchestrator, async_get_orchestrator
+from .warm_start import WarmStartStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,22 +37,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Backfill model for legacy entries created before model field existed
     await _ensure_model_default(hass, entry)
 
-    coordinator = SdmCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
-    await coordinator.async_ensure_serial_number()
+    orchestrator = async_get_orchestrator(hass)
+    try:
+        coordinator = SdmCoordinator(hass, entry)
+    except BaseException:
+        orchestrator.async_entry_done(entry.entry_id)
+        raise
+    try:
+        await _async_setup_coordinator(hass, entry, coordinator, orchestrator)
+    except BaseException:
+        # Home Assistant does not unload an entry whose setup failed: hand back
+        # the shared gateway client and schedule before a retry takes new ones.
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        await coordinator.async_close()
+        raise
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    return True
+
+
+async def _async_setup_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: SdmCoordinator, orchestrator: StartupOrchestrator
+) -> None:
+    """Read or restore the meter's first values, then bring up its platforms."""
+    try:
+        warm = await coordinator.async_warm_start()
+        if not warm:
+            async with orchestrator.async_initial_read(coordinator.host, coordinator.port):
+                await coordinator.async_config_entry_first_refresh()
+                await coordinator.async_ensure_serial_number()
+    finally:
+        orchestrator.async_entry_done(entry.entry_id)
     await _maybe_migrate_to_serial_identity(hass, entry, coordinator)
+    await coordinator.async_load_exclusions()
     hass.data[DOMAIN][entry.entry_id] = {"coordinator": coordinator}
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     await _sync_entity_registry_enabled_state(hass, entry)
-    entry.async_on_unload(entry.add_update_listener(async_update_options))
-    return True
+    entry.async_on_unload(coordinator.async_track_enabled_entities())
+    coordinator.async_start_sampling()
+    if warm:
+        # Entities are up with the persisted values; confirm them and the meter's serial off the setup path.
+        entry.async_create_background_task(
+            hass, coordinator.async_confirm_warm_start(), f"{coordinator.name} first refresh"
+        )
 
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update by syncing registry defaults then reloading."""
+    """Apply an options update in place, reloading only for connection or model changes."""
+    coordinator: SdmCoordinator | None = hass.data[DOMAIN].get(entry.entry_id, {}).get("coordinator")
+    if coordinator is None or coordinator.needs_reload():
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    coordinator.async_apply_options()
+    # Category toggles: disabled entities are removed right away; Home Assistant
+    # itself reloads the entry to add entities that get enabled.
     await _sync_entity_registry_enabled_state(hass, entry)
-    await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def _sync_entity_registry_enabled_state(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -66,11 +107,17 @@ async def _sync_entity_registry_enabled_state(hass: HomeAssistant, entry: Config
         "config": data.get(CONF_ENABLE_CONFIG, False),
     }
 
-    specs = get_register_specs()
+    coordinator: SdmCoordinator | None = hass.data[DOMAIN].get(entry.entry_id, {}).get("coordinator")
+    if coordinator is None:
+        return
+    specs = get_model_table(data.get(CONF_MODEL, DEFAULT_MODEL)).by_key
+    prefix = coordinator.build_unique_id("")
     entries = er.async_entries_for_config_entry(registry, entry.entry_id)
 
     for reg_entry in entries:
-        spec = next((s for s in specs if reg_entry.unique_id.endswith(f"_{s.key}")), None)
+        if not reg_entry.unique_id.startswith(prefix):
+            continue
+        spec = specs.get(reg_entry.unique_id[len(prefix):])
         if not spec:
             continue
 
@@ -130,6 +177,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the warm start data of a removed entry."""
+    await WarmStartStore(hass, entry.entry_id).async_remove()
+
+
 async def _ensure_model_default(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Inject default model into entry data/options if missing (legacy support)."""
     has_data_model = CONF_MODEL in entry.data
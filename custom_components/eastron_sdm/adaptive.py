@@ -0,0 +1,90 @@
+"""Adaptive per-register polling cadence learned from observed value changes."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .models.base import DEFAULT_DEADBANDS, Deadband, RegisterSpec
+
+CHANGE_DEADBAND_SHARE = 0.5  # a move of half the publish deadband already counts as a change
+CHANGE_RATE_ALPHA = 0.25  # EWMA weight of the latest observation
+SLOWDOWN_FACTOR = 1.5     # cadence growth after an unchanged read
+SPEEDUP_FACTOR = 0.5      # cadence shrink after a changed read
+
+
+@dataclass(slots=True)
+class RegisterChangeStats:
+    reads: int = 0
+    changes: int = 0
+    change_rate: float = 1.0  # EWMA of the share of reads that saw a change
+    cadence: float = 0.0      # current effective max-age in seconds
+    last_value: float | int | None = None
+
+
+class AdaptiveCadence:
+    """Move stable registers to slower cadences and volatile ones to faster cadences.
+
+    Each read of a register is compared with the previous one. An unchanged
+    value stretches the register's cadence, a changed value shrinks it, always
+    within ``[min_interval, max_interval]``. What counts as a change is given
+    per register by ``change_threshold``.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.stats: dict[str, RegisterChangeStats] = {}
+
+    def observe(
+        self, key: str, value: float | int | None, base_interval: float, threshold: Deadband = Deadband()
+    ) -> float:
+        """Record a decoded value and return the register's updated cadence."""
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = RegisterChangeStats(cadence=self._clamp(base_interval), last_value=value)
+            stats.reads = 1
+            return stats.cadence
+        if not stats.reads:  # restored cadence, first read since the restart
+            stats.reads = 1
+            stats.last_value = value
+            return stats.cadence
+        changed = _changed(stats.last_value, value, threshold)
+        stats.reads += 1
+        stats.last_value = value
+        stats.change_rate += CHANGE_RATE_ALPHA * (float(changed) - stats.change_rate)
+        if changed:
+            stats.changes += 1
+            stats.cadence = self._clamp(stats.cadence * SPEEDUP_FACTOR)
+        else:
+            stats.cadence = self._clamp(stats.cadence * SLOWDOWN_FACTOR)
+        return stats.cadence
+
+    def restore(self, cadences: dict[str, float]) -> None:
+        """Resume from persisted cadences; the next read of a key only sets its comparison value."""
+        for key, cadence in cadences.items():
+            self.stats[key] = RegisterChangeStats(cadence=self._clamp(float(cadence)))
+
+    def cadences(self) -> dict[str, float]:
+        return {key: stats.cadence for key, stats in self.stats.items()}
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+
+@lru_cache(maxsize=None)
+def change_threshold(spec: RegisterSpec) -> Deadband:
+    """Smallest move of ``spec`` that counts as a change.
+
+    Half the register's publish deadband, in absolute units for most device
+    classes; counters (total_increasing) change with every increment.
+    """
+    if spec.state_class == "total_increasing":
+        return Deadband()
+    deadband = spec.deadband or DEFAULT_DEADBANDS.get(spec.device_class or "", Deadband())
+    return Deadband(deadband.absolute * CHANGE_DEADBAND_SHARE, deadband.relative * CHANGE_DEADBAND_SHARE)
+
+
+def _changed(old: float | int | None, new: float | int | None, threshold: Deadband) -> bool:
+    if old is None or new is None:
+        return old is not new
+    return abs(new - old) > max(threshold.absolute, threshold.relative * abs(old))
@@ -1,34 +1,470 @@
-"""Async Modbus RTU-over-TCP client wrapper."""
+"""Async Modbus RTU-over-TCP and Modbus TCP client wrapper."""
 from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import suppress
-from dataclasses import dataclass
+import random
+import struct
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager, suppress
 
 from pymodbus.client import AsyncModbusTcpClient
-from pymodbus.exceptions import ModbusIOException
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+from .const import (
+    CIRCUIT_OPEN_AFTER_FAILURES,
+    FAST_RETRIES,
+    FRAMER_RTU_OVER_TCP,
+    FRAMER_TCP,
+    MIN_REQUEST_TIMEOUT,
+    MODBUS_MAX_READ_REGISTERS,
+    READ_LIMIT_TTL,
+    RECONNECT_BACKOFF_MAX,
+    RECONNECT_BACKOFF_MIN,
+    RTT_REFERENCE_REGISTERS,
+)
+from .transport import MbapTransport, ModbusExceptionCode, RtuOverTcpTransport
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass(slots=True)
+ILLEGAL_DATA_ADDRESS = 0x02
+ILLEGAL_DATA_VALUE = 0x03  # how meters and gateways reject a read that is too long
+_FUNCTION_CODES = {"read_input_registers": 0x04, "read_holding_registers": 0x03}
+
 class ReadResult:
-    address: int
-    count: int
-    registers: list[int]
+    """Registers returned by one read.
+
+    Native transports hand over the raw big-endian ``payload``; the list of
+    register words is only built if something asks for ``registers``.
+    """
+
+    __slots__ = ("address", "count", "_registers", "_payload")
+
+    def __init__(
+        self, address: int, count: int, registers: list[int] | None = None, payload: bytes | None = None
+    ) -> None:
+        self.address = address
+        self.count = count
+        self._registers = registers
+        self._payload = payload
+
+    @property
+    def registers(self) -> list[int]:
+        if self._registers is None:
+            self._registers = list(struct.unpack(f">{len(self.payload) // 2}H", self.payload))
+        return self._registers
+
+    @property
+    def payload(self) -> bytes:
+        if self._payload is None:
+            self._payload = struct.pack(f">{len(self._registers or ())}H", *(self._registers or ()))
+        return self._payload
+
+
+def _legacy_rtu_framer() -> type | None:
+    """pymodbus' RTU framer class where the installed version still exports one."""
+    with suppress(Exception):
+        from pymodbus.framer import ModbusRtuFramer  # type: ignore
+
+        return ModbusRtuFramer
+    with suppress(Exception):
+        from pymodbus.transaction import ModbusRtuFramer  # type: ignore
+
+        return ModbusRtuFramer
+    return None
+
+
+# Resolved once at import rather than on every reconnect.
+_RTU_FRAMER = _legacy_rtu_framer()
+
+
+class ModbusExceptionResponseError(ModbusIOException):
+    """The device or gateway answered with a Modbus exception response."""
+
+    def __init__(self, message: str, exception_code: int | None) -> None:
+        super().__init__(message)
+        self.exception_code = exception_code
+
+
+class CircuitOpenError(ConnectionError):
+    """A request was refused without any I/O because the gateway's circuit is open."""
+
+
+def _is_link_failure(exc: Exception) -> bool:
+    """True for errors that say nothing answered, as opposed to a Modbus exception response."""
+    if isinstance(exc, ModbusExceptionResponseError):
+        return False
+    return isinstance(exc, (OSError, ConnectionException, ModbusIOException))
+
+
+class BusArbiter:
+    """Grant the bus to one transaction at a time, round-robin across unit ids.
+
+    Each unit id has its own FIFO of waiters; after every transaction the bus
+    passes to the next unit with pending work, so one busy meter cannot starve
+    the others sharing a gateway.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: dict[int, deque[asyncio.Future[None]]] = {}
+        self._turns: deque[int] = deque()  # unit ids with waiters, in service order
+        self._busy = False
+
+    @asynccontextmanager
+    async def slot(self, unit_id: int) -> AsyncIterator[None]:
+        await self._acquire(unit_id)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, unit_id: int) -> None:
+        if not self._busy and not self._turns:
+            self._busy = True
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue = self._waiters.setdefault(unit_id, deque())
+        if not queue:
+            self._turns.append(unit_id)
+        queue.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just before cancellation; hand the bus on.
+                self._release()
+            else:
+                queue.remove(waiter)
+                if not queue:
+                    self._turns.remove(unit_id)
+            raise
+
+    def _release(self) -> None:
+        while self._turns:
+            unit_id = self._turns.popleft()
+            queue = self._waiters[unit_id]
+            waiter = queue.popleft()
+            if queue:
+                self._turns.append(unit_id)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._busy = False
+
+
+def _length_scale(count: int) -> float:
+    """How much longer than a reference-length read the response to ``count`` registers takes at most."""
+    # Response bytes: unit id, function, byte count, payload and CRC.
+    return max(1.0, (5 + 2 * count) / (5 + 2 * RTT_REFERENCE_REGISTERS))
+
+
+class RttEstimator:
+    """Smoothed round-trip time and its variance for one connection, as TCP keeps them (RFC 6298).
+
+    Samples of long reads are scaled down to the reference length and
+    timeouts scaled back up, so a long batch is not timed out by the latency
+    of short ones. Until the first sample the configured timeout applies;
+    every timeout doubles the derived one until a fresh sample arrives.
+    """
+
+    ALPHA = 0.125
+    BETA = 0.25
+    K = 4
+    MAX_BACKOFF = 64
+
+    __slots__ = ("min_timeout", "max_timeout", "srtt", "rttvar", "backoff", "samples", "timeouts")
+
+    def __init__(self, min_timeout: float, max_timeout: float) -> None:
+        self.min_timeout = min(min_timeout, max_timeout)
+        self.max_timeout = max_timeout
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.backoff = 1
+        self.samples = 0
+        self.timeouts = 0
+
+    def observe(self, rtt: float, count: int) -> None:
+        sample = rtt / _length_scale(count)
+        if self.srtt is None:
+            self.srtt, self.rttvar = sample, sample / 2
+        else:
+            self.rttvar += self.BETA * (abs(self.srtt - sample) - self.rttvar)
+            self.srtt += self.ALPHA * (sample - self.srtt)
+        self.backoff = 1
+        self.samples += 1
+
+    def timed_out(self) -> None:
+        self.backoff = min(self.backoff * 2, self.MAX_BACKOFF)
+        self.timeouts += 1
+
+    def timeout(self, count: int) -> float:
+        """Timeout for a read of ``count`` registers."""
+        if self.srtt is None:
+            return self.max_timeout
+        rto = (self.srtt + self.K * self.rttvar) * _length_scale(count) * self.backoff
+        return min(self.max_timeout, max(self.min_timeout, rto))
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        return {
+            "srtt_ms": None if self.srtt is None else round(self.srtt * 1000, 1),
+            "rttvar_ms": round(self.rttvar * 1000, 1),
+            "timeout_ms": round(self.timeout(RTT_REFERENCE_REGISTERS) * 1000, 1),
+            "max_length_timeout_ms": round(self.timeout(MODBUS_MAX_READ_REGISTERS) * 1000, 1),
+            "backoff": self.backoff,
+            "samples": self.samples,
+            "timeouts": self.timeouts,
+        }
+
+
+class CircuitBreaker:
+    """Closed, open or half-open state of one gateway connection.
+
+    After ``threshold`` consecutive link failures the circuit opens and
+    requests fail at once without I/O. Once the backoff has passed a single
+    trial request is let through (half-open): success closes the circuit,
+    failure reopens it for twice as long, up to ``max_backoff``. Backoffs are
+    jittered so gateways that failed together do not all retry together.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, threshold: int, min_backoff: float, max_backoff: float) -> None:
+        self.name = name
+        self.threshold = threshold
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self.trips = 0  # consecutive openings; sets the next backoff
+        self.retry_at = 0.0
+        self._open = False
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if not self._open:
+            return self.CLOSED
+        return self.OPEN if time.monotonic() < self.retry_at else self.HALF_OPEN
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests would be refused; half-open lets the next one through."""
+        return self.state == self.OPEN
+
+    @property
+    def retry_in(self) -> float:
+        return max(0.0, self.retry_at - time.monotonic()) if self._open else 0.0
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """Guard one request; raises CircuitOpenError instead of letting it through while open."""
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self._trial):
+            raise CircuitOpenError(f"Gateway {self.name} unreachable; next attempt in {self.retry_in:.0f}s")
+        trial = self._trial = state == self.HALF_OPEN
+        try:
+            yield
+        except Exception as exc:
+            if _is_link_failure(exc):
+                self._record_failure(trial)
+            else:
+                self._record_success()
+            raise
+        except BaseException:
+            if trial:
+                self._trial = False  # cancelled; let the next request try instead
+            raise
+        else:
+            self._record_success()
+
+    def _record_success(self) -> None:
+        if self._open:
+            _LOGGER.info("Gateway %s reachable again", self.name)
+        self.failures = self.trips = 0
+        self._open = self._trial = False
+
+    def _record_failure(self, trial: bool) -> None:
+        self.failures += 1
+        if trial:
+            self._trial = False
+            self._trip()
+        elif not self._open and self.failures >= self.threshold:
+            self._trip()
+
+    def _trip(self) -> None:
+        backoff = min(self.max_backoff, self.min_backoff * 2**self.trips) * random.uniform(0.5, 1.0)
+        self.retry_at = time.monotonic() + backoff
+        self._open = True
+        self.trips += 1
+        # Only the first opening is worth a warning; later ones repeat it.
+        _LOGGER.log(
+            logging.WARNING if self.trips == 1 else logging.DEBUG,
+            "Gateway %s unreachable after %s failures; next attempt in %.0fs",
+            self.name,
+            self.failures,
+            backoff,
+        )
+
+    def as_dict(self) -> dict[str, str | float | int]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "retry_in": round(self.retry_in, 1),
+        }
+
+
+# RTU frame sizes on the serial side: unit id, PDU and CRC.
+_READ_REQUEST_BYTES = 8
+_WRITE_RESPONSE_BYTES = 8
+
+
+def _read_response_bytes(count: int) -> int:
+    return 5 + 2 * count
+
+
+def _write_request_bytes(values: list[int]) -> int:
+    return 8 if len(values) == 1 else 9 + 2 * len(values)
+
+
+class FrameSpacer:
+    """Keep RS485 frames behind an RTU gateway at least the Modbus RTU inter-frame gap apart.
+
+    After each exchange the bus counts as busy until the request and response
+    could have crossed it at ``baud_rate`` with a 3.5 character silence after
+    each, and for at least one silence after the response arrived. The next
+    request waits exactly that long. A baud rate of 0 disables spacing.
+    """
+
+    BITS_PER_CHARACTER = 11  # start, 8 data, parity or second stop, stop
+    FAST_SILENT_INTERVAL = 0.00175  # fixed above 19200 baud per the Modbus serial line spec
+
+    __slots__ = ("baud_rate", "free_at", "waited", "waits")
+
+    def __init__(self, baud_rate: int = 0) -> None:
+        self.baud_rate = baud_rate
+        self.free_at = 0.0
+        self.waited = 0.0
+        self.waits = 0
+
+    @property
+    def character_time(self) -> float:
+        return self.BITS_PER_CHARACTER / self.baud_rate
+
+    @property
+    def silent_interval(self) -> float:
+        if self.baud_rate > 19200:
+            return self.FAST_SILENT_INTERVAL
+        return 3.5 * self.character_time
+
+    async def wait(self) -> None:
+        if not self.baud_rate:
+            return
+        delay = self.free_at - time.monotonic()
+        if delay > 0:
+            self.waits += 1
+            self.waited += delay
+            await asyncio.sleep(delay)
+
+    def transmitted(self, sent: float, request_bytes: int, response_bytes: int) -> None:
+        """Record one exchange started at monotonic time ``sent``."""
+        if not self.baud_rate:
+            return
+        silent = self.silent_interval
+        on_wire = (request_bytes + response_bytes) * self.character_time + 2 * silent
+        self.free_at = max(sent + on_wire, time.monotonic() + silent)
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "baud_rate": self.baud_rate,
+            "silent_interval_ms": round(self.silent_interval * 1000, 2) if self.baud_rate else 0.0,
+            "waits": self.waits,
+            "waited_s": round(self.waited, 3),
+        }
+
 
 class SdmModbusClient:
-    """Wrapper managing a single RTU-over-TCP session."""
+    """Wrapper managing a single RTU-over-TCP or Modbus TCP session.
+
+    One instance can be shared by every meter behind the same gateway: each
+    call may name its own ``unit_id`` and the bus is arbitrated fairly between
+    unit ids. ``unit_id`` given to the constructor is the default.
 
-    def __init__(self, host: str, port: int, unit_id: int, *, timeout: float = 5.0) -> None:
+    With the native TCP framer and ``pipeline_window`` above 1, requests skip
+    the arbiter and up to ``pipeline_window`` transactions are kept in flight,
+    matched by MBAP transaction id. RTU-over-TCP is always strictly serial and
+    uses the built-in codec when ``native_codec`` is set, pymodbus otherwise.
+
+    Reads are timed out after an RTT-derived per-request timeout rather than
+    the configured ``timeout``, which stays the upper bound; a read that times
+    out is re-sent at once, up to ``FAST_RETRIES`` times.
+
+    Every request passes the gateway's ``CircuitBreaker``: once the gateway
+    stops answering, requests fail without reconnecting until its backoff ends.
+    Serial requests are spaced by ``spacer`` once the RS485 baud rate is known.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        unit_id: int,
+        *,
+        timeout: float = 5.0,
+        framer: str = FRAMER_RTU_OVER_TCP,
+        pipeline_window: int = 1,
+        native_codec: bool = False,
+    ) -> None:
         self._host = host
         self._port = port
         self._unit_id = unit_id
         self._timeout = timeout
+        self._framer = framer
         self._client: AsyncModbusTcpClient | None = None
         self._lock = asyncio.Lock()
-        self._io_lock = asyncio.Lock()
+        self._arbiter = BusArbiter()
         self._connected = False
+        self._pipeline: MbapTransport | None = None
+        if framer == FRAMER_TCP and pipeline_window > 1:
+            self._pipeline = MbapTransport(host, port, timeout=timeout, window=pipeline_window)
+        self._native: RtuOverTcpTransport | None = None
+        if framer == FRAMER_RTU_OVER_TCP and native_codec:
+            self._native = RtuOverTcpTransport(host, port, timeout=timeout)
+        self._read_limit = MODBUS_MAX_READ_REGISTERS
+        self._read_limit_expires = 0.0
+        self.rtt = RttEstimator(MIN_REQUEST_TIMEOUT, timeout)
+        self.breaker = CircuitBreaker(
+            f"{host}:{port}", CIRCUIT_OPEN_AFTER_FAILURES, RECONNECT_BACKOFF_MIN, RECONNECT_BACKOFF_MAX
+        )
+        self.spacer = FrameSpacer()
+
+    def set_baud_rate(self, baud_rate: int) -> None:
+        """Space serial requests for an RS485 bus at ``baud_rate``; 0 turns spacing off.
+
+        Pipelined Modbus TCP never waits: such gateways pace their own bus.
+        """
+        if baud_rate != self.spacer.baud_rate:
+            _LOGGER.debug("Spacing requests to %s:%s for %s baud", self._host, self._port, baud_rate)
+            self.spacer.baud_rate = baud_rate
+
+    @property
+    def max_read_length(self) -> int:
+        """Largest read length known to be accepted.
+
+        A limit learned by probe_max_read_length lapses after READ_LIMIT_TTL,
+        so one spurious rejection cannot shrink reads for good; a gateway that
+        really has the limit rejects the next long read and is probed again.
+        """
+        if self._read_limit < MODBUS_MAX_READ_REGISTERS and time.monotonic() >= self._read_limit_expires:
+            self._read_limit = MODBUS_MAX_READ_REGISTERS
+        return self._read_limit
+
+    def learn_max_read_length(self, limit: int) -> None:
+        self._read_limit = min(self.max_read_length, limit)
+        self._read_limit_expires = time.monotonic() + READ_LIMIT_TTL
 
     async def set_unit_id(self, unit_id: int) -> None:
         """Update the Modbus unit identifier and reset the connection if it changed."""
@@ -49,22 +485,19 @@ class SdmModbusClient:
             if self._client:
                 with suppress(Exception):
                     await self._client.close()
-            # Attempt to import an RTU framer for better transaction id alignment when the
-            # device expects RTU style encapsulation over TCP (common with SDM meters via gateways).
-            framer = None
-            with suppress(Exception):  # optional
-                # pymodbus relocated framers across versions; try a few paths
-                try:
-                    from pymodbus.framer import ModbusRtuFramer as _Framer  # type: ignore
-                except Exception:  # pragma: no cover
-                    from pymodbus.transaction import ModbusRtuFramer as _Framer  # type: ignore
-                framer = _Framer
+            # Use an RTU framer for better transaction id alignment when the device expects
+            # RTU style encapsulation over TCP (common with SDM meters via gateways).
+            # Native Modbus TCP keeps pymodbus' default MBAP framer.
+            framer = _RTU_FRAMER if self._framer == FRAMER_RTU_OVER_TCP else None
 
+            # Reads are timed out and retried here (see _read_with_retry); pymodbus
+            # retrying on its own would be cut short by the RTT-based timeout.
             if framer:
                 self._client = AsyncModbusTcpClient(
                     self._host,
                     port=self._port,
                     timeout=self._timeout,
+                    retries=0,
                     framer=framer,
                 )
             else:
@@ -72,6 +505,7 @@ class SdmModbusClient:
                     self._host,
                     port=self._port,
                     timeout=self._timeout,
+                    retries=0,
                 )
             await self._client.connect()
             self._connected = bool(self._client.connected)  # type: ignore[attr-defined]
@@ -85,39 +519,261 @@ class SdmModbusClient:
                 with suppress(Exception):
                     await self._client.close()
             self._connected = False
+        for transport in (self._pipeline, self._native):
+            if transport is not None:
+                await transport.close()
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def pipelined(self) -> bool:
+        """True when several transactions may be in flight at once."""
+        return self._pipeline is not None
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    async def read_input_registers(self, address: int, count: int, *, unit_id: int | None = None) -> ReadResult:
+        return await self._read_registers("read_input_registers", address, count, unit_id)
+
+    async def read_holding_registers(self, address: int, count: int, *, unit_id: int | None = None) -> ReadResult:
+        return await self._read_registers("read_holding_registers", address, count, unit_id)
+
+    async def read_registers(
+        self, function: str, address: int, count: int, *, unit_id: int | None = None
+    ) -> ReadResult:
+        if function == "input":
+            return await self.read_input_registers(address, count, unit_id=unit_id)
+        if function == "holding":
+            return await self.read_holding_registers(address, count, unit_id=unit_id)
+        raise ValueError(f"Unsupported function {function}")
+
+    async def probe_max_read_length(
+        self, function: str, address: int, count: int, *, unit_id: int | None = None
+    ) -> int:
+        """Binary-search the largest read accepted at ``address`` below a rejected ``count``.
+
+        Only illegal data value answers count as rejections; any other exception
+        (busy, device or gateway failure) and transport errors propagate. The
+        learned limit is kept in ``max_read_length`` for later read plans.
+        """
+        good, bad = 0, count
+        while bad - good > 1:
+            trial = (good + bad) // 2
+            try:
+                await self.read_registers(function, address, trial, unit_id=unit_id)
+            except ModbusExceptionResponseError as exc:
+                if exc.exception_code != ILLEGAL_DATA_VALUE:
+                    raise
+                bad = trial
+            else:
+                good = trial
+        if good:
+            self.learn_max_read_length(good)
+            _LOGGER.debug("Gateway %s:%s accepts reads of up to %s registers", self._host, self._port, good)
+        return good
+
+    async def write_holding_register(self, address: int, value: int, *, unit_id: int | None = None) -> None:
+        await self._write_registers("write_register", address, [value], unit_id)
+
+    async def write_holding_registers(self, address: int, values: list[int], *, unit_id: int | None = None) -> None:
+        await self._write_registers("write_registers", address, values, unit_id)
+
+    async def _read_registers(self, method_name: str, address: int, count: int, unit_id: int | None) -> ReadResult:
+        device_id = self._unit_id if unit_id is None else unit_id
+        with self.breaker.request():
+            return await self._read_with_retry(method_name, address, count, device_id)
+
+    async def _read_with_retry(self, method_name: str, address: int, count: int, device_id: int) -> ReadResult:
+        attempt = 0
+        while True:
+            timeout = self.rtt.timeout(count)
+            try:
+                # Karn's rule: a retried request's round trip is ambiguous, so only first attempts are sampled.
+                return await self._read_once(method_name, address, count, device_id, timeout, sample=not attempt)
+            except asyncio.TimeoutError:
+                self.rtt.timed_out()
+                # A timeout at the configured ceiling means the link is gone, not slow.
+                if attempt == FAST_RETRIES or timeout >= self._timeout:
+                    raise
+                _LOGGER.debug(
+                    "Read @ %s len %s timed out after %.0f ms; retrying", address, count, timeout * 1000
+                )
+            attempt += 1
+
+    async def _read_once(
+        self, method_name: str, address: int, count: int, device_id: int, timeout: float, *, sample: bool
+    ) -> ReadResult:
+        if self._pipeline is not None:
+            # The transport times the request once it holds a window slot; queueing is not round trip.
+            observe = (lambda elapsed: self.rtt.observe(elapsed, count)) if sample else None
+            return await self._read_native(
+                self._pipeline, method_name, address, count, device_id, timeout, on_round_trip=observe
+            )
+        async with self._arbiter.slot(device_id):
+            if self._native is None:
+                await self.ensure_connected()
+            await self.spacer.wait()
+            started = time.monotonic()
+            try:
+                if self._native is not None:
+                    result = await self._read_native(self._native, method_name, address, count, device_id, timeout)
+                else:
+                    result = await self._read_pymodbus(method_name, address, count, device_id, timeout)
+            finally:
+                self.spacer.transmitted(started, _READ_REQUEST_BYTES, _read_response_bytes(count))
+        if sample:
+            self.rtt.observe(time.monotonic() - started, count)
+        return result
+
+    async def _read_pymodbus(
+        self, method_name: str, address: int, count: int, device_id: int, timeout: float
+    ) -> ReadResult:
+        assert self._client is not None
+        method = getattr(self._client, method_name)
+        try:
+            rr = await asyncio.wait_for(method(address=address, count=count, device_id=device_id), timeout)
+        except asyncio.TimeoutError:
+            if self._framer == FRAMER_RTU_OVER_TCP:
+                # RTU frames carry no transaction id, so pymodbus would take the
+                # late answer for the next request's; reconnect. MBAP drops it.
+                self._connected = False
+            raise
+        if rr.isError():  # type: ignore[attr-defined]
+            raise ModbusExceptionResponseError(
+                f"Modbus read error @ {address} len {count}: {rr}", getattr(rr, "exception_code", None)
+            )
+        return ReadResult(address=address, count=count, registers=rr.registers)  # type: ignore[attr-defined]
+
+    async def _write_registers(self, method_name: str, address: int, values: list[int], unit_id: int | None) -> None:
+        if not values:
+            raise ValueError("No values provided for write")
+        device_id = self._unit_id if unit_id is None else unit_id
+        with self.breaker.request():
+            await self._write_once(method_name, address, values, device_id)
+
+    async def _write_once(self, method_name: str, address: int, values: list[int], device_id: int) -> None:
+        if self._pipeline is not None:
+            await self._write_native(self._pipeline, address, values, device_id)
+            return
+        async with self._arbiter.slot(device_id):
+            if self._native is None:
+                await self.ensure_connected()
+            await self.spacer.wait()
+            started = time.monotonic()
+            try:
+                if self._native is not None:
+                    await self._write_native(self._native, address, values, device_id)
+                else:
+                    await self._write_pymodbus(method_name, address, values, device_id)
+            finally:
+                self.spacer.transmitted(started, _write_request_bytes(values), _WRITE_RESPONSE_BYTES)
+
+    async def _write_pymodbus(self, method_name: str, address: int, values: list[int], device_id: int) -> None:
+        assert self._client is not None
+        method = getattr(self._client, method_name)
+        if method_name == "write_register":
+            rr = await method(address=address, value=values[0], device_id=device_id)  # type: ignore[assignment]
+        else:
+            rr = await method(address=address, values=values, device_id=device_id)  # type: ignore[assignment]
+        if rr.isError():  # type: ignore[attr-defined]
+            raise ModbusExceptionResponseError(
+                f"Modbus write error @ {address} len {len(values)}: {rr}", getattr(rr, "exception_code", None)
+            )
+
+    async def _read_native(
+        self,
+        transport: MbapTransport | RtuOverTcpTransport,
+        method_name: str,
+        address: int,
+        count: int,
+        device_id: int,
+        timeout: float,
+        *,
+        on_round_trip: Callable[[float], None] | None = None,
+    ) -> ReadResult:
+        try:
+            payload = await transport.read_registers(
+                device_id, _FUNCTION_CODES[method_name], address, count, timeout=timeout, on_round_trip=on_round_trip
+            )
+        except ModbusExceptionCode as exc:
+            raise ModbusExceptionResponseError(
+                f"Modbus read error @ {address} len {count}: {exc}", exc.exception_code
+            ) from exc
+        return ReadResult(address=address, count=count, payload=payload)
+
+    async def _write_native(
+        self, transport: MbapTransport | RtuOverTcpTransport, address: int, values: list[int], device_id: int
+    ) -> None:
+        try:
+            await transport.write_registers(device_id, address, values)
+        except ModbusExceptionCode as exc:
+            raise ModbusExceptionResponseError(
+                f"Modbus write error @ {address} len {len(values)}: {exc}", exc.exception_code
+            ) from exc
+
+
+class SdmUnitClient:
+    """Per-meter view of a (possibly shared) gateway client bound to one unit id."""
+
+    def __init__(self, transport: SdmModbusClient, unit_id: int) -> None:
+        self.transport = transport
+        self._unit_id = unit_id
+
+    @property
+    def unit_id(self) -> int:
+        return self._unit_id
+
+    @property
+    def max_read_length(self) -> int:
+        return self.transport.max_read_length
+
+    def restore_max_read_length(self, limit: int) -> None:
+        """Apply a read limit learned before a restart; it lapses like a freshly probed one."""
+        self.transport.learn_max_read_length(limit)
+
+    @property
+    def pipelined(self) -> bool:
+        return self.transport.pipelined
+
+    @property
+    def rtt(self) -> RttEstimator:
+        """Round-trip estimate of the shared connection."""
+        return self.transport.rtt
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self.transport.breaker
+
+    @property
+    def spacer(self) -> FrameSpacer:
+        return self.transport.spacer
+
+    def set_baud_rate(self, baud_rate: int) -> None:
+        # Every meter on the gateway shares its RS485 bus, so this applies to all of them.
+        self.transport.set_baud_rate(baud_rate)
+
+    async def set_unit_id(self, unit_id: int) -> None:
+        # Unit ids travel with every request, so the shared connection is kept.
+        self._unit_id = unit_id
 
     async def read_input_registers(self, address: int, count: int) -> ReadResult:
-        return await self._read_registers("read_input_registers", address, count)
+        return await self.transport.read_input_registers(address, count, unit_id=self._unit_id)
 
     async def read_holding_registers(self, address: int, count: int) -> ReadResult:
-        return await self._read_registers("read_holding_registers", address, count)
+        return await self.transport.read_holding_registers(address, count, unit_id=self._unit_id)
+
+    async def read_registers(self, function: str, address: int, count: int) -> ReadResult:
+        return await self.transport.read_registers(function, address, count, unit_id=self._unit_id)
+
+    async def probe_max_read_length(self, function: str, address: int, count: int) -> int:
+        return await self.transport.probe_max_read_length(function, address, count, unit_id=self._unit_id)
 
     async def write_holding_register(self, address: int, value: int) -> None:
-        await self._write_registers("write_register", address, [value])
+        await self.transport.write_holding_register(address, value, unit_id=self._unit_id)
 
     async def write_holding_registers(self, address: int, values: list[int]) -> None:
-        await self._write_registers("write_registers", address, values)
-
-    async def _read_registers(self, method_name: str, address: int, count: int) -> ReadResult:
-        async with self._io_lock:
-            await self.ensure_connected()
-            assert self._client is not None
-            method = getattr(self._client, method_name)
-            rr = await method(address=address, count=count, device_id=self._unit_id)
-            if rr.isError():  # type: ignore[attr-defined]
-                raise ModbusIOException(f"Modbus read error @ {address} len {count}: {rr}")
-            return ReadResult(address=address, count=count, registers=rr.registers)  # type: ignore[attr-defined]
-
-    async def _write_registers(self, method_name: str, address: int, values: list[int]) -> None:
-        if not values:
-            raise ValueError("No values provided for write")
-        async with self._io_lock:
-            await self.ensure_connected()
-            assert self._client is not None
-            method = getattr(self._client, method_name)
-            if method_name == "write_register":
-                rr = await method(address=address, value=values[0], device_id=self._unit_id)  # type: ignore[assignment]
-            else:
-                rr = await method(address=address, values=values, device_id=self._unit_id)  # type: ignore[assignment]
-            if rr.isError():  # type: ignore[attr-defined]
-                raise ModbusIOException(f"Modbus write error @ {address} len {len(values)}: {rr}")
+        await self.transport.write_holding_registers(address, values, unit_id=self._unit_id)
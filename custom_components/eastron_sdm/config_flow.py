@@ -8,6 +8,9 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.const import CONF_NAME
 
+from .models import get_model_table
+from .overrides import parse_deadbands, parse_overrides
+from .sampling import parse_sampled_keys
 from .const import (
     DOMAIN,
     CONF_HOST,
@@ -20,16 +23,62 @@ from .const import (
     CONF_ENABLE_CONFIG,
     CONF_NORMAL_DIVISOR,
     CONF_SLOW_DIVISOR,
+    CONF_COALESCE_GAPS,
+    CONF_REQUEST_COST_MS,
+    CONF_REGISTER_COST_MS,
+    CONF_MAX_BATCH_LENGTH,
+    CONF_LEVEL_TIERS,
+    CONF_SCHEDULER,
+    CONF_MAX_AGE_OVERRIDES,
+    CONF_ADAPTIVE,
+    CONF_ADAPTIVE_MIN_INTERVAL,
+    CONF_ADAPTIVE_MAX_INTERVAL,
+    CONF_SHARED_SCHEDULE,
+    CONF_FRAMER,
+    CONF_PIPELINE_WINDOW,
+    CONF_STARTUP_CONCURRENCY,
+    CONF_NATIVE_CODEC,
+    CONF_BUS_BAUD_RATE,
+    CONF_DEADBAND,
+    CONF_DEADBAND_OVERRIDES,
+    CONF_MAX_SILENCE,
+    CONF_SAMPLING,
+    CONF_SAMPLE_INTERVAL,
+    CONF_SAMPLE_WINDOW,
+    CONF_SAMPLED_KEYS,
     CONF_DEBUG,
     CONF_MODEL,
     DEFAULT_MODEL,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_NORMAL_DIVISOR,
     DEFAULT_SLOW_DIVISOR,
+    DEFAULT_REQUEST_COST_MS,
+    DEFAULT_REGISTER_COST_MS,
+    DEFAULT_MAX_BATCH_LENGTH,
+    DEFAULT_ADAPTIVE_MIN_INTERVAL,
+    DEFAULT_ADAPTIVE_MAX_INTERVAL,
+    DEFAULT_PIPELINE_WINDOW,
+    DEFAULT_BUS_BAUD_RATE,
+    BUS_BAUD_RATES,
+    DEFAULT_STARTUP_CONCURRENCY,
+    DEFAULT_MAX_SILENCE,
+    DEFAULT_SAMPLE_INTERVAL,
+    DEFAULT_SAMPLE_WINDOW,
+    MIN_SAMPLE_INTERVAL,
+    MIN_SAMPLE_WINDOW,
+    MAX_SAMPLE_WINDOW,
+    FRAMER_RTU_OVER_TCP,
+    FRAMER_TCP,
+    FRAMERS,
+    MAX_PIPELINE_WINDOW,
+    MAX_STARTUP_CONCURRENCY,
+    MODBUS_MAX_READ_REGISTERS,
     MIN_SCAN_INTERVAL,
     MAX_SCAN_INTERVAL,
     MAX_DIVISOR,
     SUPPORTED_MODELS,
+    SCHEDULERS,
+    SCHEDULER_TIERED,
     model_display_name,
 )
 
@@ -40,6 +89,7 @@ DATA_SCHEMA = vol.Schema(
         vol.Optional(CONF_PORT, default=502): int,
         vol.Required(CONF_UNIT_ID, default=1): int,
         vol.Required(CONF_MODEL, default=DEFAULT_MODEL): vol.In(list(SUPPORTED_MODELS)),
+        vol.Optional(CONF_FRAMER, default=FRAMER_RTU_OVER_TCP): vol.In(list(FRAMERS)),
         vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
         vol.Optional(CONF_ENABLE_ADVANCED, default=False): bool,
         vol.Optional(CONF_ENABLE_DIAGNOSTIC, default=False): bool,
@@ -58,6 +108,7 @@ def _build_options_schema(data: dict[str, Any]) -> vol.Schema:
             vol.Required(CONF_HOST, default=data.get(CONF_HOST, "")): str,
             vol.Optional(CONF_PORT, default=data.get(CONF_PORT, 502)): int,
             vol.Required(CONF_UNIT_ID, default=data.get(CONF_UNIT_ID, 1)): int,
+            vol.Required(CONF_FRAMER, default=data.get(CONF_FRAMER, FRAMER_RTU_OVER_TCP)): vol.In(list(FRAMERS)),
             vol.Required(CONF_SCAN_INTERVAL, default=data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)): int,
             vol.Required(CONF_ENABLE_ADVANCED, default=data.get(CONF_ENABLE_ADVANCED, False)): bool,
             vol.Required(CONF_ENABLE_DIAGNOSTIC, default=data.get(CONF_ENABLE_DIAGNOSTIC, False)): bool,
@@ -65,6 +116,51 @@ def _build_options_schema(data: dict[str, Any]) -> vol.Schema:
             vol.Required(CONF_ENABLE_CONFIG, default=data.get(CONF_ENABLE_CONFIG, False)): bool,
             vol.Required(CONF_NORMAL_DIVISOR, default=data.get(CONF_NORMAL_DIVISOR, DEFAULT_NORMAL_DIVISOR)): int,
             vol.Required(CONF_SLOW_DIVISOR, default=data.get(CONF_SLOW_DIVISOR, DEFAULT_SLOW_DIVISOR)): int,
+            vol.Required(CONF_COALESCE_GAPS, default=data.get(CONF_COALESCE_GAPS, False)): bool,
+            vol.Required(
+                CONF_REQUEST_COST_MS, default=data.get(CONF_REQUEST_COST_MS, DEFAULT_REQUEST_COST_MS)
+            ): vol.Coerce(float),
+            vol.Required(
+                CONF_REGISTER_COST_MS, default=data.get(CONF_REGISTER_COST_MS, DEFAULT_REGISTER_COST_MS)
+            ): vol.Coerce(float),
+            vol.Required(
+                CONF_MAX_BATCH_LENGTH, default=data.get(CONF_MAX_BATCH_LENGTH, DEFAULT_MAX_BATCH_LENGTH)
+            ): int,
+            vol.Required(CONF_LEVEL_TIERS, default=data.get(CONF_LEVEL_TIERS, False)): bool,
+            vol.Required(CONF_SCHEDULER, default=data.get(CONF_SCHEDULER, SCHEDULER_TIERED)): vol.In(
+                list(SCHEDULERS)
+            ),
+            vol.Optional(CONF_MAX_AGE_OVERRIDES, default=data.get(CONF_MAX_AGE_OVERRIDES, "")): str,
+            vol.Required(CONF_ADAPTIVE, default=data.get(CONF_ADAPTIVE, False)): bool,
+            vol.Required(
+                CONF_ADAPTIVE_MIN_INTERVAL,
+                default=data.get(CONF_ADAPTIVE_MIN_INTERVAL, DEFAULT_ADAPTIVE_MIN_INTERVAL),
+            ): int,
+            vol.Required(
+                CONF_ADAPTIVE_MAX_INTERVAL,
+                default=data.get(CONF_ADAPTIVE_MAX_INTERVAL, DEFAULT_ADAPTIVE_MAX_INTERVAL),
+            ): int,
+            vol.Required(CONF_SHARED_SCHEDULE, default=data.get(CONF_SHARED_SCHEDULE, False)): bool,
+            vol.Required(
+                CONF_PIPELINE_WINDOW, default=data.get(CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW)
+            ): int,
+            vol.Required(CONF_NATIVE_CODEC, default=data.get(CONF_NATIVE_CODEC, False)): bool,
+            vol.Required(
+                CONF_BUS_BAUD_RATE, default=data.get(CONF_BUS_BAUD_RATE, DEFAULT_BUS_BAUD_RATE)
+            ): vol.In(list(BUS_BAUD_RATES)),
+            vol.Required(CONF_DEADBAND, default=data.get(CONF_DEADBAND, False)): bool,
+            vol.Optional(CONF_DEADBAND_OVERRIDES, default=data.get(CONF_DEADBAND_OVERRIDES, "")): str,
+            vol.Required(CONF_MAX_SILENCE, default=data.get(CONF_MAX_SILENCE, DEFAULT_MAX_SILENCE)): int,
+            vol.Required(CONF_SAMPLING, default=data.get(CONF_SAMPLING, False)): bool,
+            vol.Required(
+                CONF_SAMPLE_INTERVAL, default=data.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)
+            ): vol.Coerce(float),
+            vol.Required(CONF_SAMPLE_WINDOW, default=data.get(CONF_SAMPLE_WINDOW, DEFAULT_SAMPLE_WINDOW)): int,
+            vol.Optional(CONF_SAMPLED_KEYS, default=data.get(CONF_SAMPLED_KEYS, "")): str,
+            vol.Required(
+                CONF_STARTUP_CONCURRENCY,
+                default=data.get(CONF_STARTUP_CONCURRENCY, DEFAULT_STARTUP_CONCURRENCY),
+            ): int,
             vol.Required(CONF_DEBUG, default=data.get(CONF_DEBUG, False)): bool,
         }
     )
@@ -125,6 +221,61 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 errors[CONF_SLOW_DIVISOR] = "invalid"
             elif user_input[CONF_SLOW_DIVISOR] > MAX_DIVISOR:
                 errors[CONF_SLOW_DIVISOR] = "max_value"
+
+            if user_input[CONF_REQUEST_COST_MS] <= 0:
+                errors[CONF_REQUEST_COST_MS] = "min_value"
+            if user_input[CONF_REGISTER_COST_MS] <= 0:
+                errors[CONF_REGISTER_COST_MS] = "min_value"
+
+            if user_input[CONF_MAX_BATCH_LENGTH] < 2:
+                errors[CONF_MAX_BATCH_LENGTH] = "min_value"
+            elif user_input[CONF_MAX_BATCH_LENGTH] > MODBUS_MAX_READ_REGISTERS:
+                errors[CONF_MAX_BATCH_LENGTH] = "max_value"
+
+            try:
+                max_ages = parse_overrides(user_input.get(CONF_MAX_AGE_OVERRIDES))
+            except ValueError:
+                errors[CONF_MAX_AGE_OVERRIDES] = "invalid"
+            else:
+                if any(age <= 0 for age in max_ages.values()):
+                    errors[CONF_MAX_AGE_OVERRIDES] = "min_value"
+
+            if user_input[CONF_ADAPTIVE_MIN_INTERVAL] < MIN_SCAN_INTERVAL:
+                errors[CONF_ADAPTIVE_MIN_INTERVAL] = "min_value"
+            if user_input[CONF_ADAPTIVE_MAX_INTERVAL] < user_input[CONF_ADAPTIVE_MIN_INTERVAL]:
+                errors[CONF_ADAPTIVE_MAX_INTERVAL] = "invalid"
+            elif user_input[CONF_ADAPTIVE_MAX_INTERVAL] > MAX_SCAN_INTERVAL * MAX_DIVISOR:
+                errors[CONF_ADAPTIVE_MAX_INTERVAL] = "max_value"
+
+            if user_input[CONF_PIPELINE_WINDOW] < 1:
+                errors[CONF_PIPELINE_WINDOW] = "min_value"
+            elif user_input[CONF_PIPELINE_WINDOW] > MAX_PIPELINE_WINDOW:
+                errors[CONF_PIPELINE_WINDOW] = "max_value"
+            elif user_input[CONF_PIPELINE_WINDOW] > 1 and user_input[CONF_FRAMER] != FRAMER_TCP:
+                # RTU-over-TCP gateways cannot match overlapping requests.
+                errors[CONF_PIPELINE_WINDOW] = "invalid"
+
+            try:
+                parse_deadbands(user_input.get(CONF_DEADBAND_OVERRIDES))
+            except ValueError:
+                errors[CONF_DEADBAND_OVERRIDES] = "invalid"
+            if user_input[CONF_MAX_SILENCE] < MIN_SCAN_INTERVAL:
+                errors[CONF_MAX_SILENCE] = "min_value"
+
+            if user_input[CONF_SAMPLE_INTERVAL] < MIN_SAMPLE_INTERVAL:
+                errors[CONF_SAMPLE_INTERVAL] = "min_value"
+            if user_input[CONF_SAMPLE_WINDOW] < MIN_SAMPLE_WINDOW:
+                errors[CONF_SAMPLE_WINDOW] = "min_value"
+            elif user_input[CONF_SAMPLE_WINDOW] > MAX_SAMPLE_WINDOW:
+                errors[CONF_SAMPLE_WINDOW] = "max_value"
+            if user_input[CONF_STARTUP_CONCURRENCY] < 1:
+                errors[CONF_STARTUP_CONCURRENCY] = "min_value"
+            elif user_input[CONF_STARTUP_CONCURRENCY] > MAX_STARTUP_CONCURRENCY:
+                errors[CONF_STARTUP_CONCURRENCY] = "max_value"
+            model = {**self._entry.data, **self._entry.options}.get(CONF_MODEL, DEFAULT_MODEL)
+            known_keys = get_model_table(model).by_key
+            if not all(key in known_keys for key in parse_sampled_keys(user_input.get(CONF_SAMPLED_KEYS))):
+                errors[CONF_SAMPLED_KEYS] = "invalid"
             if not errors:
                 return self.async_create_entry(title="Options", data=user_input)
 
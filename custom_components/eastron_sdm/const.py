@@ -10,6 +10,11 @@ MAX_SCAN_INTERVAL = 3600
 DEFAULT_NORMAL_DIVISOR = 3   # every 3 base cycles
 DEFAULT_SLOW_DIVISOR = 30    # every 30 base cycles
 MAX_DIVISOR = 3600
+DEFAULT_REQUEST_COST_MS = 60.0   # estimated round trip of one Modbus transaction
+DEFAULT_REGISTER_COST_MS = 2.0   # estimated bus time of one extra register (~9600 baud)
+MODBUS_MAX_READ_REGISTERS = 125  # PDU limit of function 0x03/0x04
+READ_LIMIT_TTL = 86400  # seconds a probed gateway read limit holds before full-length reads are tried again
+DEFAULT_MAX_BATCH_LENGTH = 80    # Eastron meters answer at most 40 parameters per request
 
 MODEL_SDM120M = "SDM120M"
 MODEL_SDM630M = "SDM630M"
@@ -20,6 +25,40 @@ MODEL_DISPLAY_NAMES = {
 }
 DEFAULT_MODEL = MODEL_SDM120M
 
+SCHEDULER_TIERED = "tiered"      # fixed fast/normal/slow tiers with divisors
+SCHEDULER_DEADLINE = "deadline"  # earliest-deadline-first on per-register max-age
+SCHEDULERS = (SCHEDULER_TIERED, SCHEDULER_DEADLINE)
+DEFAULT_ADAPTIVE_MIN_INTERVAL = 5     # seconds; fastest cadence adaptive mode may choose
+DEFAULT_ADAPTIVE_MAX_INTERVAL = 900   # seconds; slowest cadence adaptive mode may choose
+FRAMER_RTU_OVER_TCP = "rtuovertcp"  # RTU frames tunnelled through a serial gateway
+FRAMER_TCP = "tcp"                  # native Modbus TCP (MBAP header)
+FRAMERS = (FRAMER_RTU_OVER_TCP, FRAMER_TCP)
+DEFAULT_PIPELINE_WINDOW = 1  # outstanding transactions; 1 disables pipelining
+MAX_PIPELINE_WINDOW = 16
+DEFAULT_BUS_BAUD_RATE = 0  # RS485 baud rate behind an RTU gateway; 0 follows the meter's baud_rate register
+BUS_BAUD_RATES = (0, 1200, 2400, 4800, 9600, 19200, 38400)
+BAUD_RATE_CODES = {0: 2400, 1: 4800, 2: 9600, 3: 19200, 4: 38400, 5: 1200}  # baud_rate register value -> baud
+DEFAULT_MAX_SILENCE = 300  # seconds; heartbeat republishing values held back by a deadband
+DEFAULT_SAMPLE_INTERVAL = 1.0  # seconds between high-rate samples
+MIN_SAMPLE_INTERVAL = 0.2
+DEFAULT_SAMPLE_WINDOW = 30     # seconds aggregated into one published min/max/mean/last
+MIN_SAMPLE_WINDOW = 10
+MAX_SAMPLE_WINDOW = 60
+DEFAULT_STARTUP_CONCURRENCY = 4  # gateways doing their initial reads at the same time
+MAX_STARTUP_CONCURRENCY = 32
+BATCH_RETRY_BUDGET = 0.5  # share of the scan interval a cycle may spend retrying failed batches
+LINK_DOWN_AFTER_ERRORS = 2  # consecutive transport errors after which a cycle skips its remaining batches
+WARM_START_STORAGE_VERSION = 1
+EXCLUSIONS_STORAGE_VERSION = 1
+EXCLUSION_TTL = 7 * 86400  # seconds a learned exclusion map holds before its registers are tried again
+WARM_START_SAVE_INTERVAL = 300  # seconds between persisting values and learned timings
+MIN_REQUEST_TIMEOUT = 0.25  # seconds; floor of the RTT-derived per-request timeout
+RTT_REFERENCE_REGISTERS = 40  # reads up to this length share one RTT estimate; longer ones scale it
+FAST_RETRIES = 1  # immediate re-sends of a read that hit its RTT-derived timeout
+CIRCUIT_OPEN_AFTER_FAILURES = 3  # consecutive link failures after which a gateway's circuit opens
+RECONNECT_BACKOFF_MIN = 10  # seconds the circuit first stays open; doubles per failed trial
+RECONNECT_BACKOFF_MAX = 600
+
 
 def model_display_name(model: str) -> str:
     return MODEL_DISPLAY_NAMES.get(model, model)
@@ -36,6 +75,45 @@ CONF_ENABLE_TWO_WAY = "enable_two_way"
 CONF_ENABLE_CONFIG = "enable_config"
 CONF_NORMAL_DIVISOR = "normal_divisor"
 CONF_SLOW_DIVISOR = "slow_divisor"
+CONF_COALESCE_GAPS = "coalesce_gaps"
+CONF_REQUEST_COST_MS = "request_cost_ms"
+CONF_REGISTER_COST_MS = "register_cost_ms"
+CONF_MAX_BATCH_LENGTH = "max_batch_length"
+CONF_LEVEL_TIERS = "level_tiers"
+CONF_SCHEDULER = "scheduler"
+CONF_MAX_AGE_OVERRIDES = "max_age_overrides"
+CONF_ADAPTIVE = "adaptive"
+CONF_ADAPTIVE_MIN_INTERVAL = "adaptive_min_interval"
+CONF_ADAPTIVE_MAX_INTERVAL = "adaptive_max_interval"
+CONF_SHARED_SCHEDULE = "shared_schedule"
+CONF_FRAMER = "framer"
+CONF_PIPELINE_WINDOW = "pipeline_window"
+CONF_NATIVE_CODEC = "native_codec"
+CONF_BUS_BAUD_RATE = "bus_baud_rate"
+CONF_DEADBAND = "deadband"
+CONF_DEADBAND_OVERRIDES = "deadband_overrides"
+CONF_MAX_SILENCE = "max_silence"
+CONF_SAMPLING = "sampling"
+CONF_SAMPLE_INTERVAL = "sample_interval"
+CONF_SAMPLE_WINDOW = "sample_window"
+CONF_SAMPLED_KEYS = "sampled_keys"
+CONF_STARTUP_CONCURRENCY = "startup_concurrency"
 CONF_DEBUG = "debug"
 
+# Options that need a new connection, identity, entity set or background task;
+# every other option is applied to the running coordinator in place.
+RELOAD_OPTIONS = (
+    CONF_HOST,
+    CONF_PORT,
+    CONF_MODEL,
+    CONF_FRAMER,
+    CONF_PIPELINE_WINDOW,
+    CONF_NATIVE_CODEC,
+    CONF_SHARED_SCHEDULE,
+    CONF_SAMPLING,
+    CONF_SAMPLE_INTERVAL,
+    CONF_SAMPLE_WINDOW,
+    CONF_SAMPLED_KEYS,
+)
+
 ATTR_LAST_UPDATE = "last_update"
@@ -4,11 +4,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import struct
-from dataclasses import dataclass
-from datetime import timedelta, datetime
-from typing import Iterable
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Iterable
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.config_entries import ConfigEntry
 
@@ -24,26 +26,97 @@ from .const import (
     CONF_ENABLE_CONFIG,
     CONF_NORMAL_DIVISOR,
     CONF_SLOW_DIVISOR,
+    CONF_COALESCE_GAPS,
+    CONF_REQUEST_COST_MS,
+    CONF_REGISTER_COST_MS,
+    CONF_MAX_BATCH_LENGTH,
+    CONF_LEVEL_TIERS,
+    CONF_SCHEDULER,
+    CONF_MAX_AGE_OVERRIDES,
+    CONF_ADAPTIVE,
+    CONF_ADAPTIVE_MIN_INTERVAL,
+    CONF_ADAPTIVE_MAX_INTERVAL,
+    CONF_SHARED_SCHEDULE,
+    CONF_FRAMER,
+    CONF_PIPELINE_WINDOW,
+    CONF_NATIVE_CODEC,
+    CONF_BUS_BAUD_RATE,
+    CONF_DEADBAND,
+    CONF_DEADBAND_OVERRIDES,
+    CONF_MAX_SILENCE,
+    CONF_SAMPLING,
+    CONF_SAMPLE_INTERVAL,
+    CONF_SAMPLE_WINDOW,
+    CONF_SAMPLED_KEYS,
     CONF_DEBUG,
     CONF_MODEL,
     DEFAULT_MODEL,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_NORMAL_DIVISOR,
     DEFAULT_SLOW_DIVISOR,
+    DEFAULT_REQUEST_COST_MS,
+    DEFAULT_REGISTER_COST_MS,
+    DEFAULT_MAX_BATCH_LENGTH,
+    DEFAULT_ADAPTIVE_MIN_INTERVAL,
+    DEFAULT_ADAPTIVE_MAX_INTERVAL,
+    DEFAULT_PIPELINE_WINDOW,
+    DEFAULT_BUS_BAUD_RATE,
+    BAUD_RATE_CODES,
+    DEFAULT_MAX_SILENCE,
+    DEFAULT_SAMPLE_INTERVAL,
+    DEFAULT_SAMPLE_WINDOW,
+    BATCH_RETRY_BUDGET,
+    EXCLUSION_TTL,
+    FRAMER_RTU_OVER_TCP,
+    LINK_DOWN_AFTER_ERRORS,
+    RELOAD_OPTIONS,
+    WARM_START_SAVE_INTERVAL,
+    SCHEDULER_DEADLINE,
+    SCHEDULER_TIERED,
+)
+from .adaptive import AdaptiveCadence, change_threshold
+from .client import ILLEGAL_DATA_ADDRESS, ILLEGAL_DATA_VALUE, ModbusExceptionResponseError, ReadResult
+from .gateway import SdmGatewayCoordinator, async_acquire_client, async_join_schedule, async_release_client
+from .models import get_model_specs, get_model_table, get_spec_by_key, RegisterSpec
+from .overrides import parse_deadbands, parse_overrides
+from .sampling import HighRateSampler, default_sampled_keys, parse_sampled_keys, window_context
+from .store import DecodedValue, ValueStore, ValueStoreView
+from .warm_start import WarmStartState, WarmStartStore
+from .exclusions import async_get_exclusion_registry
+from .read_plan import (
+    DeadlineScheduler,
+    ExclusionMap,
+    ReadPlan,
+    ReadPlanCache,
+    ReadPlanOptions,
+    RegisterBatch,
+    build_register_batches,
+    should_include_spec,
+    span_batch,
 )
-from .client import SdmModbusClient
-from .models import get_model_specs, get_spec_by_key, RegisterSpec
-from .read_plan import ReadPlanOptions, build_read_plan
 
 _LOGGER = logging.getLogger(__name__)
 
 @dataclass(slots=True)
-class DecodedValue:
-    key: str
-    value: float | int | None
-    updated: datetime
+class PollCycle:
+    """State of one meter polling pass; decoded values go straight to the value store.
+
+    Every batch succeeds or fails on its own, so a cycle can end partially read.
+    """
+
+    plan: ReadPlan
+    started: float
+    read: list[RegisterBatch] = field(default_factory=list)
+    failed: list[tuple[RegisterBatch, Exception]] = field(default_factory=list)
+    retries: int = 0
+    transport_errors: int = 0  # consecutive batches lost to timeouts or connection errors
 
-class SdmCoordinator(DataUpdateCoordinator[dict[str, DecodedValue]]):
+    @property
+    def link_down(self) -> bool:
+        return self.transport_errors >= LINK_DOWN_AFTER_ERRORS
+
+
+class SdmCoordinator(DataUpdateCoordinator[ValueStoreView]):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.entry = entry
         data = {**entry.data, **entry.options}
@@ -58,22 +131,87 @@ class SdmCoordinator(DataUpdateCoordinator[dict[str, DecodedValue]]):
         self.enable_diagnostic: bool = data.get(CONF_ENABLE_DIAGNOSTIC, False)
         self.enable_two_way: bool = data.get(CONF_ENABLE_TWO_WAY, False)
         self.enable_config: bool = data.get(CONF_ENABLE_CONFIG, False)
+        self.coalesce_gaps: bool = data.get(CONF_COALESCE_GAPS, False)
+        self.request_cost_ms: float = data.get(CONF_REQUEST_COST_MS, DEFAULT_REQUEST_COST_MS)
+        self.register_cost_ms: float = data.get(CONF_REGISTER_COST_MS, DEFAULT_REGISTER_COST_MS)
+        self.max_batch_length: int = data.get(CONF_MAX_BATCH_LENGTH, DEFAULT_MAX_BATCH_LENGTH)
+        self.level_tiers: bool = data.get(CONF_LEVEL_TIERS, False)
+        self.scheduler: str = data.get(CONF_SCHEDULER, SCHEDULER_TIERED)
+        self.max_age_overrides: dict[str, float] = _safe_overrides(data.get(CONF_MAX_AGE_OVERRIDES))
+        self.adaptive: bool = data.get(CONF_ADAPTIVE, False)
+        self.adaptive_min_interval: float = data.get(CONF_ADAPTIVE_MIN_INTERVAL, DEFAULT_ADAPTIVE_MIN_INTERVAL)
+        self.adaptive_max_interval: float = data.get(CONF_ADAPTIVE_MAX_INTERVAL, DEFAULT_ADAPTIVE_MAX_INTERVAL)
+        self.shared_schedule: bool = data.get(CONF_SHARED_SCHEDULE, False)
+        self.framer: str = data.get(CONF_FRAMER, FRAMER_RTU_OVER_TCP)
+        self.pipeline_window: int = data.get(CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW)
+        self.native_codec: bool = data.get(CONF_NATIVE_CODEC, False)
+        self.bus_baud_rate: int = data.get(CONF_BUS_BAUD_RATE, DEFAULT_BUS_BAUD_RATE)
+        self.deadband: bool = data.get(CONF_DEADBAND, False)
+        self.deadband_overrides: str = data.get(CONF_DEADBAND_OVERRIDES, "")
+        self.max_silence: int = data.get(CONF_MAX_SILENCE, DEFAULT_MAX_SILENCE)
+        self.sampling: bool = data.get(CONF_SAMPLING, False)
+        self.sample_interval: float = data.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)
+        self.sample_window: int = data.get(CONF_SAMPLE_WINDOW, DEFAULT_SAMPLE_WINDOW)
+        self.sampled_keys: str = data.get(CONF_SAMPLED_KEYS, "")
         self.debug: bool = data.get(CONF_DEBUG, False)
+        # Options this coordinator runs with; see needs_reload / async_apply_options.
+        self._applied = data
 
         # Identity fields
         self._serial_number: int | None = None
         self.serial_identifier: str | None = None
+        # False while the serial comes from warm start data and the meter has not confirmed it.
+        self.serial_verified = False
 
-        self._client = SdmModbusClient(self.host, self.port, self.unit_id)
+        self._client = async_acquire_client(
+            hass,
+            entry.entry_id,
+            self.host,
+            self.port,
+            self.unit_id,
+            framer=self.framer,
+            pipeline_window=self.pipeline_window,
+            native_codec=self.native_codec,
+        )
         self._cycle = 0
         self._failure_count = 0
+        # Consecutive failed cycles per batch, by batch id; dropped once the batch reads again.
+        self.batch_failures: dict[str, int] = {}
+        self.saved_transactions = 0
         self._specs = get_model_specs(self.model)
+        self._store = ValueStore(self.model)
+        self._apply_deadbands()
+        self._apply_bus_timing()
+        # Keys changed by the cycle being published; None wakes every listener.
+        self._changed_keys: set[str] | None = None
+        self._notified_success: bool | None = None
+        self.changed_key_count = 0
+        self._plan_cache: ReadPlanCache | None = None
+        # Keys whose entity is disabled in the entity registry; see async_track_enabled_entities.
+        self._disabled_keys: frozenset[str] = frozenset()
+        # Registers this meter rejects, learned by bisection; persisted by serial
+        # and dropped at _exclusions_expire (time.time()) to be learned afresh.
+        self.exclusions = ExclusionMap()
+        self._exclusions_expire = 0.0
+        self.sampler: HighRateSampler | None = self._build_sampler() if self.sampling else None
+        self._deadline_scheduler: DeadlineScheduler | None = None
+        self._adaptive: AdaptiveCadence | None = None
+        self.next_due = 0.0
+        self._warm_store = WarmStartStore(hass, entry.entry_id)
+        self._next_persist = 0.0
+        # True while entities show persisted values that no poll has confirmed yet.
+        self.stale = False
         super().__init__(
             hass,
             _LOGGER,
             name=f"SDM {self.host}:{self.port} unit {self.unit_id}",
-            update_interval=timedelta(seconds=self.scan_interval),
+            # With a shared schedule the gateway coordinator drives polling instead of our own timer.
+            update_interval=None if self.shared_schedule else timedelta(seconds=self.scan_interval),
         )
+        self._gateway_schedule: SdmGatewayCoordinator | None = None
+        self._leave_schedule: CALLBACK_TYPE | None = None
+        if self.shared_schedule:
+            self._gateway_schedule, self._leave_schedule = async_join_schedule(hass, self)
 
     def _read_plan_options(self) -> ReadPlanOptions:
         return ReadPlanOptions(
@@ -83,47 +221,599 @@ class SdmCoordinator(DataUpdateCoordinator[dict[str, DecodedValue]]):
             enable_config=self.enable_config,
             normal_divisor=self.normal_divisor,
             slow_divisor=self.slow_divisor,
+            coalesce_gaps=self.coalesce_gaps,
+            request_cost_ms=self.request_cost_ms,
+            register_cost_ms=self.register_cost_ms,
+            max_batch_length=min(self.max_batch_length, self._client.max_read_length),
+            level_tiers=self.level_tiers,
+            excluded_keys=self._disabled_keys,
+            exclusions=self.exclusions,
         )
 
-    async def _async_update_data(self) -> dict[str, DecodedValue]:  # type: ignore[override]
-        self._refresh_from_entry()
+    def _read_plan_cache(self) -> ReadPlanCache:
+        """Return the precompiled plans, rebuilding them only when options changed."""
+        options = self._read_plan_options()
+        if self._plan_cache is None or self._plan_cache.options != options:
+            self._plan_cache = ReadPlanCache(self._specs, options)
+        return self._plan_cache
+
+    def _get_deadline_scheduler(self) -> DeadlineScheduler:
+        """Return the deadline scheduler, rebuilding it (keeping read times) on option changes."""
+        options = self._read_plan_options()
+        scheduler = self._deadline_scheduler
+        if (
+            scheduler is None
+            or scheduler.options != options
+            or scheduler.interval != self.scan_interval
+            or scheduler.max_age_overrides != self.max_age_overrides
+        ):
+            replacement = DeadlineScheduler(self._specs, options, self.scan_interval, self.max_age_overrides)
+            if scheduler is not None:
+                replacement.carry_over(scheduler)
+            self._deadline_scheduler = scheduler = replacement
+            if self._adaptive is not None:
+                for key, cadence in self._adaptive.cadences().items():
+                    if key in scheduler.max_ages and key not in scheduler.fixed_keys:
+                        scheduler.max_ages[key] = cadence
+        return scheduler
+
+    def _get_adaptive(self) -> AdaptiveCadence:
+        adaptive = self._adaptive
+        if (
+            adaptive is None
+            or adaptive.min_interval != self.adaptive_min_interval
+            or adaptive.max_interval != max(self.adaptive_min_interval, self.adaptive_max_interval)
+        ):
+            adaptive = self._adaptive = AdaptiveCadence(self.adaptive_min_interval, self.adaptive_max_interval)
+        return adaptive
+
+    @property
+    def uses_deadline_scheduler(self) -> bool:
+        """Adaptive cadences are applied through the deadline scheduler."""
+        return self.adaptive or self.scheduler == SCHEDULER_DEADLINE
+
+    @property
+    def effective_cadence(self) -> dict[str, float]:
+        """Current seconds between reads for every register in the read plan."""
+        if self.uses_deadline_scheduler:
+            return dict(self._get_deadline_scheduler().max_ages)
+        options = self._read_plan_options()
+        tier_interval = {
+            "fast": self.scan_interval,
+            "normal": self.scan_interval * options.normal_divisor,
+            "slow": self.scan_interval * options.slow_divisor,
+        }
+        return {
+            spec.key: float(tier_interval[spec.tier])
+            for spec in self._specs
+            if should_include_spec(spec, options)
+        }
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Polling state for the diagnostics download."""
+        return {
+            "scheduler": SCHEDULER_DEADLINE if self.uses_deadline_scheduler else SCHEDULER_TIERED,
+            "adaptive": self.adaptive,
+            "failure_count": self._failure_count,
+            "batch_failures": dict(self.batch_failures),
+            "saved_transactions": self.saved_transactions,
+            "max_read_length": self._client.max_read_length,
+            "round_trip": self._client.rtt.as_dict(),
+            "circuit": self._client.breaker.as_dict(),
+            "frame_spacing": self._client.spacer.as_dict(),
+            "pipeline_window": self.pipeline_window if self.pipelined else 1,
+            "stale": self.stale,
+            "changed_keys_last_cycle": self.changed_key_count,
+            "disabled_keys": sorted(self._disabled_keys),
+            "exclusions": self.exclusions.as_dict(),
+            "deadband_suppressed": self._store.suppressed,
+            "sampling": (
+                {
+                    "keys": [spec.key for spec in self.sampler.specs],
+                    "interval": self.sampler.interval,
+                    "window": self.sampler.window,
+                    "batches": len(self.sampler.batches),
+                    "errors": self.sampler.errors,
+                }
+                if self.sampler
+                else None
+            ),
+            "effective_cadence": self.effective_cadence,
+            "change_stats": {
+                key: {"reads": stats.reads, "changes": stats.changes, "change_rate": round(stats.change_rate, 3)}
+                for key, stats in (self._adaptive.stats.items() if self._adaptive else ())
+            },
+            "shared_schedule": (
+                {
+                    "members": len(self._gateway_schedule.members),
+                    "bus_utilisation": round(self._gateway_schedule.bus_utilisation, 3),
+                }
+                if self._gateway_schedule
+                else None
+            ),
+        }
+
+    def _observe_change(self, scheduler: DeadlineScheduler, spec: RegisterSpec, value: float | int | None) -> None:
+        key = spec.key
+        if key in scheduler.fixed_keys or key not in scheduler.base_max_ages:
+            return
+        scheduler.max_ages[key] = self._get_adaptive().observe(
+            key, value, scheduler.base_max_ages[key], change_threshold(spec)
+        )
+
+    def _next_read_plan(self, now: float) -> ReadPlan:
+        if self.uses_deadline_scheduler:
+            return self._get_deadline_scheduler().plan(now)
+        plan_cache = self._read_plan_cache()
+        read_plan = plan_cache.plan_for(self._cycle)
+        self._cycle = read_plan.next_cycle
+        if not self.data:
+            # Levelled tiers only read part of the slow tier per cycle; populate everything first.
+            read_plan = plan_cache.full_plan()
+        return read_plan
+
+    async def _async_update_data(self) -> ValueStoreView:  # type: ignore[override]
+        if (error := self.circuit_open_error(time.monotonic())) is not None:
+            raise error
+        cycle = self.begin_cycle(time.monotonic())
+        await self.async_read_batches(cycle, cycle.plan.batches)
+        return self._cycle_finished(cycle)
+
+    @property
+    def pipelined(self) -> bool:
+        return self._client.pipelined
+
+    async def async_read_batches(self, cycle: PollCycle, batches: Iterable[RegisterBatch]) -> None:
+        """Read batches into the cycle, all in flight at once when the transport pipelines, then retry failures."""
+        if self.pipelined:
+            await asyncio.gather(*(self.async_read_batch(cycle, planned) for planned in batches))
+        else:
+            for planned in batches:
+                await self.async_read_batch(cycle, planned)
+        await self.async_retry_failed(cycle)
+
+    async def async_read_batch(self, cycle: PollCycle, planned: RegisterBatch) -> None:
+        """Read one batch, recording a failure in the cycle instead of raising."""
+        if cycle.link_down:
+            # The link looks down: fail fast instead of waiting out every batch's timeout.
+            cycle.failed.append((planned, cycle.failed[-1][1]))
+            return
+        try:
+            await self.async_read_into(cycle, planned)
+        except Exception as exc:  # broad: one bad batch must not cost the rest of the cycle
+            cycle.failed.append((planned, exc))
+            if not isinstance(exc, ModbusExceptionResponseError):
+                cycle.transport_errors += 1
+        else:
+            cycle.read.append(planned)
+            cycle.transport_errors = 0
+
+    async def async_retry_failed(self, cycle: PollCycle) -> None:
+        """Retry each failed batch once while the cycle is within its retry budget.
+
+        Batches the meter answered with a Modbus exception are not retried: the
+        answer would be the same.
+        """
+        deadline = cycle.started + self.scan_interval * BATCH_RETRY_BUDGET
+        failed, cycle.failed = cycle.failed, []
+        for planned, exc in failed:
+            if isinstance(exc, ModbusExceptionResponseError) or cycle.link_down or time.monotonic() >= deadline:
+                cycle.failed.append((planned, exc))
+                continue
+            cycle.retries += 1
+            await self.async_read_batch(cycle, planned)
+
+    def circuit_open_error(self, now: float) -> UpdateFailed | None:
+        """The error to publish instead of polling while the gateway's circuit is open.
+
+        Unlike a failed cycle it does not fall back to cached data, so entities
+        go unavailable until the gateway answers again.
+        """
+        breaker = self._client.breaker
+        if not breaker.is_open:
+            return None
+        self.next_due = now + self.scan_interval
+        self._failure_count += 1
+        return UpdateFailed(f"Gateway {self.host}:{self.port} unreachable; next attempt in {breaker.retry_in:.0f}s")
+
+    def begin_cycle(self, now: float) -> PollCycle:
+        """Plan one meter polling pass; batches are then read with async_read_into."""
+        self.next_due = now + self.scan_interval
+        if self.exclusions and time.time() >= self._exclusions_expire:
+            self._expire_exclusions()
+        read_plan = self._next_read_plan(now)
+        self.saved_transactions = read_plan.saved_transactions
+        if self.debug and read_plan.saved_transactions:
+            _LOGGER.debug(
+                "Read plan bridged gaps: %s batches, %s transactions saved",
+                len(read_plan.batches),
+                read_plan.saved_transactions,
+            )
+        return PollCycle(plan=read_plan, started=now)
+
+    async def async_read_into(self, cycle: PollCycle, planned: RegisterBatch) -> None:
+        """Read one planned batch and decode its specs into the cycle."""
+        for batch, raw in await self._read_batch(planned):
+            if self.debug:
+                _LOGGER.debug(
+                    "Batch read start=%s len=%s specs=%s",
+                    batch.start,
+                    batch.length,
+                    [s.key for s in batch.specs],
+                )
+            decoded = _decode_batch(batch, raw.payload)
+            self._store.write(decoded, time.monotonic())
+            if not (self.adaptive or self.debug):
+                continue
+            scheduler = self._get_deadline_scheduler() if self.adaptive else None
+            for spec, value in decoded:
+                if scheduler is not None:
+                    self._observe_change(scheduler, spec, value)
+                if self.debug:
+                    _LOGGER.debug("Decoded %s -> %s", spec.key, value)
+
+    def finish_cycle(self, cycle: PollCycle, error: Exception | None = None) -> None:
+        """Publish a cycle driven by the gateway coordinator to this meter's entities."""
         try:
-            read_plan = build_read_plan(self._specs, self._read_plan_options(), self._cycle)
-            self._cycle = read_plan.next_cycle
-
-            decoded: dict[str, DecodedValue] = {**(self.data or {})}
-
-            for batch in read_plan.batches:
-                if batch.function == "input":
-                    raw = await self._client.read_input_registers(batch.start, batch.length)
-                elif batch.function == "holding":
-                    raw = await self._client.read_holding_registers(batch.start, batch.length)
-                else:
-                    raise UpdateFailed(f"Unsupported function {batch.function}")
+            data = self._cycle_failed(error) if error is not None else self._cycle_finished(cycle)
+        except UpdateFailed as err:
+            self.async_set_update_error(err)
+        else:
+            self.async_set_updated_data(data)
+
+    def _cycle_finished(self, cycle: PollCycle) -> ValueStoreView:
+        """Publish what the cycle read; it only fails when no planned batch could be read."""
+        self._record_batch_outcomes(cycle)
+        if cycle.failed and not cycle.read:
+            return self._cycle_failed(cycle.failed[0][1])
+        if cycle.failed:
+            _LOGGER.debug(
+                "SDM %s:%s unit %s: %s of %s batches failed after %s retries: %s",
+                self.host,
+                self.port,
+                self.unit_id,
+                len(cycle.failed),
+                len(cycle.failed) + len(cycle.read),
+                cycle.retries,
+                cycle.failed[0][1],
+            )
+        return self._cycle_succeeded(cycle)
+
+    def _record_batch_outcomes(self, cycle: PollCycle) -> None:
+        for planned in cycle.read:
+            self.batch_failures.pop(_batch_id(planned), None)
+        for planned, _exc in cycle.failed:
+            batch_id = _batch_id(planned)
+            self.batch_failures[batch_id] = self.batch_failures.get(batch_id, 0) + 1
+
+    def _cycle_succeeded(self, cycle: PollCycle) -> ValueStoreView:
+        if self.uses_deadline_scheduler:
+            # Failed batches stay due and are planned again next cycle.
+            self._get_deadline_scheduler().mark_read(
+                (spec.key for batch in cycle.read for spec in batch.specs), cycle.started
+            )
+        self._failure_count = 0
+        self._take_changed_keys()
+        self._apply_bus_timing()
+        if self.stale:
+            # Wake every entity so none keeps reporting restored values as stale.
+            self.stale = False
+            self._changed_keys = None
+        if self.serial_verified and cycle.started >= self._next_persist:
+            self._next_persist = cycle.started + WARM_START_SAVE_INTERVAL
+            self._warm_store.async_schedule_save(self._warm_start_state)
+        return self._store.view
+
+    def _cycle_failed(self, exc: Exception) -> ValueStoreView:
+        self._failure_count += 1
+        if self.data:
+            _LOGGER.warning("Using cached SDM data after failure #%s: %s", self._failure_count, exc)
+            self._take_changed_keys()
+            return self.data
+        raise UpdateFailed(str(exc)) from exc
+
+    def _take_changed_keys(self) -> None:
+        self._changed_keys = self._store.take_changed()
+        self.changed_key_count = len(self._changed_keys)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Wake only the entities whose register changed in the published cycle.
+
+        Listeners without a key context, and all listeners when availability
+        flips or outside a poll cycle, are always updated.
+        """
+        changed, self._changed_keys = self._changed_keys, None
+        availability_changed = self.last_update_success != self._notified_success
+        self._notified_success = self.last_update_success
+        if changed is None or availability_changed:
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    async def _read_batch(self, batch: RegisterBatch) -> list[tuple[RegisterBatch, ReadResult]]:
+        """Read a batch, learning the gateway read limit when it rejects the length."""
+        try:
+            return [(batch, await self._client.read_registers(batch.function, batch.start, batch.length))]
+        except ModbusExceptionResponseError as exc:
+            if exc.exception_code == ILLEGAL_DATA_ADDRESS:
+                parts = await self._bisect(batch)
+                if not parts:
+                    raise
+                return parts
+            # Busy, device and gateway failures say nothing about the read length.
+            if exc.exception_code != ILLEGAL_DATA_VALUE or len(batch.specs) < 2:
+                raise
+            limit = await self._client.probe_max_read_length(batch.function, batch.start, batch.length)
+            # A spec longer than the limit cannot be read in any split either.
+            if not limit or limit >= batch.length or any(spec.length > limit for spec in batch.specs):
+                raise
+            _LOGGER.info(
+                "SDM %s:%s rejected a %s register read; limiting batches to %s registers",
+                self.host,
+                self.port,
+                batch.length,
+                limit,
+            )
+        options = self._read_plan_options()
+        parts = build_register_batches(batch.specs, options.cost_model, limit, options.exclusions)
+        return [
+            (part, await self._client.read_registers(part.function, part.start, part.length)) for part in parts
+        ]
+
+    async def _bisect(self, batch: RegisterBatch) -> list[tuple[RegisterBatch, ReadResult]]:
+        """Split a batch rejected with illegal data address until the rejected part is isolated.
+
+        Returns the parts that could be read; what was isolated joins
+        ``exclusions`` so later read plans go straight to the working layout.
+        """
+        if len(batch.specs) < 2:
+            await self._learn_exclusions(
+                ExclusionMap(ranges=frozenset({(batch.function, batch.start, batch.start + batch.length)}))
+            )
+            return []
+        ordered = sorted(batch.specs, key=lambda spec: spec.address)
+        left, right = span_batch(ordered[: len(ordered) // 2]), span_batch(ordered[len(ordered) // 2 :])
+        results: list[tuple[RegisterBatch, ReadResult]] = []
+        halves_read = 0
+        for part in (left, right):
+            try:
+                results.append((part, await self._client.read_registers(part.function, part.start, part.length)))
+                halves_read += 1
+            except ModbusExceptionResponseError as exc:
+                if exc.exception_code != ILLEGAL_DATA_ADDRESS:
+                    raise
+                results.extend(await self._bisect(part))
+        if halves_read < 2:
+            return results
+        # Both halves read on their own: the registers bridged between them are rejected.
+        left_end = left.start + left.length
+        if left_end < right.start:
+            found = ExclusionMap(ranges=frozenset({(batch.function, left_end, right.start)}))
+        else:
+            found = ExclusionMap(splits=frozenset({(batch.function, right.start)}))
+        await self._learn_exclusions(found)
+        return results
+
+    async def _learn_exclusions(self, found: ExclusionMap) -> None:
+        exclusions = self.exclusions.merged(found)
+        if exclusions == self.exclusions:
+            return
+        _LOGGER.info(
+            "SDM %s:%s unit %s rejects register reads %s; later reads avoid them",
+            self.host,
+            self.port,
+            self.unit_id,
+            found.as_dict(),
+        )
+        if not self.exclusions:
+            self._exclusions_expire = time.time() + EXCLUSION_TTL
+        self._set_exclusions(exclusions)
+        if self.serial_identifier and self.serial_verified:
+            await async_get_exclusion_registry(self.hass).async_set(
+                self.serial_identifier, exclusions, self._exclusions_expire
+            )
+
+    async def async_load_exclusions(self) -> None:
+        """Merge the exclusions persisted for this meter's serial with what was learned so far."""
+        if not self.serial_identifier:
+            return
+        registry = async_get_exclusion_registry(self.hass)
+        persisted, expires_at = await registry.async_get(self.serial_identifier)
+        if persisted:
+            self._exclusions_expire = min(expires_at, self._exclusions_expire or expires_at)
+        exclusions = self.exclusions.merged(persisted)
+        if exclusions != persisted:
+            await registry.async_set(self.serial_identifier, exclusions, self._exclusions_expire)
+        if exclusions != self.exclusions:
+            self._set_exclusions(exclusions)
+
+    def _expire_exclusions(self) -> None:
+        """Forget the learned exclusions so registers the meter accepts again come back."""
+        _LOGGER.debug("SDM %s:%s unit %s: re-checking excluded registers", self.host, self.port, self.unit_id)
+        self._exclusions_expire = 0.0
+        self._set_exclusions(ExclusionMap())
+        if self.serial_identifier:
+            async_get_exclusion_registry(self.hass).async_clear(self.serial_identifier)
+
+    def _set_exclusions(self, exclusions: ExclusionMap) -> None:
+        # Read plans rebuild on their own: the exclusions are part of their options.
+        self.exclusions = exclusions
+        if self.sampler is not None:
+            options = self._read_plan_options()
+            self.sampler.replan(options.cost_model, options.max_batch_length, exclusions)
+
+    @callback
+    def async_track_enabled_entities(self) -> CALLBACK_TYPE:
+        """Keep disabled entities' registers out of the read plan; returns the unsubscribe callback."""
+        self._update_disabled_keys()
+
+        @callback
+        def _registry_updated(event: Event) -> None:
+            self._update_disabled_keys()
+
+        return self.hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _registry_updated)
+
+    @callback
+    def _update_disabled_keys(self) -> None:
+        registry = er.async_get(self.hass)
+        prefix = self.build_unique_id("")
+        spec_keys = get_model_table(self.model).by_key
+        disabled = frozenset(
+            reg_entry.unique_id[len(prefix) :]
+            for reg_entry in er.async_entries_for_config_entry(registry, self.entry.entry_id)
+            if reg_entry.disabled_by is not None
+            and reg_entry.unique_id.startswith(prefix)
+            and reg_entry.unique_id[len(prefix) :] in spec_keys
+        )
+        if disabled != self._disabled_keys:
+            _LOGGER.debug("Read plan now skips registers of %s disabled entities", len(disabled))
+            self._disabled_keys = disabled
+
+    def _build_sampler(self) -> HighRateSampler:
+        keys = set(parse_sampled_keys(self.sampled_keys) or default_sampled_keys(self._specs))
+        options = self._read_plan_options()
+        return HighRateSampler(
+            [spec for spec in self._specs if spec.key in keys],
+            self.sample_interval,
+            self.sample_window,
+            cost_model=options.cost_model,
+            max_length=options.max_batch_length,
+        )
+
+    @callback
+    def async_start_sampling(self) -> None:
+        """Start the high-rate sampling task; it stops when the entry unloads."""
+        if self.sampler is None or not self.sampler.specs:
+            return
+        self.entry.async_create_background_task(
+            self.hass, self._async_sample_loop(self.sampler), f"{self.name} high-rate sampling"
+        )
+
+    async def _async_sample_loop(self, sampler: HighRateSampler) -> None:
+        loop = asyncio.get_running_loop()
+        next_sample = window_end = loop.time()
+        window_end += sampler.window
+        while True:
+            try:
+                for planned in sampler.batches:
+                    for batch, raw in await self._read_batch(planned):
+                        sampler.add(_decode_batch(batch, raw.payload))
+            except Exception as exc:  # broad: a missed sample must not stop sampling
+                sampler.errors += 1
                 if self.debug:
-                    _LOGGER.debug(
-                        "Batch read start=%s len=%s specs=%s", batch.start, batch.length, [s.key for s in batch.specs]
-                    )
-                # Slice out per spec
-                for spec in batch.specs:
-                    offset = spec.address - batch.start
-                    regs = raw.registers[offset: offset + spec.length]
-                    value = _decode(spec, regs)
-                    decoded[spec.key] = DecodedValue(key=spec.key, value=value, updated=datetime.utcnow())
-                    if self.debug:
-                        _LOGGER.debug("Decoded %s -> %s", spec.key, value)
-
-            self._failure_count = 0
-            return decoded
-        except Exception as exc:  # broad to ensure coordinator handles availability
-            self._failure_count += 1
-            if self.data:
-                _LOGGER.warning("Using cached SDM data after failure #%s: %s", self._failure_count, exc)
-                return self.data
-            raise UpdateFailed(str(exc)) from exc
+                    _LOGGER.debug("High-rate sample failed: %s", exc)
+            now = loop.time()
+            if now >= window_end:
+                self._publish_window(sampler.close_window())
+                window_end = now + sampler.window
+            # After an overrun, sample again right away instead of catching up in a burst.
+            next_sample = max(next_sample + sampler.interval, now)
+            await asyncio.sleep(next_sample - now)
+
+    @callback
+    def _publish_window(self, keys: set[str]) -> None:
+        if not keys:
+            return
+        self._changed_keys = {window_context(key) for key in keys}
+        self.async_update_listeners()
+
+    async def async_warm_start(self) -> bool:
+        """Publish the values persisted by the previous run, marked stale.
+
+        Returns False, leaving the coordinator untouched, when nothing usable
+        was persisted for this host, unit and model; setup then has to poll.
+        """
+        state = await self._warm_store.async_load()
+        if (
+            state is None
+            or not state.serial
+            or not state.values
+            or (state.host, state.unit_id, state.model) != (self.host, self.unit_id, self.model)
+        ):
+            return False
+        self._serial_number = int(state.serial) if state.serial.isdigit() else None
+        self.serial_identifier = state.serial
+        age = max(0.0, time.time() - state.saved_at)
+        # Timestamp 0 means "never read", so keep restored stamps positive.
+        self._store.restore(state.values, max(time.monotonic() - age, 1e-3))
+        self._store.take_changed()
+        self._apply_bus_timing()
+        if state.max_read_length:
+            self._client.restore_max_read_length(int(state.max_read_length))
+        if state.cadences and self.adaptive:
+            self._get_adaptive().restore(state.cadences)
+        self.stale = True
+        self.async_set_updated_data(self._store.view)
+        _LOGGER.debug("Warm start of %s from values %.0f s old", self.name, age)
+        return True
+
+    async def async_confirm_warm_start(self) -> None:
+        """Poll after a warm start and check the persisted serial against the meter.
+
+        A different serial means the meter was replaced: the warm state is
+        dropped and the entry reloaded, so the new meter gets its own identity
+        and exclusions as on a cold start. While the meter is unreachable the
+        serial is only read again after a poll succeeds, so an open circuit
+        holds the check back too.
+        """
+        await self.async_refresh()
+        failed = False
+        while True:
+            if self.last_update_success:
+                if (serial := await self._async_read_serial_number(quiet=failed)) is not None:
+                    break
+                failed = True
+            await self._async_wait_for_successful_poll()
+        if serial == self.serial_identifier:
+            self.serial_verified = True
+            return
+        _LOGGER.warning(
+            "SDM %s:%s unit %s now reports serial %s instead of %s; setting it up as a new meter",
+            self.host,
+            self.port,
+            self.unit_id,
+            serial,
+            self.serial_identifier,
+        )
+        await self._warm_store.async_remove()
+        self.hass.config_entries.async_schedule_reload(self.entry.entry_id)
+
+    async def _async_wait_for_successful_poll(self) -> None:
+        polled: asyncio.Future[None] = self.hass.loop.create_future()
+
+        @callback
+        def _on_update() -> None:
+            if self.last_update_success and not polled.done():
+                polled.set_result(None)
+
+        remove_listener = self.async_add_listener(_on_update)
+        try:
+            await polled
+        finally:
+            remove_listener()
+
+    def _warm_start_state(self) -> WarmStartState:
+        return WarmStartState(
+            host=self.host,
+            unit_id=self.unit_id,
+            model=self.model,
+            serial=self.serial_identifier,
+            saved_at=time.time(),
+            values=self._store.snapshot(),
+            max_read_length=self._client.max_read_length,
+            cadences=self._adaptive.cadences() if self._adaptive else {},
+        )
 
     async def async_close(self) -> None:
-        await self._client.close()
+        if self._leave_schedule is not None:
+            self._leave_schedule()
+            self._leave_schedule = None
+        if self.data and not self.stale and self.serial_verified:
+            await self._warm_store.async_save(self._warm_start_state())
+        await async_release_client(self.hass, self.entry.entry_id, self.host, self.port)
 
     async def async_write_register(
         self, spec: RegisterSpec, value: int | Iterable[int], *, raw_value: float | int | None = None
@@ -147,25 +837,85 @@ class SdmCoordinator(DataUpdateCoordinator[dict[str, DecodedValue]]):
             if new_unit is not None:
                 await self._handle_meter_id_change(new_unit)
 
+    def needs_reload(self) -> bool:
+        """Whether the entry's options changed something only a reload can apply."""
+        data = {**self.entry.data, **self.entry.options}
+        # A verified meter_id write has already moved this coordinator to the new unit id.
+        if data.get(CONF_UNIT_ID, 1) != self.unit_id:
+            return True
+        return any(data.get(key) != self._applied.get(key) for key in RELOAD_OPTIONS)
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Apply changed options in place; the read plan is rebuilt on the next poll."""
+        scan_interval = self.scan_interval
+        self._refresh_from_entry()
+        self._applied = {**self.entry.data, **self.entry.options}
+        if self.scan_interval != scan_interval and not self.shared_schedule:
+            # Restart the timer so a shorter interval applies now rather than after the old one.
+            self._schedule_refresh()
+
     def _refresh_from_entry(self) -> None:
         """Refresh coordinator settings from the latest entry data/options."""
         data = {**self.entry.data, **self.entry.options}
-        old_model = self.model
-        
+
         self.enable_advanced = data.get(CONF_ENABLE_ADVANCED, self.enable_advanced)
         self.enable_diagnostic = data.get(CONF_ENABLE_DIAGNOSTIC, self.enable_diagnostic)
         self.enable_two_way = data.get(CONF_ENABLE_TWO_WAY, self.enable_two_way)
         self.enable_config = data.get(CONF_ENABLE_CONFIG, self.enable_config)
         self.normal_divisor = data.get(CONF_NORMAL_DIVISOR, self.normal_divisor)
         self.slow_divisor = data.get(CONF_SLOW_DIVISOR, self.slow_divisor)
-        self.model = data.get(CONF_MODEL, self.model)
+        self.coalesce_gaps = data.get(CONF_COALESCE_GAPS, self.coalesce_gaps)
+        self.request_cost_ms = data.get(CONF_REQUEST_COST_MS, self.request_cost_ms)
+        self.register_cost_ms = data.get(CONF_REGISTER_COST_MS, self.register_cost_ms)
+        self.max_batch_length = data.get(CONF_MAX_BATCH_LENGTH, self.max_batch_length)
+        self.level_tiers = data.get(CONF_LEVEL_TIERS, self.level_tiers)
+        self.scheduler = data.get(CONF_SCHEDULER, self.scheduler)
+        self.max_age_overrides = _safe_overrides(data.get(CONF_MAX_AGE_OVERRIDES))
+        self.adaptive = data.get(CONF_ADAPTIVE, self.adaptive)
+        self.adaptive_min_interval = data.get(CONF_ADAPTIVE_MIN_INTERVAL, self.adaptive_min_interval)
+        self.adaptive_max_interval = data.get(CONF_ADAPTIVE_MAX_INTERVAL, self.adaptive_max_interval)
+        self.debug = data.get(CONF_DEBUG, self.debug)
+        self.bus_baud_rate = data.get(CONF_BUS_BAUD_RATE, self.bus_baud_rate)
+        self._apply_bus_timing()
+        deadband_settings = (self.deadband, self.deadband_overrides, self.max_silence)
+        self.deadband = data.get(CONF_DEADBAND, self.deadband)
+        self.deadband_overrides = data.get(CONF_DEADBAND_OVERRIDES, self.deadband_overrides)
+        self.max_silence = data.get(CONF_MAX_SILENCE, self.max_silence)
         scan_interval = data.get(CONF_SCAN_INTERVAL, self.scan_interval)
         if scan_interval != self.scan_interval:
             self.scan_interval = scan_interval
-            self.update_interval = timedelta(seconds=self.scan_interval)
-        
-        if old_model != self.model:
-            self._specs = get_model_specs(self.model)
+            if not self.shared_schedule:
+                self.update_interval = timedelta(seconds=self.scan_interval)
+
+        if deadband_settings != (self.deadband, self.deadband_overrides, self.max_silence):
+            self._apply_deadbands()
+
+    def _apply_bus_timing(self) -> None:
+        """Space requests for the RS485 bus behind an RTU gateway.
+
+        The configured baud rate wins; otherwise the meter's own baud_rate
+        register is used once it has been read (config registers enabled).
+        Without either, or with another framer, spacing is turned off.
+        """
+        baud_rate = 0
+        if self.framer == FRAMER_RTU_OVER_TCP:
+            baud_rate = self.bus_baud_rate
+            if not baud_rate and self.enable_config and (slot := self._store.index.get("baud_rate")) is not None:
+                code = self._store.value(slot)
+                baud_rate = BAUD_RATE_CODES.get(int(code), 0) if code is not None else 0
+        self._client.set_baud_rate(baud_rate)
+
+    def _apply_deadbands(self) -> None:
+        if not self.deadband:
+            self._store.set_deadbands(self._specs, None, 0)
+            return
+        try:
+            overrides = parse_deadbands(self.deadband_overrides)
+        except ValueError:
+            _LOGGER.warning("Ignoring malformed deadband overrides: %s", self.deadband_overrides)
+            overrides = {}
+        self._store.set_deadbands(self._specs, overrides, self.max_silence)
 
     def _extract_unit_id(self, raw_value: float | int | None, encoded: int | Iterable[int]) -> int | None:
         """Best-effort extraction of the intended unit id after a meter_id write."""
@@ -223,18 +973,22 @@ class SdmCoordinator(DataUpdateCoordinator[dict[str, DecodedValue]]):
         """Fetch and cache the meter serial number for stable identity."""
         if self.serial_identifier:
             return self.serial_identifier
+        serial = await self._async_read_serial_number()
+        if serial is not None:
+            self._serial_number = int(serial)
+            self.serial_identifier = serial
+            self.serial_verified = True
+        return serial
+
+    async def _async_read_serial_number(self, *, quiet: bool = False) -> str | None:
         try:
             spec = get_spec_by_key(self.model, "serial_number")
             raw = await self._client.read_holding_registers(spec.address, spec.length)
             value = _decode(spec, raw.registers)
-            if value is None:
-                return None
-            self._serial_number = int(value)
-            self.serial_identifier = str(self._serial_number)
-            return self.serial_identifier
         except Exception as exc:
-            _LOGGER.warning("Unable to read serial_number: %s", exc)
+            _LOGGER.log(logging.DEBUG if quiet else logging.WARNING, "Unable to read serial_number: %s", exc)
             return None
+        return None if value is None else str(int(value))
 
     def build_unique_id(self, key: str) -> str:
         """Build a stable unique_id using serial_number when available."""
@@ -242,6 +996,19 @@ class SdmCoordinator(DataUpdateCoordinator[dict[str, DecodedValue]]):
         return f"eastron_sdm_{base}_{key}"
 
 
+def _batch_id(batch: RegisterBatch) -> str:
+    return f"{batch.function}:{batch.start}+{batch.length}"
+
+
+def _safe_overrides(text: str | None) -> dict[str, float]:
+    """Parse options text that the options flow has already validated."""
+    try:
+        return parse_overrides(text)
+    except ValueError:
+        _LOGGER.warning("Ignoring malformed register overrides: %s", text)
+        return {}
+
+
 def _decode(spec: RegisterSpec, registers: list[int]) -> float | int | None:
     if spec.data_type == "float32":
         if len(registers) < 2:
@@ -259,6 +1026,37 @@ def _decode(spec: RegisterSpec, registers: list[int]) -> float | int | None:
     return None
 
 
+_FLOAT32 = struct.Struct(">f")
+_UINT32 = struct.Struct(">I")
+_UINT16 = struct.Struct(">H")
+
+
+def _decode_batch(batch: RegisterBatch, payload: bytes) -> list[tuple[RegisterSpec, float | int | None]]:
+    """Decode a whole batch in one unpack, falling back to spec by spec."""
+    decoder = batch.decoder
+    decoded = decoder.decode(payload) if decoder is not None else None
+    if decoded is not None:
+        return decoded
+    return [(spec, _decode_payload(spec, payload, (spec.address - batch.start) * 2)) for spec in batch.specs]
+
+
+def _decode_payload(spec: RegisterSpec, payload: bytes, offset: int) -> float | int | None:
+    """Decode a spec from big-endian response bytes, ``offset`` bytes into the batch."""
+    if spec.data_type == "float32":
+        if len(payload) < offset + 4:
+            return None
+        return _FLOAT32.unpack_from(payload, offset)[0]
+    if spec.data_type == "uint32":
+        if len(payload) < offset + 4:
+            return None
+        return _UINT32.unpack_from(payload, offset)[0]
+    if spec.data_type in {"uint16", "hex16"}:
+        if len(payload) < offset + 2:
+            return None
+        return _UINT16.unpack_from(payload, offset)[0]
+    return None
+
+
 def _encode_value(spec: RegisterSpec, value: float | int) -> int | list[int]:
     """Encode a value into register format based on data type.
     
@@ -0,0 +1,50 @@
+"""Whole-batch register decoding compiled once per read batch."""
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .models.base import RegisterSpec
+
+_FIELD_FORMATS = {"float32": "f", "uint32": "I", "uint16": "H", "hex16": "H"}
+
+
+@dataclass(frozen=True, slots=True)
+class BatchDecoder:
+    """One struct layout unpacking every spec of a batch in a single call.
+
+    Gaps between specs are pad bytes, so the unpacked tuple holds exactly one
+    value per spec, in ``specs`` order.
+    """
+
+    layout: struct.Struct
+    specs: tuple[RegisterSpec, ...]
+
+    def decode(self, payload: bytes) -> list[tuple[RegisterSpec, float | int]] | None:
+        """Decode a whole response, or None if it is shorter than the layout."""
+        if len(payload) < self.layout.size:
+            return None
+        return list(zip(self.specs, self.layout.unpack_from(payload)))
+
+
+def compile_batch_decoder(start: int, specs: Iterable[RegisterSpec]) -> BatchDecoder | None:
+    """Compile the layout of a batch starting at ``start``.
+
+    Returns None when specs overlap or use a type one layout cannot express;
+    callers then decode spec by spec.
+    """
+    ordered = tuple(sorted(specs, key=lambda spec: spec.address))
+    if not ordered:
+        return None
+    parts = [">"]
+    cursor = start
+    for spec in ordered:
+        code = _FIELD_FORMATS.get(spec.data_type)
+        if code is None or spec.address < cursor or struct.calcsize(code) != spec.length * 2:
+            return None
+        if spec.address > cursor:
+            parts.append(f"{(spec.address - cursor) * 2}x")
+        parts.append(code)
+        cursor = spec.address + spec.length
+    return BatchDecoder(layout=struct.Struct("".join(parts)), specs=ordered)
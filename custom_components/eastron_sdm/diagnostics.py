@@ -0,0 +1,24 @@
+"""Diagnostics support for Eastron SDM integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_HOST
+from .coordinator import SdmCoordinator
+from .startup import DATA_SETUP_TIME
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return polling diagnostics for a config entry."""
+    coordinator: SdmCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    return {
+        "entry": async_redact_data({**entry.data, **entry.options}, TO_REDACT),
+        "polling": coordinator.diagnostics(),
+        "integration_setup_time": hass.data[DOMAIN].get(DATA_SETUP_TIME),
+    }
@@ -0,0 +1,58 @@
+"""Learned per-meter exclusion maps, kept across restarts by meter serial."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, EXCLUSIONS_STORAGE_VERSION
+from .read_plan import ExclusionMap
+
+DATA_EXCLUSIONS = "exclusions"
+_SAVE_DELAY = 10  # seconds; bisection of one cycle usually learns several entries
+
+
+class ExclusionRegistry:
+    """Exclusion maps of every meter in one ``Store`` file, keyed by serial.
+
+    A meter moved to another gateway or unit id keeps the layout it taught.
+    Each map carries the wall-clock time it expires at; the owning coordinator
+    clears it then and bisection learns again whatever is still rejected.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, EXCLUSIONS_STORAGE_VERSION, f"{DOMAIN}.exclusions")
+        self._maps: dict[str, dict[str, Any]] | None = None
+        self._load_lock = asyncio.Lock()
+
+    async def async_get(self, serial: str) -> tuple[ExclusionMap, float]:
+        """The serial's map and the time.time() it expires at (0 for an empty map)."""
+        data = (await self._async_maps()).get(serial, {})
+        return ExclusionMap.from_dict(data), float(data.get("expires_at", 0.0))
+
+    async def async_set(self, serial: str, exclusions: ExclusionMap, expires_at: float) -> None:
+        maps = await self._async_maps()
+        maps[serial] = {**exclusions.as_dict(), "expires_at": expires_at}
+        self._store.async_delay_save(lambda: maps, _SAVE_DELAY)
+
+    @callback
+    def async_clear(self, serial: str) -> None:
+        if self._maps is not None and self._maps.pop(serial, None) is not None:
+            maps = self._maps
+            self._store.async_delay_save(lambda: maps, _SAVE_DELAY)
+
+    async def _async_maps(self) -> dict[str, dict[str, Any]]:
+        async with self._load_lock:
+            if self._maps is None:
+                self._maps = await self._store.async_load() or {}
+        return self._maps
+
+
+@callback
+def async_get_exclusion_registry(hass: HomeAssistant) -> ExclusionRegistry:
+    data = hass.data.setdefault(DOMAIN, {})
+    if DATA_EXCLUSIONS not in data:
+        data[DATA_EXCLUSIONS] = ExclusionRegistry(hass)
+    return data[DATA_EXCLUSIONS]
@@ -0,0 +1,186 @@
+"""Per-gateway shared Modbus transports for Eastron SDM config entries."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .client import SdmModbusClient, SdmUnitClient
+from .const import DOMAIN, FRAMER_RTU_OVER_TCP
+
+if TYPE_CHECKING:
+    from .coordinator import PollCycle, SdmCoordinator
+    from .read_plan import RegisterBatch
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_GATEWAYS = "gateways"
+
+
+@dataclass(slots=True)
+class SharedGateway:
+    """One connection and request queue shared by every meter on a gateway."""
+
+    client: SdmModbusClient
+    # Transport options of the entry that opened the connection: (framer, pipeline window, native codec).
+    transport_options: tuple[str, int, bool]
+    entry_ids: set[str] = field(default_factory=set)
+    scheduler: SdmGatewayCoordinator | None = None
+
+
+class SdmGatewayCoordinator(DataUpdateCoordinator[None]):
+    """Drive meter polling for every member unit id on one gateway from one schedule.
+
+    Members give up their own timers. Each tick the gateway plans a cycle for
+    every member that is due, interleaves their batches round-robin so the bus
+    is used back to back, and publishes each member's data to its entities.
+    """
+
+    def __init__(self, hass: HomeAssistant, host: str, port: int) -> None:
+        super().__init__(hass, _LOGGER, name=f"SDM gateway {host}:{port}", update_interval=None)
+        self.members: dict[str, SdmCoordinator] = {}
+        self.bus_utilisation = 0.0
+        self._last_tick: float | None = None
+
+    @callback
+    def async_add_member(self, member: SdmCoordinator) -> CALLBACK_TYPE:
+        """Take over polling of ``member``; the returned callback hands it back."""
+        self.members[member.entry.entry_id] = member
+        self._update_interval_from_members()
+        # Members hold a listener so the gateway timer only runs while it has meters.
+        remove_listener = self.async_add_listener(lambda: None)
+
+        @callback
+        def _remove_member() -> None:
+            self.members.pop(member.entry.entry_id, None)
+            remove_listener()
+            self._update_interval_from_members()
+
+        return _remove_member
+
+    def _update_interval_from_members(self) -> None:
+        if not self.members:
+            self.update_interval = None
+            return
+        self.update_interval = timedelta(seconds=min(member.scan_interval for member in self.members.values()))
+
+    async def _async_update_data(self) -> None:
+        now = time.monotonic()
+        tick = self.update_interval.total_seconds() if self.update_interval else 0.0
+        pending: deque[tuple[SdmCoordinator, PollCycle, deque[RegisterBatch]]] = deque()
+        errors: dict[str, Exception] = {}
+        for member in list(self.members.values()):
+            # Half a tick of slack keeps members with longer intervals from drifting a tick late.
+            if member.next_due - tick / 2 > now:
+                continue
+            if (error := member.circuit_open_error(now)) is not None:
+                member.async_set_update_error(error)
+                continue
+            cycle = member.begin_cycle(now)
+            pending.append((member, cycle, deque(cycle.plan.batches)))
+        cycles = [(member, cycle) for member, cycle, _ in pending]
+
+        busy = 0.0
+        if pending and pending[0][0].pipelined:
+            # The transport keeps several requests in flight; issue every member's batches at once.
+            started = time.monotonic()
+            results = await asyncio.gather(
+                *(member.async_read_batches(cycle, batches) for member, cycle, batches in pending),
+                return_exceptions=True,
+            )
+            busy = time.monotonic() - started
+            pending.clear()
+            for (member, _cycle), result in zip(cycles, results):
+                if isinstance(result, Exception):
+                    errors[member.entry.entry_id] = result
+        elif pending:
+            started = time.monotonic()
+            while pending:
+                # Batches fail on their own (see SdmCoordinator.async_read_batch), so a bad one never stalls the rest.
+                member, cycle, batches = pending.popleft()
+                if batches:
+                    await member.async_read_batch(cycle, batches.popleft())
+                    pending.append((member, cycle, batches))
+            # Retries wait until every member had its turn at the bus.
+            for member, cycle in cycles:
+                await member.async_retry_failed(cycle)
+            busy = time.monotonic() - started
+
+        for member, cycle in cycles:
+            member.finish_cycle(cycle, errors.get(member.entry.entry_id))
+
+        elapsed = now - self._last_tick if self._last_tick is not None else tick
+        self.bus_utilisation = min(1.0, busy / elapsed) if elapsed > 0 else 0.0
+        self._last_tick = now
+        self._update_interval_from_members()
+
+
+def _gateways(hass: HomeAssistant) -> dict[tuple[str, int], SharedGateway]:
+    return hass.data.setdefault(DOMAIN, {}).setdefault(DATA_GATEWAYS, {})
+
+
+def async_acquire_client(
+    hass: HomeAssistant,
+    entry_id: str,
+    host: str,
+    port: int,
+    unit_id: int,
+    *,
+    framer: str = FRAMER_RTU_OVER_TCP,
+    pipeline_window: int = 1,
+    native_codec: bool = False,
+) -> SdmUnitClient:
+    """Return a unit-bound client on the shared transport for (host, port).
+
+    The first entry on a gateway decides its framer, pipeline window and codec.
+    """
+    gateways = _gateways(hass)
+    gateway = gateways.get((host, port))
+    options = (framer, pipeline_window, native_codec)
+    if gateway is None:
+        client = SdmModbusClient(
+            host, port, unit_id, framer=framer, pipeline_window=pipeline_window, native_codec=native_codec
+        )
+        gateway = gateways[(host, port)] = SharedGateway(client=client, transport_options=options)
+    elif entry_id not in gateway.entry_ids:
+        _LOGGER.debug("Sharing gateway %s:%s with %s other entries", host, port, len(gateway.entry_ids))
+        if options != gateway.transport_options:
+            _LOGGER.warning(
+                "Gateway %s:%s is already open with framer %s, pipeline window %s and native codec %s; "
+                "ignoring framer %s, pipeline window %s and native codec %s of unit %s",
+                host,
+                port,
+                *gateway.transport_options,
+                *options,
+                unit_id,
+            )
+    gateway.entry_ids.add(entry_id)
+    return SdmUnitClient(gateway.client, unit_id)
+
+
+async def async_release_client(hass: HomeAssistant, entry_id: str, host: str, port: int) -> None:
+    """Drop an entry's use of a gateway; the connection closes with its last user."""
+    gateways = _gateways(hass)
+    gateway = gateways.get((host, port))
+    if gateway is None:
+        return
+    gateway.entry_ids.discard(entry_id)
+    if not gateway.entry_ids:
+        del gateways[(host, port)]
+        await gateway.client.close()
+
+
+@callback
+def async_join_schedule(hass: HomeAssistant, member: SdmCoordinator) -> tuple[SdmGatewayCoordinator, CALLBACK_TYPE]:
+    """Hand a meter's polling over to the shared schedule of its gateway."""
+    gateway = _gateways(hass)[(member.host, member.port)]
+    if gateway.scheduler is None:
+        gateway.scheduler = SdmGatewayCoordinator(hass, member.host, member.port)
+    return gateway.scheduler, gateway.scheduler.async_add_member(member)
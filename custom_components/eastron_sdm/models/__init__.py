@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict, List
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping
 
 from ..const import MODEL_SDM120M, MODEL_SDM630M
 from .base import RegisterSpec
@@ -16,18 +19,52 @@ _MODEL_LOADERS: Dict[str, Callable[[], List[RegisterSpec]]] = {
 }
 
 
-def get_model_specs(model: str) -> List[RegisterSpec]:
-	"""Return RegisterSpec list for the requested model (defaults to SDM120M)."""
+@dataclass(frozen=True, slots=True)
+class ModelSpecTable:
+	"""Register table of one model, built once and shared by every entry."""
 
-	loader = _MODEL_LOADERS.get(model, get_sdm120_specs)
-	return loader()
+	model: str
+	specs: tuple[RegisterSpec, ...]
+	by_key: Mapping[str, RegisterSpec]
+	by_address: Mapping[tuple[str, int], RegisterSpec]  # (function, address)
+	by_category: Mapping[str, tuple[RegisterSpec, ...]]
+	by_tier: Mapping[str, tuple[RegisterSpec, ...]]
+
+
+def get_model_table(model: str) -> ModelSpecTable:
+	"""Return the indexed spec table of a model (unknown models get SDM120M's)."""
+
+	return _build_table(model if model in _MODEL_LOADERS else MODEL_SDM120M)
+
+
+@lru_cache(maxsize=None)
+def _build_table(model: str) -> ModelSpecTable:
+	specs = tuple(_MODEL_LOADERS[model]())
+	by_category: Dict[str, List[RegisterSpec]] = {}
+	by_tier: Dict[str, List[RegisterSpec]] = {}
+	for spec in specs:
+		by_category.setdefault(spec.category, []).append(spec)
+		by_tier.setdefault(spec.tier, []).append(spec)
+	return ModelSpecTable(
+		model=model,
+		specs=specs,
+		by_key=MappingProxyType({spec.key: spec for spec in specs}),
+		by_address=MappingProxyType({(spec.function, spec.address): spec for spec in specs}),
+		by_category=MappingProxyType({name: tuple(group) for name, group in by_category.items()}),
+		by_tier=MappingProxyType({name: tuple(group) for name, group in by_tier.items()}),
+	)
+
+
+def get_model_specs(model: str) -> tuple[RegisterSpec, ...]:
+	"""Return RegisterSpecs for the requested model (defaults to SDM120M)."""
+
+	return get_model_table(model).specs
 
 
 def get_spec_by_key(model: str, key: str) -> RegisterSpec:
 	"""Lookup a RegisterSpec by key for the given model."""
 
-	specs = get_model_specs(model)
-	for spec in specs:
-		if spec.key == key:
-			return spec
-	raise ValueError(f"No spec found for model={model} key={key}")
+	spec = get_model_table(model).by_key.get(key)
+	if spec is None:
+		raise ValueError(f"No spec found for model={model} key={key}")
+	return spec
@@ -3,6 +3,29 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+IDENTITY_MAX_AGE = 86400.0  # identity registers only need refreshing once a day
+
+
+@dataclass(frozen=True, slots=True)
+class Deadband:
+    """Smallest change worth publishing, in register units or as a share of the last value."""
+
+    absolute: float = 0.0
+    relative: float = 0.0
+
+
+# Significant-change thresholds per device class; specs may override with ``deadband``.
+# Energy counters have none: every increment is published.
+DEFAULT_DEADBANDS: dict[str, Deadband] = {
+    "voltage": Deadband(absolute=0.2),
+    "current": Deadband(absolute=0.01, relative=0.005),
+    "power": Deadband(absolute=1.0, relative=0.005),
+    "apparent_power": Deadband(absolute=1.0, relative=0.005),
+    "reactive_power": Deadband(absolute=1.0, relative=0.005),
+    "power_factor": Deadband(absolute=0.005),
+    "frequency": Deadband(absolute=0.01),
+}
+
 
 @dataclass(frozen=True, slots=True)
 class RegisterSpec:
@@ -23,4 +46,6 @@ class RegisterSpec:
     min_value: float | None = None  # for number controls
     max_value: float | None = None  # for number controls
     step: float | None = None  # for number controls
-    mode: str | None = None  # for number controls: 'auto' | 'slider' | 'box'
\ No newline at end of file
+    mode: str | None = None  # for number controls: 'auto' | 'slider' | 'box'
+    max_age: float | None = None  # seconds; overrides the tier cadence in deadline scheduling
+    deadband: Deadband | None = None  # overrides the device class default deadband
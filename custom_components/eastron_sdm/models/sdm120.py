@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Final
 
-from .base import RegisterSpec
+from .base import IDENTITY_MAX_AGE, RegisterSpec
 
 BASE_SDM120_SPECS: Final[list[RegisterSpec]] = [
     # FAST tier (every base cycle)
@@ -75,14 +75,17 @@ BASE_SDM120_SPECS: Final[list[RegisterSpec]] = [
     RegisterSpec(
         key="serial_number", address=64512, length=2, function="holding", data_type="uint32", unit=None,
         device_class=None, state_class=None, category="diagnostic", tier="slow", enabled_default=False,
+        max_age=IDENTITY_MAX_AGE,
     ),
     RegisterSpec(
         key="meter_code", address=64514, length=1, function="holding", data_type="uint16", unit=None,
         device_class=None, state_class=None, category="diagnostic", tier="slow", enabled_default=False,
+        max_age=IDENTITY_MAX_AGE,
     ),
     RegisterSpec(
         key="software_version", address=64515, length=1, function="holding", data_type="uint16", unit=None,
         device_class=None, state_class=None, category="diagnostic", tier="slow", enabled_default=False,
+        max_age=IDENTITY_MAX_AGE,
     ),
 
     # Diagnostic (disabled by default)
@@ -92,6 +95,8 @@ BASE_SDM120_SPECS: Final[list[RegisterSpec]] = [
     ),
 ]
 
+_SPECS_BY_KEY = {spec.key: spec for spec in BASE_SDM120_SPECS}
+
 
 def _get_spec_by_key(key: str) -> RegisterSpec:
     """Get a register spec by its key.
@@ -105,10 +110,10 @@ def _get_spec_by_key(key: str) -> RegisterSpec:
     Raises:
         ValueError: If no spec found for the given key.
     """
-    for spec in BASE_SDM120_SPECS:
-        if spec.key == key:
-            return spec
-    raise ValueError(f"No spec found for key: {key}")
+    spec = _SPECS_BY_KEY.get(key)
+    if spec is None:
+        raise ValueError(f"No spec found for key: {key}")
+    return spec
 
 
 def get_register_specs() -> list[RegisterSpec]:
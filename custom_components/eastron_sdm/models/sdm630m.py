@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Final, List
 
-from .base import RegisterSpec
+from .base import IDENTITY_MAX_AGE, RegisterSpec
 
 SDM630_SPECS: Final[List[RegisterSpec]] = [
     # FAST tier - per-phase measurements
@@ -169,6 +169,7 @@ SDM630_SPECS: Final[List[RegisterSpec]] = [
     RegisterSpec(
         key="serial_number", address=64513, length=2, function="holding", data_type="uint32", unit=None,
         device_class=None, state_class=None, category="diagnostic", tier="slow", enabled_default=False,
+        max_age=IDENTITY_MAX_AGE,
     ),
 
     # Config - writable
@@ -1,6 +1,8 @@
 """Number platform for writable SDM config registers."""
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
@@ -9,7 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, CONF_MODEL, DEFAULT_MODEL
 from .coordinator import SdmCoordinator, DecodedValue, _encode_value
-from .models import RegisterSpec, get_model_specs
+from .models import RegisterSpec, get_model_table
 from .shared_base import SdmBaseEntity
 
 
@@ -24,7 +26,7 @@ class SdmConfigNumber(SdmBaseEntity, NumberEntity):
         unique_id = coordinator.build_unique_id(spec.key)
         # Suggest object_id to avoid "none" suffix if translations are late
         self._attr_suggested_object_id = spec.key
-        super().__init__(coordinator, entry, unique_id=unique_id, translation_key=spec.key)
+        super().__init__(coordinator, entry, unique_id=unique_id, translation_key=spec.key, context=spec.key)
         self._spec = spec
         self._attr_entity_registry_enabled_default = spec.enabled_default
         self._attr_native_unit_of_measurement = spec.unit
@@ -34,7 +36,7 @@ class SdmConfigNumber(SdmBaseEntity, NumberEntity):
         self._attr_mode = spec.mode or NumberMode.AUTO
 
     def _current_value(self) -> float | int | None:
-        data: dict[str, DecodedValue] = self.coordinator.data or {}
+        data: Mapping[str, DecodedValue] = self.coordinator.data or {}
         dv: DecodedValue | None = data.get(self._spec.key)
         if not dv:
             return None
@@ -59,11 +61,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     entry_data = {**entry.data, **entry.options}
     model = entry_data.get(CONF_MODEL, DEFAULT_MODEL)
-    specs = get_model_specs(model)
+    specs = get_model_table(model).by_category.get("config", ())
     entities = [
         SdmConfigNumber(coordinator, entry, spec)
         for spec in specs
-        if spec.category == "config" and spec.control == "number"
+        if spec.control == "number"
     ]
     if entities:
         async_add_entities(entities)
@@ -0,0 +1,53 @@
+"""Parsing of per-register overrides entered as text in the options flow."""
+from __future__ import annotations
+
+from dataclasses import replace
+
+from .models.base import Deadband
+
+
+def parse_overrides(text: str | None) -> dict[str, float]:
+    """Parse ``"key=value"`` pairs separated by commas or newlines.
+
+    Raises ValueError on malformed entries so the options flow can reject them.
+    """
+    return {key: float(value) for key, value in _pairs(text)}
+
+
+def parse_deadbands(text: str | None) -> dict[str, Deadband]:
+    """Parse deadband overrides such as ``"voltage=0.5, active_power_l1=2%"``.
+
+    Keys are register keys or device classes. Plain values are absolute, values
+    ending in ``%`` relative; a key may be given once of each.
+    """
+    deadbands: dict[str, Deadband] = {}
+    for key, value in _pairs(text):
+        current = deadbands.get(key, Deadband())
+        if value.endswith("%"):
+            deadbands[key] = replace(current, relative=_non_negative(value[:-1]) / 100)
+        else:
+            deadbands[key] = replace(current, absolute=_non_negative(value))
+    return deadbands
+
+
+def _pairs(text: str | None) -> list[tuple[str, str]]:
+    pairs: list[tuple[str, str]] = []
+    if not text:
+        return pairs
+    for item in text.replace("\n", ",").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        key, sep, value = item.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            raise ValueError(f"Expected key=value, got {item!r}")
+        pairs.append((key, value.strip()))
+    return pairs
+
+
+def _non_negative(value: str) -> float:
+    number = float(value)
+    if number < 0:
+        raise ValueError(f"Deadband must not be negative, got {value!r}")
+    return number
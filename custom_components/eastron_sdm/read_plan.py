@@ -1,11 +1,71 @@
 """Meter polling read plan construction."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping
 
+from .const import MODBUS_MAX_READ_REGISTERS
+from .decoder import BatchDecoder, compile_batch_decoder
 from .models import RegisterSpec
 
+# Registers expiring within this share of their max-age may ride along with due ones.
+NEARLY_DUE_FRACTION = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionCostModel:
+    """Estimated bus cost of a Modbus read, used to decide when to bridge gaps."""
+
+    request_ms: float = 60.0  # fixed round trip cost of one transaction
+    register_ms: float = 2.0  # marginal cost of one extra 16-bit register
+
+    def worth_bridging(self, gap: int) -> bool:
+        return gap * self.register_ms < self.request_ms
+
+
+@dataclass(frozen=True, slots=True)
+class ExclusionMap:
+    """Register layout a meter rejects, learned by bisecting reads it answered with exception 02.
+
+    ``ranges`` are (function, start, end) register spans that must never be
+    read; specs overlapping one are left out and batches never bridge across
+    one. ``splits`` are (function, address) pairs a batch must start at.
+    """
+
+    ranges: frozenset[tuple[str, int, int]] = frozenset()
+    splits: frozenset[tuple[str, int]] = frozenset()
+
+    def __bool__(self) -> bool:
+        return bool(self.ranges or self.splits)
+
+    def excludes(self, spec: RegisterSpec) -> bool:
+        return any(
+            function == spec.function and start < spec.address + spec.length and spec.address < end
+            for function, start, end in self.ranges
+        )
+
+    def blocks(self, function: str, end: int, address: int) -> bool:
+        """Whether a batch ending at ``end`` may not grow to a spec at ``address``."""
+        if (function, address) in self.splits:
+            return True
+        return any(
+            range_function == function and start < address and end < range_end
+            for range_function, start, range_end in self.ranges
+        )
+
+    def merged(self, other: ExclusionMap) -> ExclusionMap:
+        return ExclusionMap(ranges=self.ranges | other.ranges, splits=self.splits | other.splits)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"ranges": sorted(self.ranges), "splits": sorted(self.splits)}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ExclusionMap:
+        return cls(
+            ranges=frozenset((str(f), int(s), int(e)) for f, s, e in data.get("ranges", ())),
+            splits=frozenset((str(f), int(a)) for f, a in data.get("splits", ())),
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class ReadPlanOptions:
@@ -15,6 +75,19 @@ class ReadPlanOptions:
     enable_config: bool = False
     normal_divisor: int = 3
     slow_divisor: int = 30
+    coalesce_gaps: bool = False
+    request_cost_ms: float = 60.0
+    register_cost_ms: float = 2.0
+    max_batch_length: int = MODBUS_MAX_READ_REGISTERS
+    level_tiers: bool = False
+    excluded_keys: frozenset[str] = frozenset()  # registers of entities disabled in the registry
+    exclusions: ExclusionMap = ExclusionMap()  # registers the meter rejects; never read
+
+    @property
+    def cost_model(self) -> TransactionCostModel | None:
+        if not self.coalesce_gaps:
+            return None
+        return TransactionCostModel(request_ms=self.request_cost_ms, register_ms=self.register_cost_ms)
 
 
 @dataclass(slots=True)
@@ -23,24 +96,178 @@ class RegisterBatch:
     length: int
     function: str
     specs: list[RegisterSpec]
+    padding: int = 0  # registers read only to bridge gaps between specs
+    bridged: int = 0  # gaps bridged, i.e. transactions saved by this batch
+    _decoder: BatchDecoder | None | bool = field(default=False, init=False, repr=False, compare=False)
+
+    @property
+    def decoder(self) -> BatchDecoder | None:
+        """Whole-batch decoder compiled on first use; None when specs overlap."""
+        if self._decoder is False:
+            self._decoder = compile_batch_decoder(self.start, self.specs)
+        return self._decoder  # type: ignore[return-value]
 
 
 @dataclass(slots=True)
 class ReadPlan:
     batches: list[RegisterBatch]
     next_cycle: int
+    saved_transactions: int = 0
 
 
 def build_read_plan(specs: Iterable[RegisterSpec], options: ReadPlanOptions, cycle: int) -> ReadPlan:
-    included_specs = [spec for spec in specs if should_include_spec(spec, options)]
-    specs_to_read = [spec for spec in included_specs if spec.tier == "fast"]
-    if cycle % options.normal_divisor == 0:
-        specs_to_read.extend(spec for spec in included_specs if spec.tier == "normal")
-    if cycle % options.slow_divisor == 0:
-        specs_to_read.extend(spec for spec in included_specs if spec.tier == "slow")
+    return ReadPlanCache(specs, options).plan_for(cycle)
+
+
+class ReadPlanCache:
+    """Read plans precompiled for every phase of one full tier cycle.
+
+    Normal and slow tier specs are split into groups, each due at one phase
+    offset of its divisor. Without tier levelling every group sits at offset 0.
+    A plan then only depends on which offsets the cycle hits, so the distinct
+    batch layouts are few; they are built once per (specs, options) and shared
+    by every poll. Callers must not mutate the returned batches.
+    """
+
+    def __init__(self, specs: Iterable[RegisterSpec], options: ReadPlanOptions) -> None:
+        self.options = options
+        self._included = [spec for spec in specs if should_include_spec(spec, options)]
+        self._fast = [spec for spec in self._included if spec.tier == "fast"]
+        self._normal = self._tier_offsets("normal", options.normal_divisor)
+        self._slow = self._tier_offsets("slow", options.slow_divisor)
+        self._plans: dict[tuple[int | None, int | None], tuple[list[RegisterBatch], int]] = {}
 
-    next_cycle = (cycle + 1) % (options.normal_divisor * options.slow_divisor)
-    return ReadPlan(batches=build_register_batches(specs_to_read), next_cycle=next_cycle)
+    def plan_for(self, cycle: int) -> ReadPlan:
+        options = self.options
+        normal_phase = cycle % options.normal_divisor
+        slow_phase = cycle % options.slow_divisor
+        key = (
+            normal_phase if normal_phase in self._normal else None,
+            slow_phase if slow_phase in self._slow else None,
+        )
+        cached = self._plans.get(key)
+        if cached is None:
+            specs_to_read = list(self._fast)
+            specs_to_read.extend(self._normal.get(key[0], ()))
+            specs_to_read.extend(self._slow.get(key[1], ()))
+            cached = self._plans[key] = self._batch(specs_to_read)
+        batches, saved = cached
+        return ReadPlan(batches=batches, next_cycle=_next_cycle(options, cycle), saved_transactions=saved)
+
+    def full_plan(self) -> ReadPlan:
+        """Plan reading every included spec at once, e.g. to populate data on startup."""
+        batches, saved = self._batch(self._included)
+        return ReadPlan(batches=batches, next_cycle=0, saved_transactions=saved)
+
+    def _batch(self, specs: list[RegisterSpec]) -> tuple[list[RegisterBatch], int]:
+        options = self.options
+        batches = build_register_batches(specs, options.cost_model, options.max_batch_length, options.exclusions)
+        batches = prune_batches(batches, options.excluded_keys)
+        return batches, sum(batch.bridged for batch in batches)
+
+    def _tier_offsets(self, tier: str, divisor: int) -> dict[int, list[RegisterSpec]]:
+        """Map phase offsets to the tier specs due at that offset."""
+        tier_specs = [spec for spec in self._included if spec.tier == tier]
+        if not tier_specs:
+            return {}
+        if not self.options.level_tiers:
+            return {0: tier_specs}
+        # Spread the tier's batches over the divisor period, heaviest first onto the
+        # least loaded phase, so each cycle carries a similar share of bus time.
+        cost = self.options.cost_model or TransactionCostModel()
+        groups = build_register_batches(
+            tier_specs, self.options.cost_model, self.options.max_batch_length, self.options.exclusions
+        )
+        groups.sort(key=lambda batch: batch.length, reverse=True)
+        load = [0.0] * divisor
+        offsets: dict[int, list[RegisterSpec]] = {}
+        for group in groups:
+            phase = min(range(divisor), key=load.__getitem__)
+            load[phase] += cost.request_ms + group.length * cost.register_ms
+            offsets.setdefault(phase, []).extend(group.specs)
+        return offsets
+
+
+class DeadlineScheduler:
+    """Earliest-deadline-first alternative to the fixed fast/normal/slow tiers.
+
+    Each included register has a max-age: an override, the spec's own ``max_age``,
+    or its tier cadence. A poll reads every register that would exceed its
+    max-age before the next poll, plus nearly-due registers that land in the same
+    batches, so each register is read about as rarely as its budget allows.
+    """
+
+    def __init__(
+        self,
+        specs: Iterable[RegisterSpec],
+        options: ReadPlanOptions,
+        interval: float,
+        max_age_overrides: Mapping[str, float] | None = None,
+    ) -> None:
+        self.options = options
+        self.interval = interval
+        self.max_age_overrides = dict(max_age_overrides or {})
+        self._specs = [spec for spec in specs if should_include_spec(spec, options)]
+        self.max_ages = {
+            spec.key: self.max_age_overrides.get(spec.key) or spec.max_age or _tier_max_age(spec, options, interval)
+            for spec in self._specs
+        }
+        self.base_max_ages = dict(self.max_ages)
+        # Registers whose max-age was set explicitly rather than derived from the tier.
+        self.fixed_keys = frozenset(
+            spec.key for spec in self._specs if spec.key in self.max_age_overrides or spec.max_age
+        )
+        self._last_read: dict[str, float] = {}
+
+    def plan(self, now: float) -> ReadPlan:
+        horizon = now + self.interval
+        due: list[RegisterSpec] = []
+        nearly_due: list[RegisterSpec] = []
+        for spec in self._specs:
+            last_read = self._last_read.get(spec.key)
+            if last_read is None:
+                due.append(spec)
+                continue
+            max_age = self.max_ages[spec.key]
+            deadline = last_read + max_age
+            if deadline < horizon:
+                due.append(spec)
+            elif deadline < horizon + max_age * NEARLY_DUE_FRACTION:
+                nearly_due.append(spec)
+        if not due:
+            return ReadPlan(batches=[], next_cycle=0)
+        due_keys = {spec.key for spec in due if spec.key not in self.options.excluded_keys}
+        batches = [
+            batch
+            for batch in prune_batches(
+                build_register_batches(
+                    due + nearly_due, self.options.cost_model, self.options.max_batch_length, self.options.exclusions
+                ),
+                self.options.excluded_keys,
+            )
+            if any(spec.key in due_keys for spec in batch.specs)
+        ]
+        return ReadPlan(batches=batches, next_cycle=0, saved_transactions=sum(batch.bridged for batch in batches))
+
+    def mark_read(self, keys: Iterable[str], now: float) -> None:
+        for key in keys:
+            self._last_read[key] = now
+
+    def carry_over(self, previous: DeadlineScheduler) -> None:
+        """Keep read times from a scheduler replaced after an options change."""
+        self._last_read.update(previous._last_read)
+
+
+def _tier_max_age(spec: RegisterSpec, options: ReadPlanOptions, interval: float) -> float:
+    if spec.tier == "normal":
+        return interval * options.normal_divisor
+    if spec.tier == "slow":
+        return interval * options.slow_divisor
+    return interval
+
+
+def _next_cycle(options: ReadPlanOptions, cycle: int) -> int:
+    return (cycle + 1) % (options.normal_divisor * options.slow_divisor)
 
 
 def should_include_spec(spec: RegisterSpec, options: ReadPlanOptions) -> bool:
@@ -52,10 +279,20 @@ def should_include_spec(spec: RegisterSpec, options: ReadPlanOptions) -> bool:
         return False
     if spec.category == "two-way" and not options.enable_two_way:
         return False
-    return True
+    return not options.exclusions.excludes(spec)
+
 
+def build_register_batches(
+    specs: Iterable[RegisterSpec],
+    cost_model: TransactionCostModel | None = None,
+    max_length: int = MODBUS_MAX_READ_REGISTERS,
+    exclusions: ExclusionMap | None = None,
+) -> list[RegisterBatch]:
+    """Group specs into batches; without a cost model only contiguous specs merge.
 
-def build_register_batches(specs: Iterable[RegisterSpec]) -> list[RegisterBatch]:
+    Batches never exceed ``max_length`` registers and are only split between
+    specs. With ``exclusions`` they also never span a rejected range or split.
+    """
     ordered = sorted(specs, key=lambda spec: (spec.function, spec.address))
     batches: list[RegisterBatch] = []
     current: RegisterBatch | None = None
@@ -65,12 +302,68 @@ def build_register_batches(specs: Iterable[RegisterSpec]) -> list[RegisterBatch]
             continue
         end = current.start + current.length
         gap = spec.address - end
-        if spec.function == current.function and gap <= 0:
-            current.length = (spec.address + spec.length) - current.start
+        merged_length = max(end, spec.address + spec.length) - current.start
+        if (
+            spec.function == current.function
+            and merged_length <= max_length
+            and (gap <= 0 or (cost_model is not None and cost_model.worth_bridging(gap)))
+            and not (exclusions and exclusions.blocks(spec.function, end, spec.address))
+        ):
+            current.length = merged_length
             current.specs.append(spec)
+            if gap > 0:
+                current.padding += gap
+                current.bridged += 1
         else:
             batches.append(current)
             current = RegisterBatch(start=spec.address, length=spec.length, function=spec.function, specs=[spec])
     if current:
         batches.append(current)
     return batches
+
+
+def prune_batches(batches: list[RegisterBatch], excluded_keys: frozenset[str]) -> list[RegisterBatch]:
+    """Drop excluded registers only where that saves transactions or bytes.
+
+    Batches holding nothing but excluded registers are dropped and excluded
+    registers at a batch's edges are trimmed. Excluded registers inside a
+    batch stay: they would still be read as padding, and without them the
+    batch could split into more transactions.
+    """
+    if not excluded_keys:
+        return batches
+    pruned: list[RegisterBatch] = []
+    for batch in batches:
+        wanted = [spec for spec in batch.specs if spec.key not in excluded_keys]
+        if not wanted:
+            continue
+        if len(wanted) == len(batch.specs):
+            pruned.append(batch)
+            continue
+        start = min(spec.address for spec in wanted)
+        end = max(spec.address + spec.length for spec in wanted)
+        pruned.append(
+            span_batch([spec for spec in batch.specs if spec.address >= start and spec.address + spec.length <= end])
+        )
+    return pruned
+
+
+def span_batch(specs: Iterable[RegisterSpec]) -> RegisterBatch:
+    """One batch spanning ``specs`` of a single function, bridging every gap between them."""
+    ordered = sorted(specs, key=lambda spec: spec.address)
+    start = ordered[0].address
+    padding = bridged = 0
+    covered = start
+    for spec in ordered:
+        if spec.address > covered:
+            padding += spec.address - covered
+            bridged += 1
+        covered = max(covered, spec.address + spec.length)
+    return RegisterBatch(
+        start=start,
+        length=covered - start,
+        function=ordered[0].function,
+        specs=ordered,
+        padding=padding,
+        bridged=bridged,
+    )
@@ -0,0 +1,113 @@
+"""High-rate register sampling aggregated into windows published at a lower rate."""
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .const import MODBUS_MAX_READ_REGISTERS
+from .models import RegisterSpec
+from .read_plan import ExclusionMap, RegisterBatch, TransactionCostModel, build_register_batches
+
+WINDOW_STATISTICS = ("min", "max", "mean", "last")
+
+
+class RingBuffer:
+    """Fixed-capacity sample buffer in a preallocated ``array('d')``; oldest samples drop first."""
+
+    __slots__ = ("values", "count", "_next")
+
+    def __init__(self, capacity: int) -> None:
+        self.values = array("d", [math.nan]) * max(1, capacity)
+        self.count = 0
+        self._next = 0
+
+    def append(self, value: float) -> None:
+        self.values[self._next] = value
+        self._next = (self._next + 1) % len(self.values)
+        self.count = min(self.count + 1, len(self.values))
+
+    def samples(self) -> list[float]:
+        """Buffered samples, oldest first."""
+        start = (self._next - self.count) % len(self.values)
+        return [self.values[(start + offset) % len(self.values)] for offset in range(self.count)]
+
+    def clear(self) -> None:
+        self.count = 0
+
+
+@dataclass(slots=True)
+class WindowAggregate:
+    min: float
+    max: float
+    mean: float
+    last: float
+    samples: int
+
+
+class HighRateSampler:
+    """Ring buffer per sampled register, closed into min/max/mean/last once per window."""
+
+    def __init__(
+        self,
+        specs: Iterable[RegisterSpec],
+        interval: float,
+        window: float,
+        *,
+        cost_model: TransactionCostModel | None = None,
+        max_length: int = MODBUS_MAX_READ_REGISTERS,
+    ) -> None:
+        self.specs = list(specs)
+        self.interval = interval
+        self.window = window
+        self.batches: list[RegisterBatch] = build_register_batches(self.specs, cost_model, max_length)
+        # One spare slot absorbs jitter between the sample clock and the window clock.
+        capacity = math.ceil(window / interval) + 1
+        self.buffers = {spec.key: RingBuffer(capacity) for spec in self.specs}
+        self.aggregates: dict[str, WindowAggregate] = {}
+        self.errors = 0
+
+    def replan(self, cost_model: TransactionCostModel | None, max_length: int, exclusions: ExclusionMap) -> None:
+        """Rebuild the sample batches around registers the meter rejects."""
+        specs = [spec for spec in self.specs if not exclusions.excludes(spec)]
+        self.batches = build_register_batches(specs, cost_model, max_length, exclusions)
+
+    def add(self, decoded: Iterable[tuple[RegisterSpec, float | int | None]]) -> None:
+        buffers = self.buffers
+        for spec, value in decoded:
+            buffer = buffers.get(spec.key)
+            if buffer is not None and value is not None and not math.isnan(value):
+                buffer.append(value)
+
+    def close_window(self) -> set[str]:
+        """Aggregate and reset every buffer; return the keys with a new aggregate."""
+        closed: set[str] = set()
+        for key, buffer in self.buffers.items():
+            if not buffer.count:
+                continue
+            samples = buffer.samples()
+            self.aggregates[key] = WindowAggregate(
+                min=min(samples),
+                max=max(samples),
+                mean=math.fsum(samples) / len(samples),
+                last=samples[-1],
+                samples=len(samples),
+            )
+            buffer.clear()
+            closed.add(key)
+        return closed
+
+
+def window_context(key: str) -> str:
+    """Listener context of the window aggregate sensors of ``key``."""
+    return f"{key}@window"
+
+
+def default_sampled_keys(specs: Iterable[RegisterSpec]) -> list[str]:
+    """Fast-tier power and current registers, the ones short load spikes show up in."""
+    return [spec.key for spec in specs if spec.tier == "fast" and spec.device_class in ("power", "current")]
+
+
+def parse_sampled_keys(text: str | None) -> list[str]:
+    return [key.strip() for key in (text or "").replace("\n", ",").split(",") if key.strip()]
@@ -1,6 +1,8 @@
 """Select platform for writable SDM config registers."""
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from homeassistant.components.select import SelectEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
@@ -9,7 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, CONF_MODEL, DEFAULT_MODEL, MODEL_SDM630M
 from .coordinator import SdmCoordinator, DecodedValue, _encode_value
-from .models import RegisterSpec, get_model_specs
+from .models import RegisterSpec, get_model_table
 from .shared_base import SdmBaseEntity
 
 _OPTION_LABELS = {
@@ -41,7 +43,7 @@ class SdmConfigSelect(SdmBaseEntity, SelectEntity):
         unique_id = coordinator.build_unique_id(spec.key)
         # Suggest object_id to avoid "none" suffix if translations are late
         self._attr_suggested_object_id = spec.key
-        super().__init__(coordinator, entry, unique_id=unique_id, translation_key=spec.key)
+        super().__init__(coordinator, entry, unique_id=unique_id, translation_key=spec.key, context=spec.key)
         self._model = model
         self._spec = spec
         self._attr_entity_registry_enabled_default = spec.enabled_default
@@ -61,7 +63,7 @@ class SdmConfigSelect(SdmBaseEntity, SelectEntity):
         self._attr_options = self._options
 
     def _current_value(self) -> float | int | None:
-        data: dict[str, DecodedValue] = self.coordinator.data or {}
+        data: Mapping[str, DecodedValue] = self.coordinator.data or {}
         dv: DecodedValue | None = data.get(self._spec.key)
         if not dv:
             return None
@@ -92,11 +94,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     entry_data = {**entry.data, **entry.options}
     model = entry_data.get(CONF_MODEL, DEFAULT_MODEL)
-    specs = get_model_specs(model)
+    specs = get_model_table(model).by_category.get("config", ())
     entities = [
         SdmConfigSelect(coordinator, entry, spec, model)
         for spec in specs
-        if spec.category == "config" and spec.control == "select"
+        if spec.control == "select"
     ]
     if entities:
         async_add_entities(entities)
@@ -11,7 +11,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN, CONF_MODEL, DEFAULT_MODEL
 from .coordinator import SdmCoordinator
 from .models import RegisterSpec, get_model_specs
+from .sampling import WINDOW_STATISTICS
 from .sensors.base import SdmBaseSensor
+from .sensors.window import SdmWindowSensor
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +37,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     specs = _iter_sensor_specs(get_model_specs(model))
 
     entities = [SdmBaseSensor(coordinator, entry, spec) for spec in specs]
+    if coordinator.sampler is not None:
+        entities.extend(
+            SdmWindowSensor(coordinator, entry, spec, statistic)
+            for spec in coordinator.sampler.specs
+            for statistic in WINDOW_STATISTICS
+        )
     async_add_entities(entities)
     _LOGGER.debug("Added %d SDM sensors for entry %s (model=%s)", len(entities), entry.entry_id, model)
 
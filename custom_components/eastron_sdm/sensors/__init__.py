@@ -28,6 +28,7 @@ from .diagnostic import (
     SdmMeterCodeSensor,
     SdmSoftwareVersionSensor,
 )
+from .window import SdmWindowSensor
 
 __all__ = [
     "SdmBaseSensor",
@@ -53,5 +54,7 @@ __all__ = [
     "SdmSerialNumberSensor",
     "SdmMeterCodeSensor",
     "SdmSoftwareVersionSensor",
+    # High-rate sampling window aggregates
+    "SdmWindowSensor",
 ]
 
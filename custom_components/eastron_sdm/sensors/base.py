@@ -1,6 +1,7 @@
 """Sensor base classes for Eastron SDM integration."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
@@ -33,7 +34,7 @@ class SdmBaseSensor(SdmBaseEntity, SensorEntity):
 
     def __init__(self, coordinator: SdmCoordinator, entry, spec: RegisterSpec) -> None:
         unique_id = coordinator.build_unique_id(spec.key)
-        super().__init__(coordinator, entry, unique_id=unique_id, translation_key=spec.key)
+        super().__init__(coordinator, entry, unique_id=unique_id, translation_key=spec.key, context=spec.key)
         self._spec = spec
         self._attr_entity_registry_enabled_default = spec.enabled_default
 
@@ -44,7 +45,7 @@ class SdmBaseSensor(SdmBaseEntity, SensorEntity):
             self._attr_suggested_display_precision = spec.precision
 
     def _current_value(self) -> float | int | None:
-        data: dict[str, DecodedValue] = self.coordinator.data or {}
+        data: Mapping[str, DecodedValue] = self.coordinator.data or {}
         dv: DecodedValue | None = data.get(self._spec.key)
         if not dv:
             return None
@@ -63,6 +64,11 @@ class SdmBaseSensor(SdmBaseEntity, SensorEntity):
                 return val
         return val
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        # Set until the first poll after a warm start confirms the restored values.
+        return {"stale": True} if self.coordinator.stale else None
+
     @property
     def available(self) -> bool:  # type: ignore[override]
         return super().available and self._current_value() is not None
@@ -0,0 +1,45 @@
+"""Window aggregate sensors fed by high-rate sampling."""
+from __future__ import annotations
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+
+from ..coordinator import SdmCoordinator
+from ..models import RegisterSpec
+from ..sampling import window_context
+from ..shared_base import SdmBaseEntity
+from .base import _DEVICE_CLASS_MAP
+
+
+class SdmWindowSensor(SdmBaseEntity, SensorEntity):
+    """Min, max, mean or last of one register over the latest sampling window."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator: SdmCoordinator, entry, spec: RegisterSpec, statistic: str) -> None:
+        super().__init__(
+            coordinator,
+            entry,
+            unique_id=coordinator.build_unique_id(f"{spec.key}_window_{statistic}"),
+            translation_key=f"window_{statistic}",
+            context=window_context(spec.key),
+        )
+        self._spec = spec
+        self._statistic = statistic
+        self._attr_translation_placeholders = {"register": spec.key.replace("_", " ").capitalize()}
+        self._attr_device_class = _DEVICE_CLASS_MAP.get(spec.device_class)
+        self._attr_native_unit_of_measurement = spec.unit
+        if spec.precision is not None:
+            self._attr_suggested_display_precision = spec.precision
+
+    @property
+    def native_value(self) -> float | None:  # type: ignore[override]
+        sampler = self.coordinator.sampler
+        aggregate = sampler.aggregates.get(self._spec.key) if sampler else None
+        if aggregate is None:
+            return None
+        return getattr(aggregate, self._statistic)
+
+    @property
+    def available(self) -> bool:  # type: ignore[override]
+        return super().available and self.native_value is not None
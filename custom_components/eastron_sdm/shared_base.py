@@ -12,8 +12,17 @@ from .const import DOMAIN, CONF_MODEL, DEFAULT_MODEL, model_display_name
 class SdmBaseEntity(CoordinatorEntity):
     """Common coordinator-backed entity behavior."""
 
-    def __init__(self, coordinator, entry: ConfigEntry, *, unique_id: str, translation_key: str | None = None) -> None:
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator,
+        entry: ConfigEntry,
+        *,
+        unique_id: str,
+        translation_key: str | None = None,
+        context: str | None = None,
+    ) -> None:
+        # ``context`` is the register key; the coordinator only wakes the entity when it changes.
+        super().__init__(coordinator, context)
         self.entry = entry
         self._attr_has_entity_name = True
         self._attr_unique_id = unique_id
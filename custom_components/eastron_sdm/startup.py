@@ -0,0 +1,101 @@
+"""Coordination of the initial meter reads of config entries set up together."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+
+from .const import CONF_STARTUP_CONCURRENCY, DEFAULT_STARTUP_CONCURRENCY, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP = "startup"
+DATA_SETUP_TIME = "setup_time"
+
+# Entries a setup pass waits for. During startup Home Assistant sets up every
+# enabled entry, some of which have not been reached yet; once running, entries
+# that are not loaded stay so until someone sets them up.
+_STARTING_STATES = frozenset(
+    {ConfigEntryState.NOT_LOADED, ConfigEntryState.SETUP_IN_PROGRESS, ConfigEntryState.SETUP_RETRY}
+)
+_RUNNING_STATES = frozenset({ConfigEntryState.SETUP_IN_PROGRESS})
+
+
+class StartupOrchestrator:
+    """Bound the initial reads of entries that start at the same time.
+
+    Home Assistant sets entries up concurrently. Entries on different gateways
+    read in parallel, at most ``concurrency`` at once, while entries on one
+    gateway queue behind each other, so a slow gateway only delays its own
+    meters. A queued entry does not hold a concurrency slot.
+    """
+
+    def __init__(self, concurrency: int, entry_ids: set[str], on_done: CALLBACK_TYPE | None = None) -> None:
+        self.concurrency = concurrency
+        self._slots = asyncio.Semaphore(concurrency)
+        self._gateways: dict[tuple[str, int], asyncio.Lock] = {}
+        self._pending = set(entry_ids)
+        self._meters = len(entry_ids)
+        self._started = time.monotonic()
+        self.setup_time: float | None = None
+        self._on_done = on_done
+
+    @asynccontextmanager
+    async def async_initial_read(self, host: str, port: int) -> AsyncIterator[None]:
+        async with self._gateways.setdefault((host, port), asyncio.Lock()), self._slots:
+            yield
+
+    @callback
+    def async_entry_done(self, entry_id: str) -> None:
+        """Mark an entry's setup finished, successful or not; logs once the last one is."""
+        self._pending.discard(entry_id)
+        if self._pending or self.setup_time is not None:
+            return
+        self.setup_time = time.monotonic() - self._started
+        _LOGGER.info("Set up %s Eastron SDM meters in %.2f s", self._meters, self.setup_time)
+        if self._on_done is not None:
+            self._on_done()
+
+
+@callback
+def async_get_orchestrator(hass: HomeAssistant) -> StartupOrchestrator:
+    """Return the orchestrator of the entries now setting up, creating it for the first.
+
+    While Home Assistant starts it waits for every enabled entry still to be
+    set up; afterwards (reloads, new meters) only for entries being set up right
+    now. Concurrency is capped at the lowest of their options. Once they are all
+    done the setup time is kept for diagnostics and the orchestrator dropped, so
+    later setups start a fresh one.
+    """
+    data = hass.data.setdefault(DOMAIN, {})
+    orchestrator: StartupOrchestrator | None = data.get(DATA_STARTUP)
+    if orchestrator is None:
+        states = _STARTING_STATES if hass.state is not CoreState.running else _RUNNING_STATES
+        entries = [
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if not entry.disabled_by and entry.state in states
+        ]
+        concurrency = min(
+            (
+                {**entry.data, **entry.options}.get(CONF_STARTUP_CONCURRENCY, DEFAULT_STARTUP_CONCURRENCY)
+                for entry in entries
+            ),
+            default=DEFAULT_STARTUP_CONCURRENCY,
+        )
+
+        @callback
+        def _async_forget() -> None:
+            data[DATA_SETUP_TIME] = orchestrator.setup_time
+            if data.get(DATA_STARTUP) is orchestrator:
+                del data[DATA_STARTUP]
+
+        orchestrator = data[DATA_STARTUP] = StartupOrchestrator(
+            concurrency, {entry.entry_id for entry in entries}, _async_forget
+        )
+    return orchestrator
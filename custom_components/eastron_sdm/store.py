@@ -0,0 +1,158 @@
+"""Columnar live value store for one meter."""
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from .models import RegisterSpec, get_model_specs
+from .models.base import DEFAULT_DEADBANDS, Deadband
+
+_INTEGRAL_TYPES = frozenset({"uint32", "uint16", "hex16"})
+
+
+@dataclass(slots=True)
+class DecodedValue:
+    key: str
+    value: float | int | None
+    updated: datetime
+
+
+@lru_cache(maxsize=None)
+def _model_slots(model: str) -> tuple[dict[str, int], tuple[bool, ...]]:
+    """Key-to-slot index and per-slot integer flag, built once per model."""
+    specs = get_model_specs(model)
+    return (
+        {spec.key: slot for slot, spec in enumerate(specs)},
+        tuple(spec.data_type in _INTEGRAL_TYPES for spec in specs),
+    )
+
+
+class ValueStore:
+    """Latest value and monotonic read time of every register slot of a model.
+
+    Values live in preallocated ``array('d')`` columns; a slot that was never
+    read has timestamp 0 and a decode failure is stored as NaN. With deadbands
+    configured the store keeps the last *published* value and its time, and
+    ignores reads within the deadband until ``max_silence`` has passed.
+    """
+
+    def __init__(self, model: str) -> None:
+        self.model = model
+        self.index, self._integral = _model_slots(model)
+        self.values = array("d", [math.nan]) * len(self.index)
+        self.timestamps = array("d", [0.0]) * len(self.index)
+        # Slots read or restored at least once; slots are never emptied again.
+        self.populated = 0
+        self.view = ValueStoreView(self)
+        self._changed: set[str] = set()
+        self._absolute = array("d", [0.0]) * len(self.index)
+        self._relative = array("d", [0.0]) * len(self.index)
+        self._filtering = False
+        self.max_silence = 0.0
+        self.suppressed = 0
+
+    def set_deadbands(
+        self, specs: Iterable[RegisterSpec], overrides: dict[str, Deadband] | None, max_silence: float
+    ) -> None:
+        """Enable significant-change filtering; ``overrides`` may name keys or device classes.
+
+        Passing None for ``overrides`` turns filtering off.
+        """
+        self._filtering = overrides is not None
+        self.max_silence = max_silence
+        for spec in specs:
+            deadband = _resolve_deadband(spec, overrides or {})
+            slot = self.index[spec.key]
+            self._absolute[slot] = deadband.absolute
+            self._relative[slot] = deadband.relative
+
+    def write(self, decoded: Iterable[tuple[RegisterSpec, float | int | None]], stamp: float) -> None:
+        """Store one batch of decoded values sharing a single timestamp."""
+        index, values, timestamps, changed = self.index, self.values, self.timestamps, self._changed
+        for spec, value in decoded:
+            slot = index[spec.key]
+            new = math.nan if value is None else value
+            old = values[slot]
+            if (
+                self._filtering
+                and timestamps[slot]
+                and stamp - timestamps[slot] < self.max_silence
+                and abs(new - old) <= max(self._absolute[slot], self._relative[slot] * abs(old))
+            ):
+                # Within the deadband (NaN never is): keep publishing the previous value.
+                self.suppressed += 1
+                continue
+            if not timestamps[slot]:
+                self.populated += 1
+                changed.add(spec.key)
+            elif old != new and not (math.isnan(old) and math.isnan(new)):
+                changed.add(spec.key)
+            values[slot] = new
+            timestamps[slot] = stamp
+
+    def restore(self, values: Mapping[str, float | int], stamp: float) -> None:
+        """Seed slots with persisted values read at monotonic time ``stamp``; unknown keys are skipped."""
+        for key, value in values.items():
+            slot = self.index.get(key)
+            if slot is not None and isinstance(value, (int, float)):
+                if not self.timestamps[slot]:
+                    self.populated += 1
+                self.values[slot] = value
+                self.timestamps[slot] = stamp
+
+    def snapshot(self) -> dict[str, float | int]:
+        """Every value read so far, without NaNs, for persisting."""
+        return {key: value for key, slot in self.index.items() if (value := self.value(slot)) is not None}
+
+    def take_changed(self) -> set[str]:
+        """Keys whose value changed, or were read for the first time, since the last call."""
+        changed, self._changed = self._changed, set()
+        return changed
+
+    def value(self, slot: int) -> float | int | None:
+        value = self.values[slot]
+        if math.isnan(value):
+            return None
+        return int(value) if self._integral[slot] else value
+
+
+def _resolve_deadband(spec: RegisterSpec, overrides: dict[str, Deadband]) -> Deadband:
+    if spec.key in overrides:
+        return overrides[spec.key]
+    if spec.device_class in overrides:
+        return overrides[spec.device_class]
+    return spec.deadband or DEFAULT_DEADBANDS.get(spec.device_class or "", Deadband())
+
+
+class ValueStoreView(Mapping[str, DecodedValue]):
+    """Read-only mapping of keys that have been read to ``DecodedValue``s."""
+
+    __slots__ = ("_store",)
+
+    def __init__(self, store: ValueStore) -> None:
+        self._store = store
+
+    def __getitem__(self, key: str) -> DecodedValue:
+        store = self._store
+        slot = store.index[key]
+        stamp = store.timestamps[slot]
+        if not stamp:
+            raise KeyError(key)
+        updated = datetime.utcnow() - timedelta(seconds=time.monotonic() - stamp)
+        return DecodedValue(key=key, value=store.value(slot), updated=updated)
+
+    def __iter__(self) -> Iterator[str]:
+        timestamps = self._store.timestamps
+        return (key for key, slot in self._store.index.items() if timestamps[slot])
+
+    def __len__(self) -> int:
+        return self._store.populated
+
+    def __contains__(self, key: object) -> bool:
+        slot = self._store.index.get(key)  # type: ignore[arg-type]
+        return slot is not None and bool(self._store.timestamps[slot])
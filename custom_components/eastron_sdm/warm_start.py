@@ -0,0 +1,76 @@
+"""Persisted meter identity, last values and learned timings for warm starts."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, WARM_START_STORAGE_VERSION
+
+
+@dataclass(slots=True)
+class WarmStartState:
+    """What a restart needs to set up entities before the bus answers."""
+
+    host: str
+    unit_id: int
+    model: str
+    serial: str | None = None
+    saved_at: float = 0.0  # wall clock, seconds since the epoch
+    values: dict[str, float | int] = field(default_factory=dict)
+    max_read_length: int | None = None
+    cadences: dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "host": self.host,
+            "unit_id": self.unit_id,
+            "model": self.model,
+            "serial": self.serial,
+            "saved_at": self.saved_at,
+            "values": self.values,
+            "max_read_length": self.max_read_length,
+            "cadences": self.cadences,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WarmStartState | None:
+        try:
+            return cls(
+                host=str(data["host"]),
+                unit_id=int(data["unit_id"]),
+                model=str(data["model"]),
+                serial=data.get("serial"),
+                saved_at=float(data.get("saved_at", 0.0)),
+                values=dict(data.get("values") or {}),
+                max_read_length=data.get("max_read_length"),
+                cadences=dict(data.get("cadences") or {}),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+class WarmStartStore:
+    """One ``Store`` file per config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, WARM_START_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.warm_start"
+        )
+
+    async def async_load(self) -> WarmStartState | None:
+        data = await self._store.async_load()
+        return WarmStartState.from_dict(data) if data else None
+
+    def async_schedule_save(self, state_func: Callable[[], WarmStartState]) -> None:
+        """Write ``state_func()`` shortly; the state is taken when the write happens."""
+        self._store.async_delay_save(lambda: state_func().as_dict())
+
+    async def async_save(self, state: WarmStartState) -> None:
+        await self._store.async_save(state.as_dict())
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
@@ -0,0 +1,39 @@
+"""Micro-benchmark: whole-batch decoder vs per-spec decoding of the SDM630M slow tier."""
+import struct
+import sys
+import timeit
+from pathlib import Path
+
+# Add the custom component to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "custom_components"))
+
+from eastron_sdm.const import MODEL_SDM630M
+from eastron_sdm.coordinator import _decode, _decode_batch
+from eastron_sdm.models import get_model_specs
+from eastron_sdm.read_plan import TransactionCostModel, build_register_batches
+
+ROUNDS = 20000
+
+
+def main() -> None:
+    specs = [spec for spec in get_model_specs(MODEL_SDM630M) if spec.tier == "slow" and spec.function == "input"]
+    batch = build_register_batches(specs, TransactionCostModel())[0]
+    payload = struct.pack(f">{batch.length}H", *range(batch.length))
+    registers = list(struct.unpack(f">{batch.length}H", payload))
+
+    def per_spec() -> None:
+        for spec in batch.specs:
+            offset = spec.address - batch.start
+            _decode(spec, registers[offset : offset + spec.length])
+
+    def whole_batch() -> None:
+        _decode_batch(batch, payload)
+
+    print(f"SDM630M slow-tier batch: start={batch.start} len={batch.length} specs={len(batch.specs)}")
+    for name, func in (("per-spec _decode", per_spec), ("compiled batch", whole_batch)):
+        seconds = min(timeit.repeat(func, number=ROUNDS, repeat=5))
+        print(f"{name:>18}: {seconds / ROUNDS * 1e6:7.2f} us/batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from homeassistant.core import HomeAssistant
+
+from custom_components.eastron_sdm.const import CONF_HOST, CONF_MODEL, CONF_UNIT_ID, MODEL_SDM120M
+from custom_components.eastron_sdm.coordinator import SdmCoordinator
+
+ENTRY_DATA = {CONF_HOST: "10.0.0.5", CONF_UNIT_ID: 1, CONF_MODEL: MODEL_SDM120M}
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    hass.config_entries = MagicMock()
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest_asyncio.fixture
+async def make_coordinator(hass):
+    """Build coordinators through their real constructor, optionally talking to a fake client.
+
+    Keyword arguments are config entry data on top of ``ENTRY_DATA``.
+    """
+    created = []
+
+    def _make(client=None, **data):
+        entry = MagicMock(entry_id=f"entry{len(created)}", data={**ENTRY_DATA, **data}, options={})
+        coordinator = SdmCoordinator(hass, entry)
+        created.append(coordinator)
+        if client is not None:
+            coordinator._client = client
+        return coordinator
+
+    yield _make
+    for coordinator in created:
+        await coordinator.async_shutdown()
+        await coordinator.async_close()
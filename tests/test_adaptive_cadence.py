@@ -0,0 +1,51 @@
+from custom_components.eastron_sdm.adaptive import AdaptiveCadence, change_threshold
+from custom_components.eastron_sdm.const import MODEL_SDM120M
+from custom_components.eastron_sdm.models import get_model_table
+
+_SPECS = get_model_table(MODEL_SDM120M).by_key
+
+
+def test_stable_registers_slow_down_up_to_the_upper_bound():
+    adaptive = AdaptiveCadence(min_interval=5, max_interval=300)
+
+    cadences = [adaptive.observe("frequency", 50.0, base_interval=30) for _ in range(20)]
+
+    assert cadences[0] == 30
+    assert cadences == sorted(cadences)
+    assert cadences[-1] == 300
+    assert adaptive.stats["frequency"].changes == 0
+
+
+def test_volatile_registers_speed_up_down_to_the_lower_bound():
+    adaptive = AdaptiveCadence(min_interval=5, max_interval=300)
+
+    for reading in range(10):
+        cadence = adaptive.observe("active_power", 100.0 + reading * 25, base_interval=30)
+
+    assert cadence == 5
+    assert adaptive.stats["active_power"].change_rate > 0.9
+
+
+def test_jitter_below_the_threshold_counts_as_unchanged():
+    adaptive = AdaptiveCadence(min_interval=5, max_interval=300)
+    threshold = change_threshold(_SPECS["frequency"])
+
+    adaptive.observe("frequency", 50.00, 30, threshold)
+    adaptive.observe("frequency", 50.004, 30, threshold)
+
+    assert adaptive.stats["frequency"].changes == 0
+    assert adaptive.cadences()["frequency"] == 45
+
+
+def test_slow_counters_and_small_voltage_moves_count_as_changes():
+    adaptive = AdaptiveCadence(min_interval=5, max_interval=900)
+    energy = change_threshold(_SPECS["total_active_energy"])
+    voltage = change_threshold(_SPECS["voltage"])
+
+    for minute in range(5):
+        adaptive.observe("total_active_energy", 12345.0 + minute * 0.017, 60, energy)
+        adaptive.observe("voltage", 230.0 + (minute % 2) * 0.2, 10, voltage)
+
+    assert adaptive.stats["total_active_energy"].changes == 4
+    assert adaptive.stats["voltage"].changes == 4
+    assert adaptive.cadences()["total_active_energy"] < 60
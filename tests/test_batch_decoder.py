@@ -0,0 +1,38 @@
+import struct
+
+from custom_components.eastron_sdm.const import MODEL_SDM630M
+from custom_components.eastron_sdm.coordinator import _decode, _decode_batch
+from custom_components.eastron_sdm.models import get_model_specs
+from custom_components.eastron_sdm.models.base import RegisterSpec
+from custom_components.eastron_sdm.read_plan import RegisterBatch, TransactionCostModel, build_register_batches
+
+
+def _payload(length):
+    return struct.pack(f">{length}H", *((0x4000 + index * 37) & 0xFFFF for index in range(length)))
+
+
+def test_compiled_batch_matches_per_spec_decoding_across_bridged_gaps():
+    specs = [spec for spec in get_model_specs(MODEL_SDM630M) if spec.tier == "slow" and spec.function == "input"]
+    batch = build_register_batches(specs, TransactionCostModel())[0]
+    payload = _payload(batch.length)
+    registers = list(struct.unpack(f">{batch.length}H", payload))
+
+    decoded = dict((spec.key, value) for spec, value in _decode_batch(batch, payload))
+
+    assert batch.padding and batch.decoder is not None
+    assert batch.decoder.layout.size == batch.length * 2
+    for spec in batch.specs:
+        offset = spec.address - batch.start
+        assert decoded[spec.key] == _decode(spec, registers[offset : offset + spec.length])
+
+
+def test_overlapping_specs_fall_back_to_per_spec_decoding():
+    wide = RegisterSpec("wide", 0, 2, "holding", "uint32", None, None, None, "config", "slow", True)
+    high = RegisterSpec("high", 0, 1, "holding", "uint16", None, None, None, "config", "slow", True)
+    batch = RegisterBatch(start=0, length=2, function="holding", specs=[wide, high])
+
+    assert batch.decoder is None
+    assert dict((spec.key, value) for spec, value in _decode_batch(batch, b"\x00\x01\x00\x02")) == {
+        "wide": 0x00010002,
+        "high": 1,
+    }
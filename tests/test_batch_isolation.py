@@ -0,0 +1,64 @@
+import struct
+import time
+
+import pytest
+
+from custom_components.eastron_sdm.client import ILLEGAL_DATA_ADDRESS, ModbusExceptionResponseError, ReadResult
+from custom_components.eastron_sdm.coordinator import PollCycle
+from custom_components.eastron_sdm.models.base import RegisterSpec
+from custom_components.eastron_sdm.read_plan import ReadPlan, RegisterBatch
+
+
+class _FlakyClient:
+    pipelined = False
+
+    def __init__(self, failures):
+        self.failures = failures  # start address -> exceptions raised by the next reads
+        self.reads = []
+
+    async def read_registers(self, function, address, count):
+        self.reads.append(address)
+        pending = self.failures.get(address)
+        if pending:
+            raise pending.pop(0)
+        return ReadResult(address, count, payload=struct.pack(">f", 230.0) * (count // 2))
+
+
+def _batch(key, address):
+    spec = RegisterSpec(key, address, 2, "input", "float32", "V", "voltage", None, "basic", "fast", True)
+    return RegisterBatch(start=address, length=2, function="input", specs=[spec])
+
+
+def _cycle(batches):
+    return PollCycle(plan=ReadPlan(batches=batches, next_cycle=0), started=time.monotonic())
+
+
+@pytest.mark.asyncio
+async def test_a_failed_batch_does_not_cost_the_others_and_is_retried_once(make_coordinator):
+    batches = [_batch("voltage", 0), _batch("current", 6), _batch("active_power", 12)]
+    client = _FlakyClient({6: [TimeoutError("slow"), TimeoutError("slow")]})
+    coordinator = make_coordinator(client)
+    cycle = _cycle(batches)
+
+    await coordinator.async_read_batches(cycle, batches)
+    coordinator._record_batch_outcomes(cycle)
+
+    assert [batch.start for batch in cycle.read] == [0, 12]
+    assert [batch.start for batch, _exc in cycle.failed] == [6]
+    assert client.reads == [0, 6, 12, 6]
+    assert coordinator.batch_failures == {"input:6+2": 1}
+    assert coordinator._store.view["active_power"].value == pytest.approx(230.0)
+
+
+@pytest.mark.asyncio
+async def test_modbus_exceptions_are_not_retried_and_a_dead_link_fails_fast(make_coordinator):
+    rejected = ModbusExceptionResponseError("illegal address", ILLEGAL_DATA_ADDRESS)
+    batches = [_batch("voltage", 0), _batch("current", 6), _batch("active_power", 12), _batch("frequency", 70)]
+    client = _FlakyClient({0: [rejected], 6: [ConnectionError("down")], 12: [ConnectionError("down")]})
+    coordinator = make_coordinator(client)
+    cycle = _cycle(batches)
+
+    await coordinator.async_read_batches(cycle, batches)
+
+    assert client.reads == [0, 6, 12]
+    assert not cycle.read and len(cycle.failed) == 4
@@ -0,0 +1,126 @@
+import time
+
+import pytest
+
+from custom_components.eastron_sdm.client import (
+    ILLEGAL_DATA_ADDRESS,
+    ILLEGAL_DATA_VALUE,
+    ModbusExceptionResponseError,
+    ReadResult,
+    SdmModbusClient,
+)
+from custom_components.eastron_sdm.const import CONF_COALESCE_GAPS
+from custom_components.eastron_sdm.models.base import RegisterSpec
+from custom_components.eastron_sdm.read_plan import (
+    ExclusionMap,
+    TransactionCostModel,
+    build_register_batches,
+    span_batch,
+)
+
+
+def _spec(key, address, length=2):
+    return RegisterSpec(key, address, length, "input", "float32", None, None, None, "basic", "fast", True)
+
+
+def test_batches_are_split_between_specs_at_the_length_limit():
+    specs = [_spec(f"r{address}", address) for address in range(0, 20, 2)]
+
+    batches = build_register_batches(specs, max_length=7)
+
+    assert [(batch.start, batch.length) for batch in batches] == [(0, 6), (6, 6), (12, 6), (18, 2)]
+    assert all(batch.length <= 7 for batch in batches)
+
+
+def test_gap_bridging_respects_the_length_limit():
+    specs = [_spec("a", 0), _spec("b", 10), _spec("c", 20)]
+
+    batches = build_register_batches(specs, TransactionCostModel(), max_length=12)
+
+    assert [(batch.start, batch.length, batch.bridged) for batch in batches] == [(0, 12, 1), (20, 2, 0)]
+
+
+@pytest.mark.asyncio
+async def test_probe_learns_the_largest_accepted_read():
+    client = SdmModbusClient("192.0.2.1", 502, 1)
+    attempts = []
+
+    async def fake_read(function, address, count, *, unit_id=None):
+        attempts.append(count)
+        if count > 40:
+            raise ModbusExceptionResponseError("too long", 0x03)
+        return ReadResult(address=address, count=count, registers=[0] * count)
+
+    client.read_registers = fake_read  # type: ignore[method-assign]
+
+    assert await client.probe_max_read_length("input", 0, 125) == 40
+    assert client.max_read_length == 40
+    assert len(attempts) <= 7
+
+
+@pytest.mark.asyncio
+async def test_a_busy_answer_during_the_probe_does_not_lower_the_limit():
+    client = SdmModbusClient("192.0.2.1", 502, 1)
+
+    async def fake_read(function, address, count, *, unit_id=None):
+        raise ModbusExceptionResponseError("busy", 0x06)
+
+    client.read_registers = fake_read  # type: ignore[method-assign]
+
+    with pytest.raises(ModbusExceptionResponseError):
+        await client.probe_max_read_length("input", 0, 125)
+    assert client.max_read_length == 125
+
+
+def test_a_learned_limit_lapses(monkeypatch):
+    client = SdmModbusClient("192.0.2.1", 502, 1)
+    client.learn_max_read_length(40)
+    assert client.max_read_length == 40
+
+    monkeypatch.setattr(client, "_read_limit_expires", time.monotonic() - 1)
+    assert client.max_read_length == 125
+
+
+class _LimitedMeter:
+    """Rejects reads longer than ``limit`` with 03 and reads touching ``rejected`` with 02."""
+
+    max_read_length = 125
+
+    def __init__(self, limit, rejected=()):
+        self.limit = limit
+        self.rejected = set(rejected)
+        self.reads = []
+
+    async def read_registers(self, function, address, count):
+        self.reads.append((address, count))
+        if count > self.limit:
+            raise ModbusExceptionResponseError("too long", ILLEGAL_DATA_VALUE)
+        if self.rejected & set(range(address, address + count)):
+            raise ModbusExceptionResponseError("illegal data address", ILLEGAL_DATA_ADDRESS)
+        return ReadResult(address, count, registers=[0] * count)
+
+    async def probe_max_read_length(self, function, address, count):
+        return self.limit
+
+
+@pytest.mark.asyncio
+async def test_split_after_the_probe_keeps_out_of_learned_exclusions(make_coordinator):
+    specs = [_spec("a", 0), _spec("b", 2), _spec("c", 10), _spec("d", 12), _spec("e", 20)]
+    client = _LimitedMeter(14, rejected=range(4, 10))
+    coordinator = make_coordinator(client, **{CONF_COALESCE_GAPS: True})
+    coordinator.exclusions = ExclusionMap(ranges=frozenset({("input", 4, 10)}))
+
+    parts = await coordinator._read_batch(span_batch(specs))
+
+    assert [(part.start, part.length) for part, _raw in parts] == [(0, 4), (10, 12)]
+    assert client.reads == [(0, 22), (0, 4), (10, 12)]
+
+
+@pytest.mark.asyncio
+async def test_a_spec_longer_than_the_limit_is_not_retried(make_coordinator):
+    client = _LimitedMeter(2)
+    coordinator = make_coordinator(client)
+
+    with pytest.raises(ModbusExceptionResponseError):
+        await coordinator._read_batch(span_batch([_spec("a", 0), _spec("wide", 2, length=4)]))
+    assert client.reads == [(0, 6)]
@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from custom_components.eastron_sdm.client import ILLEGAL_DATA_ADDRESS, ModbusExceptionResponseError, ReadResult
+from custom_components.eastron_sdm.const import EXCLUSION_TTL
+from custom_components.eastron_sdm.models.base import RegisterSpec
+from custom_components.eastron_sdm.read_plan import (
+    ExclusionMap,
+    ReadPlan,
+    ReadPlanOptions,
+    build_read_plan,
+    build_register_batches,
+    span_batch,
+)
+
+
+class _PickyMeter:
+    """Answers exception 02 to any read touching ``rejected`` registers."""
+
+    def __init__(self, rejected):
+        self.rejected = set(rejected)
+        self.reads = []
+
+    async def read_registers(self, function, address, count):
+        self.reads.append((address, count))
+        if self.rejected & set(range(address, address + count)):
+            raise ModbusExceptionResponseError("illegal data address", ILLEGAL_DATA_ADDRESS)
+        return ReadResult(address, count, registers=[0] * count)
+
+
+def _spec(key, address):
+    return RegisterSpec(key, address, 2, "input", "float32", None, None, None, "basic", "slow", True)
+
+
+@pytest.mark.asyncio
+async def test_rejected_spec_is_isolated_and_later_plans_avoid_it(make_coordinator):
+    specs = [_spec("a", 200), _spec("neutral_current", 224), _spec("c", 226), _spec("d", 240)]
+    coordinator = make_coordinator(_PickyMeter({224}))
+
+    parts = await coordinator._read_batch(span_batch(specs))
+
+    assert [[spec.key for spec in part.specs] for part, _raw in parts] == [["a"], ["c", "d"]]
+    assert coordinator.exclusions.ranges == {("input", 224, 226)}
+    plan = build_read_plan(specs, ReadPlanOptions(coalesce_gaps=True, exclusions=coordinator.exclusions), 0)
+    assert [(batch.start, batch.length) for batch in plan.batches] == [(200, 2), (226, 16)]
+
+
+@pytest.mark.asyncio
+async def test_rejected_padding_between_specs_stops_bridging_there(make_coordinator):
+    specs = [_spec("a", 200), _spec("b", 226)]
+    coordinator = make_coordinator(_PickyMeter({210}))
+
+    parts = await coordinator._read_batch(span_batch(specs))
+
+    assert len(parts) == 2
+    assert coordinator.exclusions.ranges == {("input", 202, 226)}
+    cost_model = ReadPlanOptions(coalesce_gaps=True).cost_model
+    assert len(build_register_batches(specs, cost_model, 125)) == 1
+    assert len(build_register_batches(specs, cost_model, 125, coordinator.exclusions)) == 2
+
+
+def test_exclusion_map_round_trips_for_persistence():
+    exclusions = ExclusionMap(ranges=frozenset({("input", 224, 226)}), splits=frozenset({("input", 346)}))
+
+    assert ExclusionMap.from_dict(exclusions.as_dict()) == exclusions
+
+
+@pytest.mark.asyncio
+async def test_learned_exclusions_expire_and_are_tried_again(make_coordinator, monkeypatch):
+    coordinator = make_coordinator(_PickyMeter({224}))
+    monkeypatch.setattr(coordinator, "_next_read_plan", lambda now: ReadPlan(batches=[], next_cycle=0))
+    await coordinator._read_batch(span_batch([_spec("a", 200), _spec("neutral_current", 224)]))
+    assert coordinator._exclusions_expire == pytest.approx(time.time() + EXCLUSION_TTL, abs=5)
+
+    coordinator.begin_cycle(time.monotonic())
+    assert coordinator.exclusions
+
+    monkeypatch.setattr(coordinator, "_exclusions_expire", time.time() - 1)
+    coordinator.begin_cycle(time.monotonic())
+    assert not coordinator.exclusions
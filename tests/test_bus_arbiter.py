@@ -0,0 +1,82 @@
+import asyncio
+import logging
+
+import pytest
+
+from custom_components.eastron_sdm.client import BusArbiter
+from custom_components.eastron_sdm.const import FRAMER_TCP
+from custom_components.eastron_sdm.gateway import async_acquire_client, async_release_client
+
+
+@pytest.mark.asyncio
+async def test_bus_is_granted_round_robin_across_unit_ids():
+    arbiter = BusArbiter()
+    served = []
+
+    async def transaction(unit_id):
+        async with arbiter.slot(unit_id):
+            served.append(unit_id)
+            await asyncio.sleep(0)
+
+    # Unit 1 queues a burst before units 2 and 3 ask for the bus.
+    tasks = [asyncio.create_task(transaction(1)) for _ in range(4)]
+    tasks += [asyncio.create_task(transaction(2)), asyncio.create_task(transaction(3))]
+    await asyncio.gather(*tasks)
+
+    assert served == [1, 1, 2, 3, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_only_one_transaction_holds_the_bus():
+    arbiter = BusArbiter()
+    active = 0
+    peak = 0
+
+    async def transaction(unit_id):
+        nonlocal active, peak
+        async with arbiter.slot(unit_id):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+
+    await asyncio.gather(*(transaction(unit_id % 3) for unit_id in range(12)))
+
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_block_the_bus():
+    arbiter = BusArbiter()
+    release = asyncio.Event()
+
+    async def holder():
+        async with arbiter.slot(1):
+            await release.wait()
+
+    holding = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiting = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    release.set()
+    await holding
+
+    async with arbiter.slot(2):
+        pass
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+
+@pytest.mark.asyncio
+async def test_conflicting_transport_options_on_a_shared_gateway_are_reported(hass, caplog):
+    first = async_acquire_client(hass, "e1", "10.0.0.5", 502, 1, framer=FRAMER_TCP, pipeline_window=4)
+    with caplog.at_level(logging.WARNING):
+        async_acquire_client(hass, "e2", "10.0.0.5", 502, 2, framer=FRAMER_TCP, pipeline_window=4)
+        assert not caplog.records
+        second = async_acquire_client(hass, "e3", "10.0.0.5", 502, 3)
+
+    assert second.transport is first.transport
+    assert "pipeline window 4" in caplog.text and "unit 3" in caplog.text
+    for entry_id in ("e1", "e2", "e3"):
+        await async_release_client(hass, entry_id, "10.0.0.5", 502)
@@ -0,0 +1,93 @@
+import socket
+import time
+
+import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.eastron_sdm.client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ModbusExceptionResponseError,
+    SdmModbusClient,
+)
+
+
+def _fail(breaker, exc):
+    with pytest.raises(type(exc)), breaker.request():
+        raise exc
+
+
+def test_circuit_opens_after_consecutive_link_failures_only():
+    breaker = CircuitBreaker("gw", 3, 10, 600)
+
+    _fail(breaker, ConnectionError("down"))
+    _fail(breaker, TimeoutError())
+    _fail(breaker, ModbusExceptionResponseError("illegal address", 2))  # the device answered
+    _fail(breaker, ConnectionError("down"))
+    _fail(breaker, ConnectionError("down"))
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    _fail(breaker, ConnectionError("down"))
+    assert breaker.state == CircuitBreaker.OPEN
+    assert 5 <= breaker.retry_in <= 10
+    with pytest.raises(CircuitOpenError), breaker.request():
+        pytest.fail("request let through while open")
+
+
+def test_half_open_lets_one_trial_through_and_backs_off_on_failure():
+    breaker = CircuitBreaker("gw", 1, 10, 600)
+    _fail(breaker, ConnectionError("down"))
+
+    breaker.retry_at = time.monotonic()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(ConnectionError), breaker.request():
+        with pytest.raises(CircuitOpenError), breaker.request():
+            pass  # a second request during the trial is refused
+        raise ConnectionError("still down")
+    assert breaker.state == CircuitBreaker.OPEN
+    assert 10 <= breaker.retry_in <= 20
+
+    breaker.retry_at = time.monotonic()
+    with breaker.request():
+        pass
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.trips == 0
+
+
+@pytest.mark.asyncio
+async def test_unreachable_gateway_stops_reconnecting_once_open():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]  # closed again: connections are refused
+    client = SdmModbusClient("127.0.0.1", port, 1, native_codec=True)
+
+    for _ in range(3):
+        with pytest.raises(ConnectionRefusedError):
+            await client.read_input_registers(0, 2)
+    with pytest.raises(CircuitOpenError):
+        await client.read_input_registers(0, 2)
+    assert client.breaker.failures == 3
+
+
+class _UnreachableClient:
+    pipelined = False
+
+    def __init__(self):
+        self.breaker = CircuitBreaker("10.0.0.5:502", 1, 10, 600)
+        self.reads = 0
+
+    async def read_registers(self, function, address, count):
+        self.reads += 1
+        raise AssertionError("no I/O while the circuit is open")
+
+
+@pytest.mark.asyncio
+async def test_coordinator_skips_polling_without_cached_fallback_while_open(make_coordinator):
+    client = _UnreachableClient()
+    _fail(client.breaker, ConnectionError("down"))
+    coordinator = make_coordinator(client)
+
+    with pytest.raises(UpdateFailed, match="unreachable"):
+        await coordinator._async_update_data()
+    assert client.reads == 0
+    assert coordinator.next_due > time.monotonic()
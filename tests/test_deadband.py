@@ -0,0 +1,66 @@
+import pytest
+
+from custom_components.eastron_sdm.const import MODEL_SDM120M
+from custom_components.eastron_sdm.models import get_model_specs, get_spec_by_key
+from custom_components.eastron_sdm.models.base import Deadband
+from custom_components.eastron_sdm.overrides import parse_deadbands
+from custom_components.eastron_sdm.store import ValueStore
+
+
+def _store(overrides=None, max_silence=60):
+    store = ValueStore(MODEL_SDM120M)
+    store.set_deadbands(get_model_specs(MODEL_SDM120M), overrides or {}, max_silence)
+    return store
+
+
+def test_jitter_inside_the_device_class_deadband_is_held_back():
+    store = _store()
+    voltage = get_spec_by_key(MODEL_SDM120M, "voltage")
+
+    store.write([(voltage, 230.0)], stamp=1.0)
+    store.take_changed()
+    store.write([(voltage, 230.1)], stamp=6.0)
+
+    assert store.take_changed() == set()
+    assert store.view["voltage"].value == 230.0
+
+    store.write([(voltage, 230.5)], stamp=11.0)
+
+    assert store.take_changed() == {"voltage"}
+    assert store.view["voltage"].value == 230.5
+
+
+def test_heartbeat_publishes_held_back_values_after_max_silence():
+    store = _store(max_silence=30)
+    voltage = get_spec_by_key(MODEL_SDM120M, "voltage")
+
+    store.write([(voltage, 230.0)], stamp=1.0)
+    store.write([(voltage, 230.1)], stamp=20.0)
+    store.write([(voltage, 230.1)], stamp=31.0)
+
+    assert store.view["voltage"].value == 230.1
+
+
+def test_energy_counters_publish_every_increment():
+    store = _store()
+    energy = get_spec_by_key(MODEL_SDM120M, "import_active_energy")
+
+    store.write([(energy, 100.0)], stamp=1.0)
+    store.take_changed()
+    store.write([(energy, 100.01)], stamp=6.0)
+
+    assert store.take_changed() == {"import_active_energy"}
+
+
+def test_overrides_by_key_or_device_class_with_relative_thresholds():
+    overrides = parse_deadbands("voltage=1, power=5, power=2%")
+    assert overrides == {"voltage": Deadband(absolute=1.0), "power": Deadband(absolute=5.0, relative=0.02)}
+
+    store = _store(overrides)
+    power = get_spec_by_key(MODEL_SDM120M, "active_power")
+    store.write([(power, 1000.0)], stamp=1.0)
+    store.write([(power, 1015.0)], stamp=6.0)
+
+    assert store.view["active_power"].value == 1000.0
+    with pytest.raises(ValueError):
+        parse_deadbands("voltage=-1")
@@ -0,0 +1,84 @@
+import pytest
+
+from custom_components.eastron_sdm.const import MODEL_SDM120M, MODEL_SDM630M
+from custom_components.eastron_sdm.models import get_model_specs
+from custom_components.eastron_sdm.overrides import parse_overrides
+from custom_components.eastron_sdm.read_plan import DeadlineScheduler, ReadPlanOptions
+
+
+def _keys(plan):
+    return {spec.key for batch in plan.batches for spec in batch.specs}
+
+
+def test_first_poll_reads_everything_then_only_expiring_registers():
+    scheduler = DeadlineScheduler(
+        get_model_specs(MODEL_SDM630M),
+        ReadPlanOptions(),
+        interval=5,
+        max_age_overrides={"voltage_l1": 10, "total_import_active_energy": 60},
+    )
+
+    first = scheduler.plan(0)
+    scheduler.mark_read(_keys(first), 0)
+
+    assert "total_import_active_energy" in _keys(first)
+    assert scheduler.plan(5).batches
+    assert "total_import_active_energy" not in _keys(scheduler.plan(5))
+
+
+def test_max_age_is_never_exceeded_and_slow_registers_are_read_rarely():
+    interval = 5
+    max_ages = {"voltage_l1": 10, "total_import_active_energy": 60}
+    scheduler = DeadlineScheduler(
+        get_model_specs(MODEL_SDM630M), ReadPlanOptions(), interval=interval, max_age_overrides=max_ages
+    )
+    last_read: dict[str, float] = {}
+
+    reads = {}
+    for poll in range(120):
+        now = poll * interval
+        keys = _keys(scheduler.plan(now))
+        scheduler.mark_read(keys, now)
+        for key in keys:
+            last_read[key] = now
+            reads[key] = reads.get(key, 0) + 1
+        for key, max_age in max_ages.items():
+            assert now - last_read[key] <= max_age
+
+    assert reads["current_l1"] == 120
+    assert reads["total_import_active_energy"] <= 120 * interval / 30
+
+
+def test_identity_registers_default_to_a_daily_max_age():
+    scheduler = DeadlineScheduler(
+        get_model_specs(MODEL_SDM120M), ReadPlanOptions(enable_diagnostic=True), interval=10
+    )
+
+    assert scheduler.max_ages["serial_number"] == 86400
+    assert scheduler.max_ages["voltage"] == 10
+    assert scheduler.max_ages["import_active_energy"] == 10 * ReadPlanOptions().slow_divisor
+
+
+def test_nearly_due_registers_ride_along_in_the_same_batch():
+    scheduler = DeadlineScheduler(
+        get_model_specs(MODEL_SDM630M),
+        ReadPlanOptions(),
+        interval=5,
+        max_age_overrides={"voltage_l1": 10, "voltage_l2": 40},
+    )
+    scheduler.mark_read(["voltage_l1", "voltage_l2"], 0)
+
+    keys = _keys(scheduler.plan(10))
+
+    assert "voltage_l1" in keys
+    assert "voltage_l2" not in keys
+    assert "voltage_l2" in _keys(scheduler.plan(20))
+
+
+def test_overrides_are_parsed_from_option_text():
+    assert parse_overrides("voltage_l1=10,\n total_import_active_energy = 60") == {
+        "voltage_l1": 10.0,
+        "total_import_active_energy": 60.0,
+    }
+    with pytest.raises(ValueError):
+        parse_overrides("voltage_l1")
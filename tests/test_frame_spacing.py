@@ -0,0 +1,116 @@
+import asyncio
+import struct
+import time
+
+import pytest
+
+from custom_components.eastron_sdm.client import FrameSpacer, SdmModbusClient
+from custom_components.eastron_sdm.const import (
+    CONF_BUS_BAUD_RATE,
+    CONF_ENABLE_CONFIG,
+    CONF_FRAMER,
+    FRAMER_RTU_OVER_TCP,
+    FRAMER_TCP,
+    MODEL_SDM120M,
+)
+from custom_components.eastron_sdm.models import get_model_table
+from custom_components.eastron_sdm.transport import crc16
+
+
+def test_gap_covers_both_frames_on_the_wire_plus_silent_intervals():
+    spacer = FrameSpacer(9600)
+    assert spacer.silent_interval == pytest.approx(3.5 * 11 / 9600)
+
+    sent = time.monotonic()
+    spacer.transmitted(sent, 8, 5 + 2 * 40)
+
+    assert spacer.free_at - sent == pytest.approx(93 * 11 / 9600 + 2 * spacer.silent_interval)
+    assert FrameSpacer(38400).silent_interval == FrameSpacer.FAST_SILENT_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_spacing_off_without_a_baud_rate():
+    spacer = FrameSpacer()
+    spacer.transmitted(time.monotonic(), 8, 85)
+    await spacer.wait()
+    assert spacer.waits == 0 and spacer.free_at == 0.0
+
+
+@pytest.mark.asyncio
+async def test_requests_reach_the_gateway_no_sooner_than_the_bus_allows():
+    arrivals = []
+
+    async def handle(reader, writer):
+        while True:
+            try:
+                request = await reader.readexactly(8)
+            except asyncio.IncompleteReadError:
+                break
+            arrivals.append(time.monotonic())
+            unit, function, _address, count = struct.unpack(">BBHH", request[:6])
+            body = struct.pack(f">BBB{count}H", unit, function, count * 2, *range(count))
+            writer.write(body + crc16(body).to_bytes(2, "little"))
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    client = SdmModbusClient("127.0.0.1", server.sockets[0].getsockname()[1], 1, native_codec=True)
+    client.set_baud_rate(19200)
+    try:
+        for _ in range(3):
+            await client.read_input_registers(0, 40)
+    finally:
+        await client.close()
+        server.close()
+
+    on_wire = (8 + 85) * 11 / 19200 + 2 * 3.5 * 11 / 19200
+    gaps = [later - earlier for earlier, later in zip(arrivals, arrivals[1:])]
+    assert min(gaps) >= on_wire * 0.9
+    assert client.spacer.waits == 2
+
+
+class _SpacedClient:
+    baud_rate = 0
+
+    def set_baud_rate(self, baud_rate):
+        self.baud_rate = baud_rate
+
+
+@pytest.mark.asyncio
+async def test_baud_rate_follows_the_meter_register_unless_configured(make_coordinator):
+    spec = get_model_table(MODEL_SDM120M).by_key["baud_rate"]
+
+    def _coordinator(framer, bus_baud_rate):
+        return make_coordinator(
+            _SpacedClient(), **{CONF_FRAMER: framer, CONF_BUS_BAUD_RATE: bus_baud_rate, CONF_ENABLE_CONFIG: True}
+        )
+
+    automatic = _coordinator(FRAMER_RTU_OVER_TCP, 0)
+    automatic._apply_bus_timing()
+    assert automatic._client.baud_rate == 0
+    automatic._store.write([(spec, 2.0)], time.monotonic())
+    automatic._apply_bus_timing()
+    assert automatic._client.baud_rate == 9600
+
+    configured = _coordinator(FRAMER_RTU_OVER_TCP, 2400)
+    configured._store.write([(spec, 2.0)], time.monotonic())
+    configured._apply_bus_timing()
+    assert configured._client.baud_rate == 2400
+
+    tcp = _coordinator(FRAMER_TCP, 9600)
+    tcp._client.baud_rate = 9600
+    tcp._apply_bus_timing()
+    assert tcp._client.baud_rate == 0
+
+
+@pytest.mark.asyncio
+async def test_spacing_is_turned_off_when_no_baud_rate_is_left(make_coordinator):
+    spec = get_model_table(MODEL_SDM120M).by_key["baud_rate"]
+    coordinator = make_coordinator(_SpacedClient(), **{CONF_BUS_BAUD_RATE: 2400, CONF_ENABLE_CONFIG: True})
+    coordinator._store.write([(spec, 2.0)], time.monotonic())
+    coordinator._apply_bus_timing()
+    assert coordinator._client.baud_rate == 2400
+
+    # The register value is stale once config registers are no longer read.
+    coordinator.entry.options = {CONF_BUS_BAUD_RATE: 0, CONF_ENABLE_CONFIG: False}
+    coordinator.async_apply_options()
+
+    assert coordinator._client.baud_rate == 0
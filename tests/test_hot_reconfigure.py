@@ -0,0 +1,33 @@
+import pytest
+
+from custom_components.eastron_sdm.const import CONF_HOST, CONF_MODEL, CONF_NORMAL_DIVISOR, CONF_UNIT_ID, MODEL_SDM630M
+
+
+@pytest.fixture
+def reconfigured(make_coordinator):
+    def _reconfigure(options):
+        coordinator = make_coordinator()
+        coordinator.entry.options = options
+        return coordinator
+
+    return _reconfigure
+
+
+@pytest.mark.asyncio
+async def test_polling_options_are_applied_without_a_reload(reconfigured):
+    assert not reconfigured({CONF_NORMAL_DIVISOR: 5}).needs_reload()
+
+
+@pytest.mark.asyncio
+async def test_connection_and_model_changes_reload(reconfigured):
+    assert reconfigured({CONF_HOST: "10.0.0.6"}).needs_reload()
+    assert reconfigured({CONF_MODEL: MODEL_SDM630M}).needs_reload()
+
+
+@pytest.mark.asyncio
+async def test_unit_id_written_through_meter_id_does_not_reload(reconfigured):
+    coordinator = reconfigured({CONF_UNIT_ID: 7})
+    assert coordinator.needs_reload()
+
+    coordinator.unit_id = 7
+    assert not coordinator.needs_reload()
@@ -0,0 +1,53 @@
+import pytest
+
+from custom_components.eastron_sdm.const import MODEL_SDM120M
+from custom_components.eastron_sdm.models import get_spec_by_key
+from custom_components.eastron_sdm.store import ValueStore
+
+
+def test_store_reports_first_reads_and_changes_only():
+    store = ValueStore(MODEL_SDM120M)
+    voltage = get_spec_by_key(MODEL_SDM120M, "voltage")
+    current = get_spec_by_key(MODEL_SDM120M, "current")
+
+    store.write([(voltage, 230.0), (current, None)], stamp=1.0)
+    assert store.take_changed() == {"voltage", "current"}
+
+    store.write([(voltage, 230.0), (current, None)], stamp=2.0)
+    assert store.take_changed() == set()
+
+    store.write([(voltage, 231.0), (current, None)], stamp=3.0)
+    assert store.take_changed() == {"voltage"}
+
+
+def _coordinator_with_listeners(make_coordinator, woken):
+    coordinator = make_coordinator()
+    for key in ["voltage", "current", None]:
+        coordinator.async_add_listener(lambda key=key: woken.append(key), key)
+    # Outside a poll cycle every listener is woken; start from a settled state.
+    coordinator.async_update_listeners()
+    woken.clear()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_only_entities_with_changed_keys_are_woken(make_coordinator):
+    woken = []
+    coordinator = _coordinator_with_listeners(make_coordinator, woken)
+
+    coordinator._changed_keys = {"voltage"}
+    coordinator.async_update_listeners()
+
+    assert woken == ["voltage", None]
+
+
+@pytest.mark.asyncio
+async def test_availability_changes_wake_every_entity(make_coordinator):
+    woken = []
+    coordinator = _coordinator_with_listeners(make_coordinator, woken)
+    coordinator.last_update_success = False
+
+    coordinator._changed_keys = set()
+    coordinator.async_update_listeners()
+
+    assert woken == ["voltage", "current", None]
@@ -1,6 +1,14 @@
+from dataclasses import replace
+
 from custom_components.eastron_sdm.models import get_model_specs
 from custom_components.eastron_sdm.models.base import RegisterSpec
-from custom_components.eastron_sdm.read_plan import ReadPlanOptions, build_read_plan, build_register_batches
+from custom_components.eastron_sdm.read_plan import (
+    ReadPlanCache,
+    ReadPlanOptions,
+    build_read_plan,
+    build_register_batches,
+    should_include_spec,
+)
 from custom_components.eastron_sdm.const import MODEL_SDM120M, MODEL_SDM630M
 
 
@@ -125,3 +133,62 @@ def test_register_batches_are_sorted_by_function_then_address_and_merge_only_con
         ("input", 0, 4, ["input_gap_start", "input_contiguous"]),
         ("input", 8, 3, ["input_gap_after", "input_overlap"]),
     ]
+
+
+def test_read_plan_cache_matches_uncached_plans_for_a_full_tier_period():
+    specs = get_model_specs(MODEL_SDM630M)
+    options = ReadPlanOptions(enable_advanced=True, normal_divisor=2, slow_divisor=5, coalesce_gaps=True)
+    cache = ReadPlanCache(specs, options)
+    period = options.normal_divisor * options.slow_divisor
+
+    for cycle in range(period):
+        due = [
+            spec
+            for spec in specs
+            if should_include_spec(spec, options)
+            and (
+                spec.tier == "fast"
+                or (spec.tier == "normal" and cycle % options.normal_divisor == 0)
+                or (spec.tier == "slow" and cycle % options.slow_divisor == 0)
+            )
+        ]
+        uncached = build_register_batches(due, options.cost_model, options.max_batch_length)
+        cached = cache.plan_for(cycle)
+        assert [(b.function, b.start, b.length, _keys(b.specs)) for b in cached.batches] == [
+            (b.function, b.start, b.length, _keys(b.specs)) for b in uncached
+        ]
+        assert cached.next_cycle == (cycle + 1) % period
+        assert cached.saved_transactions == sum(batch.bridged for batch in uncached)
+
+    assert cache.plan_for(1).batches is cache.plan_for(3).batches
+
+
+def test_levelled_tiers_spread_slow_batches_but_read_each_once_per_period():
+    specs = get_model_specs(MODEL_SDM630M)
+    options = ReadPlanOptions(
+        enable_advanced=True,
+        enable_diagnostic=True,
+        enable_two_way=True,
+        normal_divisor=3,
+        slow_divisor=6,
+        level_tiers=True,
+    )
+    cache = ReadPlanCache(specs, options)
+    period = options.normal_divisor * options.slow_divisor
+    slow_keys = {spec.key for spec in specs if spec.tier == "slow" and spec.function == "input"}
+
+    reads: dict[str, int] = {}
+    batches_per_cycle = []
+    for cycle in range(period):
+        plan = cache.plan_for(cycle)
+        batches_per_cycle.append(len(plan.batches))
+        for batch in plan.batches:
+            for spec in batch.specs:
+                reads[spec.key] = reads.get(spec.key, 0) + 1
+
+    for key in slow_keys:
+        assert reads[key] == period // options.slow_divisor
+    assert reads["frequency"] == period // options.normal_divisor
+    unlevelled = ReadPlanCache(specs, replace(options, level_tiers=False))
+    assert max(batches_per_cycle) < len(unlevelled.plan_for(0).batches)
+    assert {spec.key for batch in cache.full_plan().batches for spec in batch.specs} >= slow_keys
@@ -0,0 +1,25 @@
+import pytest
+
+from custom_components.eastron_sdm.const import MODEL_SDM120M, MODEL_SDM630M
+from custom_components.eastron_sdm.models import get_model_specs, get_model_table, get_spec_by_key
+
+
+def test_model_table_is_built_once_and_shared():
+    assert get_model_table(MODEL_SDM630M) is get_model_table(MODEL_SDM630M)
+    assert get_model_specs(MODEL_SDM630M) is get_model_table(MODEL_SDM630M).specs
+    assert get_model_table("unknown") is get_model_table(MODEL_SDM120M)
+
+
+def test_indexes_cover_every_spec():
+    table = get_model_table(MODEL_SDM630M)
+
+    for spec in table.specs:
+        assert table.by_key[spec.key] is spec
+        assert table.by_address[(spec.function, spec.address)] is spec
+        assert spec in table.by_category[spec.category]
+        assert spec in table.by_tier[spec.tier]
+    assert get_spec_by_key(MODEL_SDM630M, "voltage_l1") is table.by_key["voltage_l1"]
+    with pytest.raises(TypeError):
+        table.by_key["voltage_l1"] = None  # type: ignore[index]
+    with pytest.raises(ValueError):
+        get_spec_by_key(MODEL_SDM630M, "voltage")
@@ -0,0 +1,138 @@
+import asyncio
+import struct
+
+import pytest
+
+from custom_components.eastron_sdm.client import ModbusExceptionResponseError, SdmModbusClient
+from custom_components.eastron_sdm.const import FRAMER_TCP
+from custom_components.eastron_sdm.transport import MbapTransport
+
+
+async def _start_gateway(in_flight_log):
+    """Modbus TCP server answering each read after a delay, newest request first."""
+    in_flight = 0
+
+    async def handle(reader, writer):
+        nonlocal in_flight
+
+        async def answer(tid, unit, function, address, count):
+            nonlocal in_flight
+            await asyncio.sleep(0.05 / (address + 1))
+            if address == 999:
+                pdu = struct.pack(">BB", function | 0x80, 0x02)
+            else:
+                pdu = struct.pack(f">BB{count}H", function, count * 2, *(address + i for i in range(count)))
+            writer.write(struct.pack(">HHHB", tid, 0, len(pdu) + 1, unit) + pdu)
+            in_flight -= 1
+
+        while True:
+            try:
+                frame = await reader.readexactly(12)
+            except asyncio.IncompleteReadError:
+                break
+            tid, _proto, _length, unit, function, address, count = struct.unpack(">HHHBBHH", frame)
+            in_flight += 1
+            in_flight_log.append(in_flight)
+            asyncio.create_task(answer(tid, unit, function, address, count))
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_reads_overlap_and_match_by_transaction_id():
+    in_flight_log: list[int] = []
+    server, port = await _start_gateway(in_flight_log)
+    client = SdmModbusClient("127.0.0.1", port, 1, framer=FRAMER_TCP, pipeline_window=4)
+    try:
+        results = await asyncio.gather(*(client.read_input_registers(address, 2) for address in range(6)))
+    finally:
+        await client.close()
+        server.close()
+
+    assert client.pipelined
+    assert [result.registers for result in results] == [[address, address + 1] for address in range(6)]
+    assert max(in_flight_log) == 4
+
+
+@pytest.mark.asyncio
+async def test_pipelined_exception_responses_keep_their_code():
+    server, port = await _start_gateway([])
+    client = SdmModbusClient("127.0.0.1", port, 1, framer=FRAMER_TCP, pipeline_window=2)
+    try:
+        with pytest.raises(ModbusExceptionResponseError) as err:
+            await client.read_holding_registers(999, 2)
+    finally:
+        await client.close()
+        server.close()
+
+    assert err.value.exception_code == 0x02
+
+
+def test_rtu_over_tcp_is_never_pipelined():
+    assert not SdmModbusClient("192.0.2.1", 502, 1, pipeline_window=4).pipelined
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_window_slot_is_not_counted_as_round_trip():
+    server, port = await _start_gateway([])
+    client = SdmModbusClient("127.0.0.1", port, 1, framer=FRAMER_TCP, pipeline_window=2)
+    try:
+        await asyncio.gather(*(client.read_input_registers(0, 2) for _ in range(6)))
+    finally:
+        await client.close()
+        server.close()
+
+    # Each answer takes 50 ms; the last two requests queued for two of them.
+    assert client.rtt.samples == 6
+    assert client.rtt.srtt < 0.075
+
+
+@pytest.mark.asyncio
+async def test_malformed_mbap_length_fails_the_request_and_reconnects():
+    connections = 0
+
+    async def handle(reader, writer):
+        nonlocal connections
+        connections += 1
+        frame = await reader.readexactly(12)
+        tid, _proto, _length, unit, function, _address, count = struct.unpack(">HHHBBHH", frame)
+        if connections == 1:
+            writer.write(struct.pack(">HHHB", tid, 0, 0, unit))
+        else:
+            pdu = struct.pack(f">BB{count}H", function, count * 2, *range(count))
+            writer.write(struct.pack(">HHHB", tid, 0, len(pdu) + 1, unit) + pdu)
+        await writer.drain()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = SdmModbusClient("127.0.0.1", port, 1, framer=FRAMER_TCP, pipeline_window=2)
+    try:
+        with pytest.raises(ConnectionError, match="invalid MBAP length 0"):
+            await client.read_input_registers(0, 2)
+        result = await client.read_input_registers(0, 2)
+    finally:
+        await client.close()
+        server.close()
+
+    assert result.registers == [0, 1]
+    assert connections == 2
+
+
+@pytest.mark.asyncio
+async def test_requests_queued_for_a_window_slot_fail_as_connection_errors_on_close():
+    async def handle(reader, writer):
+        await reader.read()  # never answers
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    transport = MbapTransport("127.0.0.1", server.sockets[0].getsockname()[1], timeout=5.0, window=1)
+    try:
+        first = asyncio.create_task(transport.read_registers(1, 0x04, 0, 2))
+        queued = asyncio.create_task(transport.read_registers(1, 0x04, 2, 2))
+        await asyncio.sleep(0.05)
+        await transport.close()
+        results = await asyncio.gather(first, queued, return_exceptions=True)
+    finally:
+        server.close()
+
+    assert [type(result) for result in results] == [ConnectionError, ConnectionError]
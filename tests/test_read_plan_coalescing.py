@@ -0,0 +1,76 @@
+from custom_components.eastron_sdm.const import MODEL_SDM630M
+from custom_components.eastron_sdm.models import get_model_specs
+from custom_components.eastron_sdm.models.base import RegisterSpec
+from custom_components.eastron_sdm.read_plan import (
+    ReadPlanOptions,
+    TransactionCostModel,
+    build_read_plan,
+    build_register_batches,
+)
+
+
+def _spec(key, address, length=2, function="input"):
+    return RegisterSpec(key, address, length, function, "float32", None, None, None, "basic", "slow", True)
+
+
+def _slow_tier_specs():
+    return [spec for spec in get_model_specs(MODEL_SDM630M) if spec.tier == "slow" and spec.function == "input"]
+
+
+def test_gaps_are_bridged_only_when_padding_is_cheaper_than_a_request():
+    specs = [_spec("a", 0), _spec("b", 10), _spec("c", 100)]
+    cost = TransactionCostModel(request_ms=60.0, register_ms=2.0)
+
+    batches = build_register_batches(specs, cost)
+
+    assert [(batch.start, batch.length, batch.padding, batch.bridged) for batch in batches] == [
+        (0, 12, 8, 1),
+        (100, 2, 0, 0),
+    ]
+
+
+def test_gaps_are_never_bridged_across_functions():
+    specs = [_spec("a", 0), _spec("b", 4, function="holding")]
+
+    batches = build_register_batches(specs, TransactionCostModel())
+
+    assert [(batch.function, batch.start, batch.length) for batch in batches] == [
+        ("holding", 4, 2),
+        ("input", 0, 2),
+    ]
+
+
+def test_sdm630_slow_tier_coalescing_saves_transactions():
+    contiguous = build_register_batches(_slow_tier_specs())
+    coalesced = build_register_batches(_slow_tier_specs(), TransactionCostModel())
+
+    assert [(batch.start, batch.length) for batch in contiguous] == [
+        (72, 10),
+        (84, 4),
+        (100, 2),
+        (104, 4),
+        (224, 2),
+        (342, 22),
+    ]
+    assert [(batch.start, batch.length) for batch in coalesced] == [(72, 36), (224, 2), (342, 22)]
+    assert sum(batch.bridged for batch in coalesced) == len(contiguous) - len(coalesced)
+
+
+def test_read_plan_reports_saved_transactions_only_when_coalescing_is_enabled():
+    options = ReadPlanOptions(enable_advanced=True, enable_diagnostic=True, enable_two_way=True)
+
+    plain = build_read_plan(get_model_specs(MODEL_SDM630M), options, cycle=0)
+    coalesced = build_read_plan(
+        get_model_specs(MODEL_SDM630M),
+        ReadPlanOptions(
+            enable_advanced=True,
+            enable_diagnostic=True,
+            enable_two_way=True,
+            coalesce_gaps=True,
+        ),
+        cycle=0,
+    )
+
+    assert plain.saved_transactions == 0
+    assert coalesced.saved_transactions == len(plain.batches) - len(coalesced.batches)
+    assert coalesced.saved_transactions > 0
@@ -0,0 +1,41 @@
+from custom_components.eastron_sdm.models.base import RegisterSpec
+from custom_components.eastron_sdm.read_plan import (
+    ReadPlanOptions,
+    TransactionCostModel,
+    build_read_plan,
+    build_register_batches,
+    prune_batches,
+)
+
+
+def _spec(key, address, length=2, function="input"):
+    return RegisterSpec(key, address, length, function, "float32", None, None, None, "basic", "slow", True)
+
+
+def test_disabled_registers_at_batch_edges_are_trimmed():
+    specs = [_spec("a", 0), _spec("b", 2), _spec("c", 10), _spec("d", 12)]
+    batches = build_register_batches(specs, TransactionCostModel())
+
+    pruned = prune_batches(batches, frozenset({"a", "d"}))
+
+    assert [(batch.start, batch.length, batch.padding, batch.bridged) for batch in pruned] == [(2, 10, 6, 1)]
+    assert [spec.key for spec in pruned[0].specs] == ["b", "c"]
+
+
+def test_disabled_registers_inside_a_batch_are_still_read():
+    specs = [_spec("a", 0), _spec("b", 2), _spec("c", 4)]
+    batches = build_register_batches(specs, TransactionCostModel())
+
+    pruned = prune_batches(batches, frozenset({"b"}))
+
+    assert [(batch.start, batch.length) for batch in pruned] == [(0, 6)]
+    assert [spec.key for spec in pruned[0].specs] == ["a", "b", "c"]
+
+
+def test_batches_of_only_disabled_registers_are_dropped():
+    specs = [_spec("a", 0), _spec("b", 100)]
+    options = ReadPlanOptions(coalesce_gaps=True, excluded_keys=frozenset({"b"}))
+
+    plan = build_read_plan(specs, options, 0)
+
+    assert [(batch.start, batch.length) for batch in plan.batches] == [(0, 2)]
@@ -0,0 +1,116 @@
+import asyncio
+import struct
+
+import pytest
+
+from custom_components.eastron_sdm.client import RttEstimator, SdmModbusClient
+from custom_components.eastron_sdm.const import FRAMER_TCP
+from custom_components.eastron_sdm.transport import crc16
+
+
+def _frame(body: bytes) -> bytes:
+    return body + crc16(body).to_bytes(2, "little")
+
+
+def test_timeout_follows_smoothed_rtt_and_scales_with_length():
+    rtt = RttEstimator(0.05, 5.0)
+    assert rtt.timeout(2) == 5.0  # no sample yet
+
+    for _ in range(20):
+        rtt.observe(0.1, 2)
+
+    assert rtt.srtt == pytest.approx(0.1)
+    short, long = rtt.timeout(2), rtt.timeout(120)
+    assert 0.1 <= short < 0.5
+    assert long > short * 2
+    assert rtt.timeout(40) == short
+
+
+def test_timeouts_back_off_until_the_next_sample():
+    rtt = RttEstimator(0.05, 5.0)
+    rtt.observe(0.1, 2)
+    base = rtt.timeout(2)
+
+    rtt.timed_out()
+    assert rtt.timeout(2) == pytest.approx(base * 2)
+    for _ in range(10):
+        rtt.timed_out()
+    assert rtt.timeout(2) == 5.0
+
+    rtt.observe(0.1, 2)
+    assert rtt.timeout(2) < 5.0
+    assert rtt.as_dict()["timeouts"] == 11
+
+
+@pytest.mark.asyncio
+async def test_lost_response_is_retried_fast_instead_of_waiting_for_the_full_timeout():
+    requests = 0
+
+    async def handle(reader, writer):
+        nonlocal requests
+        while True:
+            try:
+                request = await reader.readexactly(8)
+            except asyncio.IncompleteReadError:
+                break
+            requests += 1
+            if requests == 4:
+                continue  # lose this frame
+            unit, function, address, count = struct.unpack(">BBHH", request[:6])
+            writer.write(_frame(struct.pack(f">BBB{count}H", unit, function, count * 2, *range(count))))
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = SdmModbusClient("127.0.0.1", port, 1, timeout=5.0, native_codec=True)
+    try:
+        for _ in range(3):
+            await client.read_input_registers(0, 2)
+        started = asyncio.get_running_loop().time()
+        result = await client.read_input_registers(0, 2)
+        elapsed = asyncio.get_running_loop().time() - started
+    finally:
+        await client.close()
+        server.close()
+
+    assert result.registers == [0, 1]
+    assert requests == 5
+    assert elapsed < 2.0
+    assert client.rtt.timeouts == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_retry_over_modbus_tcp_keeps_the_connection():
+    requests = connections = 0
+
+    async def handle(reader, writer):
+        nonlocal requests, connections
+        connections += 1
+        while True:
+            try:
+                request = await reader.readexactly(12)
+            except asyncio.IncompleteReadError:
+                break
+            requests += 1
+            if requests == 4:
+                continue  # lose this frame
+            tid, _proto, _length, unit, function, _address, count = struct.unpack(">HHHBBHH", request)
+            pdu = struct.pack(f">BB{count}H", function, count * 2, *range(count))
+            writer.write(struct.pack(">HHHB", tid, 0, len(pdu) + 1, unit) + pdu)
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = SdmModbusClient("127.0.0.1", port, 1, timeout=5.0, framer=FRAMER_TCP)
+    try:
+        for _ in range(3):
+            await client.read_input_registers(0, 2)
+        started = asyncio.get_running_loop().time()
+        result = await client.read_input_registers(0, 2)
+        elapsed = asyncio.get_running_loop().time() - started
+    finally:
+        await client.close()
+        server.close()
+
+    assert result.registers == [0, 1]
+    assert requests == 5
+    assert elapsed < 2.0
+    assert connections == 1
@@ -0,0 +1,90 @@
+import asyncio
+import struct
+
+import pytest
+
+from custom_components.eastron_sdm.client import ModbusExceptionResponseError, SdmModbusClient
+from custom_components.eastron_sdm.transport import RtuOverTcpTransport, crc16
+
+
+def _frame(body: bytes) -> bytes:
+    return body + crc16(body).to_bytes(2, "little")
+
+
+async def _start_rtu_gateway(corrupt_crc=False):
+    """RTU-over-TCP server answering reads with each register holding its address."""
+
+    async def handle(reader, writer):
+        while True:
+            try:
+                request = await reader.readexactly(8)
+            except asyncio.IncompleteReadError:
+                break
+            assert crc16(request[:-2]) == int.from_bytes(request[-2:], "little")
+            unit, function, address, count = struct.unpack(">BBHH", request[:6])
+            if address == 999:
+                response = _frame(struct.pack(">BBB", unit, function | 0x80, 0x02))
+            else:
+                values = (address + i for i in range(count))
+                response = _frame(struct.pack(f">BBB{count}H", unit, function, count * 2, *values))
+            if corrupt_crc:
+                response = response[:-1] + bytes([response[-1] ^ 0xFF])
+            # Split the frame to exercise reassembly in the receive buffer.
+            writer.write(response[:3])
+            await writer.drain()
+            writer.write(response[3:])
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def test_crc16_matches_the_modbus_reference_frame():
+    assert _frame(bytes.fromhex("010400000002")) == bytes.fromhex("01040000000271cb")
+
+
+@pytest.mark.asyncio
+async def test_native_codec_reads_raw_payload_and_exception_codes():
+    server, port = await _start_rtu_gateway()
+    client = SdmModbusClient("127.0.0.1", port, 7, native_codec=True)
+    try:
+        result = await client.read_input_registers(10, 3)
+        with pytest.raises(ModbusExceptionResponseError) as err:
+            await client.read_holding_registers(999, 2)
+    finally:
+        await client.close()
+        server.close()
+
+    assert result.payload == struct.pack(">3H", 10, 11, 12)
+    assert result.registers == [10, 11, 12]
+    assert err.value.exception_code == 0x02
+
+
+@pytest.mark.asyncio
+async def test_native_codec_rejects_corrupted_frames():
+    server, port = await _start_rtu_gateway(corrupt_crc=True)
+    client = SdmModbusClient("127.0.0.1", port, 1, native_codec=True)
+    try:
+        with pytest.raises(ConnectionError):
+            await client.read_input_registers(0, 2)
+    finally:
+        await client.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_native_codec_rejects_a_stray_frame_for_another_function():
+    async def handle(reader, writer):
+        request = await reader.readexactly(8)
+        # A late write echo that happens to look like a 4 byte read answer.
+        writer.write(_frame(struct.pack(">BBHH", request[0], 0x06, 0x0400, 0x1234)))
+        await reader.read()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    transport = RtuOverTcpTransport("127.0.0.1", server.sockets[0].getsockname()[1], timeout=5.0)
+    try:
+        with pytest.raises(ConnectionError, match="function 0x06"):
+            await transport.read_registers(1, 0x04, 0, 2)
+        assert not transport.connected
+    finally:
+        await transport.close()
+        server.close()
@@ -0,0 +1,37 @@
+from custom_components.eastron_sdm.const import MODEL_SDM630M
+from custom_components.eastron_sdm.models import get_model_specs, get_spec_by_key
+from custom_components.eastron_sdm.sampling import HighRateSampler, RingBuffer, default_sampled_keys
+
+
+def test_ring_buffer_keeps_the_newest_samples_in_order():
+    buffer = RingBuffer(3)
+    for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+        buffer.append(value)
+
+    assert buffer.samples() == [3.0, 4.0, 5.0]
+
+
+def test_windows_publish_min_max_mean_last_and_start_empty():
+    power = get_spec_by_key(MODEL_SDM630M, "active_power_l1")
+    sampler = HighRateSampler([power], interval=1.0, window=10)
+
+    for value in (100.0, 900.0, 200.0, None, 300.0):
+        sampler.add([(power, value)])
+
+    assert sampler.close_window() == {"active_power_l1"}
+    aggregate = sampler.aggregates["active_power_l1"]
+    assert (aggregate.min, aggregate.max, aggregate.mean, aggregate.last, aggregate.samples) == (
+        100.0,
+        900.0,
+        375.0,
+        300.0,
+        4,
+    )
+    assert sampler.close_window() == set()
+
+
+def test_default_sampling_covers_fast_power_and_current_registers():
+    keys = default_sampled_keys(get_model_specs(MODEL_SDM630M))
+
+    assert {"current_l1", "current_l2", "current_l3", "active_power_l1"} <= set(keys)
+    assert "voltage_l1" not in keys
@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.exceptions import ConfigEntryNotReady
+
+import custom_components.eastron_sdm as integration
+from custom_components.eastron_sdm.const import CONF_MODEL, DOMAIN, MODEL_SDM120M
+
+
+class _OfflineCoordinator:
+    def __init__(self, hass, entry):
+        self.host, self.port = "192.0.2.1", 502
+        self.closed = 0
+
+    async def async_warm_start(self):
+        return False
+
+    async def async_config_entry_first_refresh(self):
+        raise ConfigEntryNotReady("gateway offline")
+
+    async def async_ensure_serial_number(self):
+        return None
+
+    async def async_close(self):
+        self.closed += 1
+
+
+@pytest.mark.asyncio
+async def test_failed_setup_releases_the_shared_client_and_schedule(monkeypatch):
+    created = []
+
+    def _coordinator(hass, entry):
+        created.append(_OfflineCoordinator(hass, entry))
+        return created[-1]
+
+    monkeypatch.setattr(integration, "SdmCoordinator", _coordinator)
+    hass = MagicMock()
+    hass.data = {}
+    entry = MagicMock(entry_id="e1", data={CONF_MODEL: MODEL_SDM120M}, options={CONF_MODEL: MODEL_SDM120M})
+    entry.disabled_by = None
+    hass.config_entries.async_entries.return_value = [entry]
+
+    for _attempt in range(2):
+        with pytest.raises(ConfigEntryNotReady):
+            await integration.async_setup_entry(hass, entry)
+
+    assert [coordinator.closed for coordinator in created] == [1, 1]
+    assert "e1" not in hass.data[DOMAIN]
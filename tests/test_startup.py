@@ -0,0 +1,89 @@
+import asyncio
+from collections import Counter
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CoreState
+
+from custom_components.eastron_sdm.const import CONF_STARTUP_CONCURRENCY, DOMAIN
+from custom_components.eastron_sdm.startup import (
+    DATA_SETUP_TIME,
+    DATA_STARTUP,
+    StartupOrchestrator,
+    async_get_orchestrator,
+)
+
+
+@pytest.mark.asyncio
+async def test_gateways_start_in_parallel_up_to_the_cap_and_meters_on_one_gateway_queue():
+    entries = {f"entry{index}": ("gw" + str(index % 3), 502) for index in range(9)}
+    orchestrator = StartupOrchestrator(2, set(entries))
+    active: Counter[str] = Counter()
+    peak_total = 0
+    peak_per_gateway = 0
+
+    async def setup(entry_id, host, port):
+        nonlocal peak_total, peak_per_gateway
+        try:
+            async with orchestrator.async_initial_read(host, port):
+                active[host] += 1
+                peak_total = max(peak_total, sum(active.values()))
+                peak_per_gateway = max(peak_per_gateway, active[host])
+                await asyncio.sleep(0.01)
+                active[host] -= 1
+        finally:
+            orchestrator.async_entry_done(entry_id)
+
+    await asyncio.gather(*(setup(entry_id, *gateway) for entry_id, gateway in entries.items()))
+
+    assert peak_total == 2
+    assert peak_per_gateway == 1
+    assert orchestrator.setup_time is not None and orchestrator.setup_time >= 0.04
+
+
+def _entry(entry_id, concurrency=None, state=ConfigEntryState.NOT_LOADED):
+    options = {} if concurrency is None else {CONF_STARTUP_CONCURRENCY: concurrency}
+    return MagicMock(entry_id=entry_id, data={}, options=options, disabled_by=None, state=state)
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_takes_the_lowest_cap_and_is_dropped_once_every_entry_is_done(hass):
+    entries = [
+        _entry("a", 8),
+        _entry("b", 2, ConfigEntryState.SETUP_IN_PROGRESS),
+        _entry("c"),
+        _entry("loaded", 1, ConfigEntryState.LOADED),
+        _entry("failed", 1, ConfigEntryState.SETUP_ERROR),
+    ]
+    hass.config_entries.async_entries.return_value = entries
+
+    orchestrator = async_get_orchestrator(hass)
+    assert orchestrator.concurrency == 2
+    assert async_get_orchestrator(hass) is orchestrator
+
+    for entry_id in ("a", "b"):
+        orchestrator.async_entry_done(entry_id)
+    assert hass.data[DOMAIN][DATA_STARTUP] is orchestrator
+    orchestrator.async_entry_done("c")
+    assert DATA_STARTUP not in hass.data[DOMAIN]
+    assert hass.data[DOMAIN][DATA_SETUP_TIME] == orchestrator.setup_time is not None
+
+    assert async_get_orchestrator(hass) is not orchestrator
+
+
+@pytest.mark.asyncio
+async def test_once_running_only_entries_setting_up_now_are_waited_for(hass):
+    hass.set_state(CoreState.running)
+    hass.config_entries.async_entries.return_value = [
+        _entry("reloading", 3, ConfigEntryState.SETUP_IN_PROGRESS),
+        _entry("unloaded", 1),
+        _entry("retrying", 1, ConfigEntryState.SETUP_RETRY),
+    ]
+
+    orchestrator = async_get_orchestrator(hass)
+    assert orchestrator.concurrency == 3
+
+    orchestrator.async_entry_done("reloading")
+    assert orchestrator.setup_time is not None
+    assert DATA_STARTUP not in hass.data[DOMAIN]
@@ -0,0 +1,43 @@
+from custom_components.eastron_sdm.const import MODEL_SDM120M
+from custom_components.eastron_sdm.models import get_spec_by_key
+from custom_components.eastron_sdm.store import ValueStore
+
+
+def test_store_exposes_only_read_slots_through_a_mapping_view():
+    store = ValueStore(MODEL_SDM120M)
+    view = store.view
+    voltage = get_spec_by_key(MODEL_SDM120M, "voltage")
+    serial = get_spec_by_key(MODEL_SDM120M, "serial_number")
+
+    assert not view and "voltage" not in view
+
+    store.write([(voltage, 231.5), (serial, 12345678)], stamp=100.0)
+
+    assert len(view) == 2
+    assert set(view) == {"voltage", "serial_number"}
+    assert view["voltage"].value == 231.5
+    assert view["serial_number"].value == 12345678
+    assert isinstance(view["serial_number"].value, int)
+    assert view.get("current") is None
+
+
+def test_failed_decodes_are_present_with_no_value():
+    store = ValueStore(MODEL_SDM120M)
+    voltage = get_spec_by_key(MODEL_SDM120M, "voltage")
+
+    store.write([(voltage, None)], stamp=5.0)
+
+    assert "voltage" in store.view
+    assert store.view["voltage"].value is None
+    assert store.timestamps[store.index["voltage"]] == 5.0
+
+
+def test_view_length_counts_each_slot_once_across_writes_and_restores():
+    store = ValueStore(MODEL_SDM120M)
+    voltage = get_spec_by_key(MODEL_SDM120M, "voltage")
+
+    store.restore({"voltage": 230.0, "current": 1.5}, stamp=1.0)
+    store.write([(voltage, 231.0)], stamp=2.0)
+    store.write([(voltage, None)], stamp=3.0)
+
+    assert len(store.view) == 2 == len(list(store.view))
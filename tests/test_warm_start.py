@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.eastron_sdm.adaptive import AdaptiveCadence
+from custom_components.eastron_sdm.client import ReadResult
+from custom_components.eastron_sdm.const import MODEL_SDM120M
+from custom_components.eastron_sdm.models import get_spec_by_key
+from custom_components.eastron_sdm.store import ValueStore
+from custom_components.eastron_sdm.warm_start import WarmStartState
+
+
+def test_state_round_trips_and_rejects_incomplete_data():
+    state = WarmStartState(
+        host="10.0.0.5",
+        unit_id=2,
+        model=MODEL_SDM120M,
+        serial="12345678",
+        saved_at=1700000000.0,
+        values={"voltage": 231.5},
+        max_read_length=40,
+        cadences={"voltage": 20.0},
+    )
+
+    assert WarmStartState.from_dict(state.as_dict()) == state
+    assert WarmStartState.from_dict({"host": "10.0.0.5"}) is None
+
+
+def test_restored_values_are_published_without_counting_as_changes():
+    store = ValueStore(MODEL_SDM120M)
+    voltage = get_spec_by_key(MODEL_SDM120M, "voltage")
+
+    store.restore({"voltage": 231.5, "serial_number": 12345678, "retired_key": 1.0}, stamp=50.0)
+
+    assert store.snapshot() == {"voltage": 231.5, "serial_number": 12345678}
+    assert store.take_changed() == set()
+    store.write([(voltage, 231.5)], stamp=60.0)
+    assert store.take_changed() == set()
+
+
+def test_restored_cadence_survives_the_first_read():
+    adaptive = AdaptiveCadence(5.0, 300.0)
+    adaptive.restore({"voltage": 80.0})
+
+    assert adaptive.observe("voltage", 230.0, 10.0) == 80.0
+    assert adaptive.observe("voltage", 230.0, 10.0) == 120.0
+
+
+class _MeterClient:
+    def __init__(self, serial, offline=False):
+        self.serial = serial
+        self.offline = offline
+        self.reads = 0
+
+    async def read_holding_registers(self, address, count):
+        self.reads += 1
+        if self.offline:
+            raise ConnectionError("no answer")
+        return ReadResult(address, count, registers=[self.serial >> 16, self.serial & 0xFFFF])
+
+
+class _WarmStore:
+    removed = False
+
+    async def async_remove(self):
+        self.removed = True
+
+
+@pytest.fixture
+def warm_coordinator(make_coordinator):
+    def _warm(meter_serial):
+        coordinator = make_coordinator(_MeterClient(meter_serial))
+        coordinator._warm_store = _WarmStore()
+        coordinator.serial_identifier = "12345678"
+        coordinator.async_refresh = AsyncMock()
+        return coordinator
+
+    return _warm
+
+
+@pytest.mark.asyncio
+async def test_confirmed_serial_resumes_persisting(warm_coordinator):
+    coordinator = warm_coordinator(12345678)
+
+    await coordinator.async_confirm_warm_start()
+
+    assert coordinator.serial_verified
+    assert not coordinator._warm_store.removed
+    coordinator.hass.config_entries.async_schedule_reload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_replaced_meter_drops_the_warm_state_and_reloads(warm_coordinator):
+    coordinator = warm_coordinator(87654321)
+
+    await coordinator.async_confirm_warm_start()
+
+    assert not coordinator.serial_verified
+    assert coordinator._warm_store.removed
+    coordinator.hass.config_entries.async_schedule_reload.assert_called_once_with(coordinator.entry.entry_id)
+
+
+@pytest.mark.asyncio
+async def test_offline_meter_is_only_asked_again_after_a_successful_poll(warm_coordinator, caplog):
+    coordinator = warm_coordinator(12345678)
+    client = coordinator._client
+    client.offline = True
+    coordinator.last_update_success = False
+
+    async def poll(success):
+        coordinator.last_update_success = success
+        coordinator.async_update_listeners()
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+    with caplog.at_level(logging.DEBUG):
+        confirm = asyncio.create_task(coordinator.async_confirm_warm_start())
+        await poll(False)
+        assert client.reads == 0
+
+        await poll(True)
+        await poll(True)
+        assert client.reads == 2
+
+        client.offline = False
+        await poll(True)
+        await confirm
+
+    assert coordinator.serial_verified
+    assert [record.levelname for record in caplog.records if "serial_number" in record.getMessage()] == [
+        "WARNING",
+        "DEBUG",
+    ]